@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+import script
+
+class TestDay14(unittest.TestCase):
+
+    file_path = '2023/day14/input.txt'
+
+    example = ['O....#....',
+               'O.OO#....#',
+               '.....##...',
+               'OO.#O....O',
+               '.O.....O#.',
+               'O.#..O.#.#',
+               '..O..#O..O',
+               '.......O..',
+               '#....###..',
+               '#OO..#....']
+
+    def setUp(self):
+        fd, self.example_path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as file:
+            file.write('\n'.join(self.example))
+
+    def tearDown(self):
+        os.remove(self.example_path)
+
+    def test_task1_with_example_data(self):
+        self.assertEqual(script.task_1(self.example_path), 136)
+
+    def test_task2_with_example_data(self):
+        self.assertEqual(script.task_2(self.example_path), 64)
+
+    def test_find_cycle_matches_direct_iteration(self):
+        step = lambda x: (x * x + 1) % 1009
+        mu, lam, values = script.find_cycle(step, 3, lambda x: x, key=lambda x: x)
+        seen, x = {}, 3
+        while x not in seen:
+            seen[x] = len(seen)
+            x = step(x)
+        self.assertEqual((mu, lam), (seen[x], len(seen) - seen[x]))
+        self.assertEqual(values[mu], values[mu + lam])
+        expected = [3]
+        while len(expected) < mu + lam + 1:
+            expected.append(step(expected[-1]))
+        self.assertEqual(values, expected)
+
+    def test_state_key_is_exact(self):
+        self.assertEqual(script.state_key([1, 2, 3]), script.state_key([1, 2, 3]))
+        self.assertNotEqual(script.state_key([1, 2, 3]), script.state_key([1, 2, 4]))
+
+    def test_part1_with_puzzle_input(self):
+        self.assertEqual(script.task_1(self.file_path), 113424)
+
+    def test_part2_with_puzzle_input(self):
+        self.assertEqual(script.task_2(self.file_path), 96003)
+
+if __name__ == '__main__':
+    unittest.main()
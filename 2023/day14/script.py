@@ -1,60 +1,133 @@
-# Транспонирование, сортировка, поворот имеют сложность O(N*M), где N - количество строк, M - количество столбов
-# Функция для транспонирования матрицы (меняет строки и столбцы местами).
-def transpose(matrix):
-    return list(map("".join, zip(*matrix)))
+from array import array
+import sys
+from pathlib import Path
 
-# Функция для поворота матрицы
-def rotate(reflector):
-    return tuple(row[::-1] for row in reflector)
+# Прямой запуск `python 2023/day14/script.py`: пакет aoc лежит в корне репозитория
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid, OUTSIDE
+
+WALL, ROUND = ord("#"), ord("O")
+NORTH, EAST, SOUTH, WEST = 0, 1, 2, 3  # Индексы направлений aoc.grid
+SPIN_ORDER = (NORTH, WEST, SOUTH, EAST)
+
+# Камни хранятся списком плоских индексов клеток, а сетка не меняется вовсе.
+# Для каждого направления заранее строятся отрезки между '#' (и краями): при наклоне
+# все камни отрезка скатываются к его началу, поэтому достаточно посчитать камни в каждом
+# отрезке и взять столько же первых клеток отрезка.
+# Построение отрезков - O(N*M), где N - количество строк, M - количество столбцов.
+def build_segments(grid, direction):
+    """Возвращает (segment_of, segments): номер отрезка для каждой клетки и клетки отрезков,
+    упорядоченные от края, к которому катятся камни."""
+    cells = grid.cells
+    offset = grid.offsets4[direction]
+    segment_of = [-1] * len(cells)
+    segments = []
+
+    for i in grid.positions():
+        if cells[i] == WALL:
+            continue
+        if cells[i + offset] != WALL and cells[i + offset] != OUTSIDE:
+            continue  # Не начало отрезка
+        segment = []
+        position = i
+        while cells[position] != WALL and cells[position] != OUTSIDE:
+            segment_of[position] = len(segments)
+            segment.append(position)
+            position -= offset
+        segments.append(segment)
+
+    return segment_of, segments
+
+# Наклон за O(R + S), где R - количество камней, S - количество отрезков.
+# Результат упорядочен по отрезкам, поэтому одинаковые наборы камней дают одинаковые списки.
+def tilt(rocks, segment_of, segments):
+    counts = [0] * len(segments)
+    for rock in rocks:
+        counts[segment_of[rock]] += 1
+
+    tilted = []
+    for segment, count in zip(segments, counts):
+        if count:
+            tilted += segment[:count]
+    return tilted
+
+def spin_cycle(rocks, tables):
+    for segment_of, segments in tables:
+        rocks = tilt(rocks, segment_of, segments)
+    return rocks
 
-# Функция для сортировки элементов в строках матрицы
-def sort(reflector):
-    return ['#'.join(''.join(sorted(group, reverse=True)) for group in row.split('#')) for row in transpose(reflector)]
+# Нагрузка: каждый камень весит столько, сколько рядов от него до южного края.
+def total_load(grid, rocks):
+    return sum(grid.height - grid.coords(rock)[0] for rock in rocks)
 
-# Функция повторяющяя поворот и сортировку
-def spin_cycle(reflector):
-    for _ in range(4):
-        reflector = rotate(sort(reflector))
-    return reflector
+# Компактный ключ состояния: индексы камней, упакованные в байты (4 байта на камень).
+# Ключи сравниваются целиком, поэтому коллизия хэшей не может дать ложный цикл.
+def state_key(rocks):
+    return array('I', rocks).tobytes()
+
+# Поиск цикла алгоритмом Брента: для сравнения держим только ключи двух состояний, а не все пройденные сетки.
+# Первая фаза находит длину цикла lam, вторая - его начало mu: черепаха стартует из start,
+# заяц - на lam шагов впереди, и оба идут по шагу, пока их состояния не совпадут.
+# Для каждого шага зайца во второй фазе запоминается лишь value(state) (нагрузка).
+# Возвращает (mu, lam, values): индекс первого состояния цикла, длину цикла
+# и значения для шагов 0..mu+lam.
+# O(mu + lam) применений step, O(mu + lam) памяти только под значения.
+def find_cycle(step, start, value, key=state_key):
+    # Фаза 1: длина цикла
+    power = lam = 1
+    tortoise_key = key(start)
+    hare = step(start)
+    hare_key = key(hare)
+    while tortoise_key != hare_key:
+        if power == lam:  # Начинаем новую степень двойки
+            tortoise_key = hare_key
+            power *= 2
+            lam = 0
+        hare = step(hare)
+        hare_key = key(hare)
+        lam += 1
+
+    # Фаза 2: начало цикла - первое состояние, совпадающее с состоянием через lam шагов
+    values = [value(start)]
+    hare = start
+    for _ in range(lam):
+        hare = step(hare)
+        values.append(value(hare))
+
+    mu = 0
+    tortoise = start
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        values.append(value(hare))
+        mu += 1
+    return mu, lam, values
+
+def read_rocks(file_path):
+    grid = Grid.from_file(file_path)
+    return grid, grid.find_all(ROUND)
 
 def task_1(file_path):
-    with open(file_path) as file:
-        reflector = [line.strip() for line in file]
-    
-    # Транспонируем матрицу.
-    # Сортирует символы в каждой группе, разделенной '#', в обратном порядке
-    # Транспонирует матрицу обратно
-    reflector = [''.join(row) for row in zip(*sort(reflector))]
-
-    # Подсчитывает количество символов 'O' в преобразованной матрице
-    # Каждая строка имеет вес, который увеличивается с увеличением индекса строки (снизу вверх).
-    # Количество 'O' в каждой строке умножается на её вес, и эти значения суммируются.
-    # O(N*M), где N - количество строк, M - количество 
-    return sum(row.count("O") * (i + 1) for i, row in enumerate(reversed(reflector)))
-
-def task_2(file_path):
-    with open(file_path) as file:
-        reflector = tuple(line.strip() for line in file)
-
-    # Словарь для отслеживания уже просмотренных сеток и список индексов
-    seen = {}
-    indexes = []
-
-    # Продолжаем повороты и сортировки пока не обнаружим повторяющуюся матрицу
-    while reflector not in seen:
-        seen[reflector] = len(indexes)
-        indexes.append(reflector)
-        reflector = spin_cycle(reflector)
-
-    # Находим индекс первого вхождения текущей сетки
-    first = seen[reflector]
-
-    # Вычисляем, сколько циклов нужно пропустить, чтобы достичь миллиарда повторений
-    # Находим конечную сетку после выполнения всех циклов
-    reflector = indexes[(1000000000 - first) % (len(indexes) - first) + first]
-        
-    # Подсчитывает количество символов 'O' в матрице
-    return sum((i + 1) * row.count('O') for i, row in enumerate(reversed(reflector)))
+    grid, rocks = read_rocks(file_path)
+    segment_of, segments = build_segments(grid, NORTH)
+    return total_load(grid, tilt(rocks, segment_of, segments))
+
+def task_2(file_path, cycles=1000000000):
+    grid, rocks = read_rocks(file_path)
+    tables = [build_segments(grid, direction) for direction in SPIN_ORDER]
+
+    def step(state):
+        return spin_cycle(state, tables)
+
+    def load(state):
+        return total_load(grid, state)
+
+    mu, lam, loads = find_cycle(step, rocks, load)
+    if cycles < len(loads):
+        return loads[cycles]
+    return loads[mu + (cycles - mu) % lam]
 
 # Main function
 def main():
@@ -63,4 +136,4 @@ def main():
     print('Part two:', task_2(file_path)) # 96003
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,86 +1,73 @@
-from collections import deque
-
-def add(row, col, dr, dc, visited, queue):
-    """Функция добавляет новые координаты в очередь для последующего посещения
-    и помечает их как посещенные. Принимает аргументы:
-
-    row: текущая строка
-    col: текущий столбец
-    dr: изменение в строке (delta row)
-    dc: изменение в столбце (delta column)
-    visited: множество посещенных координат
-    queue: очередь для обхода
-    """
-    
-    # Проверяем, были ли данные координаты посещены
-    if (row, col, dr, dc) not in visited:
-        visited.add((row, col, dr, dc))
-        queue.append((row, col, dr, dc)) # Добавляем координаты в очередь для последующего посещения
-
-# Функция для обхода сетки. Использует BFS для нахождения координат, 
-# которые можно достичь согласно определенным правилам, связанным с символами на сетке.
-# Возвращает множество посещенных координат.
-def calculate(grid, ir, ic, idr, idc):
-    queue = deque([(ir, ic, idr, idc)]) # Начальные координаты
-    visited = set() # Множество для отслеживания посещенных координат
-
-    while queue:
-        row, col, dr, dc = queue.popleft()
-
-        row += dr
-        col += dc
-
-        # Проверяем, находятся ли координаты в пределах сетки
-        if not (0 <= row < len(grid) and 0 <= col < len(grid[row])):
-            continue
-
-        char = grid[row][col] # Получаем символ по текущим координатам
-
-        # Проверяем символы и изменяем направление движения в зависимости от символов
-        if char == "." or (dc != 0 and ("|-" in char)):
-            add(row, col, dr, dc, visited, queue)
+import sys
+from pathlib import Path
 
-        elif char == "/":
-            dr, dc = -dc, -dr  # Поворачиваем налево
-            add(row, col, dr, dc, visited, queue)
+# Прямой запуск `python 2023/day16/script.py`: пакет aoc лежит в корне репозитория
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid, OUTSIDE
+
+# Направления: 0 - вверх, 1 - вправо, 2 - вниз, 3 - влево.
+# Для каждого символа - список новых направлений луча для каждого входящего направления.
+TRANSITIONS = [None] * 256
+TRANSITIONS[ord(".")] = ((0,), (1,), (2,), (3,))
+TRANSITIONS[ord("/")] = ((1,), (0,), (3,), (2,))    # Отражение: вверх <-> вправо, вниз <-> влево
+TRANSITIONS[ord("\\")] = ((3,), (2,), (1,), (0,))   # Отражение: вверх <-> влево, вниз <-> вправо
+TRANSITIONS[ord("|")] = ((0,), (0, 2), (2,), (0, 2))  # Горизонтальный луч раздваивается
+TRANSITIONS[ord("-")] = ((1, 3), (1,), (1, 3), (3,))  # Вертикальный луч раздваивается
+
+
+# Функция для обхода сетки. Использует DFS по состояниям (клетка, направление).
+# Посещённые направления хранятся битовой маской на клетку в плоском bytearray,
+# а выход за пределы сетки определяется по клетке-сторожу, без проверки границ.
+# Возвращает количество энергизированных клеток.
+def calculate(grid, start, direction):
+    """Обход луча из клетки start (обычно клетка рамки) в направлении direction.
+
+    grid: сетка aoc.grid.Grid
+    start: плоский индекс клетки, из которой входит луч
+    direction: направление луча (0..3)
+    """
+    cells = grid.cells
+    offsets = grid.offsets4
+    visited = bytearray(len(cells)) # Битовая маска направлений для каждой клетки
+    stack = [(start, direction)]
 
-        elif char == "\\":
-            dr, dc = dc, dr  # Поворачиваем направо
-            add(row, col, dr, dc, visited, queue)
+    while stack:
+        i, d = stack.pop()
+        i += offsets[d]
 
-        elif char == "|":
-            for dr, dc in ((1, 0), (-1, 0)):  # Движение вверх и вниз
-                add(row, col, dr, dc, visited, queue)
+        char = cells[i]
+        if char == OUTSIDE: # Луч покинул сетку
+            continue
 
-        elif char == "-":
-            for dr, dc in ((0, 1), (0, -1)):  # Движение вправо и влево
-                add(row, col, dr, dc, visited, queue)
+        for nd in TRANSITIONS[char][d]:
+            bit = 1 << nd
+            if not visited[i] & bit:
+                visited[i] |= bit
+                stack.append((i, nd))
 
-    # множество координат, которые были посещены
-    return len({(row, col) for row, col, _, _ in visited})
+    # Количество клеток, через которые прошёл хотя бы один луч
+    return len(visited) - visited.count(0)
 
 def task_1(file_path):
-    with open(file_path) as file:
-        grid = [line.strip() for line in file.readlines()]
-    
-    return calculate(grid, 0, -1, 0, 1)
+    grid = Grid.from_file(file_path)
+
+    return calculate(grid, grid.index(0, -1), 1)
 
 def task_2(file_path):
-    with open(file_path) as file:
-        grid = [line.strip() for line in file.readlines()]
+    grid = Grid.from_file(file_path)
 
     max_energized = 0
-    grid_rows = len(grid)
-    grid_cols = len(grid[0])
 
-    # Можем начать с любого угла
-    for row in range(grid_rows):
-        max_energized = max(max_energized, calculate(grid, row, -1, 0, 1))
-        max_energized = max(max_energized, calculate(grid, row, len(grid[row]), 0, -1))
+    # Можем начать с любого края
+    for row in range(grid.height):
+        max_energized = max(max_energized, calculate(grid, grid.index(row, -1), 1))
+        max_energized = max(max_energized, calculate(grid, grid.index(row, grid.width), 3))
 
-    for col in range(grid_cols):
-        max_energized = max(max_energized, calculate(grid, -1, col, 1, 0))
-        max_energized = max(max_energized, calculate(grid, len(grid), col, -1, 0))
+    for col in range(grid.width):
+        max_energized = max(max_energized, calculate(grid, grid.index(-1, col), 2))
+        max_energized = max(max_energized, calculate(grid, grid.index(grid.height, col), 0))
 
     return max_energized
 
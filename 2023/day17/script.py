@@ -1,58 +1,84 @@
-from heapq import heappush, heappop
+import sys
+from pathlib import Path
 
-# Define directional movements
-UP, DOWN, LEFT, RIGHT = (1, 0), (-1, 0), (0, -1), (0, 1)
+# Прямой запуск `python 2023/day17/script.py`: пакет aoc лежит в корне репозитория
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc import search
+from aoc.grid import Grid, digits_table
+
+OUTSIDE = 255  # Значение клеток рамки после перевода цифр в числа
+MAX_HEAT = 9   # Максимальная потеря тепла в одной клетке
 
 # Считываем сетку из файла
 def read_grid_from_file(filename):
-    """Read the grid from a file and return it as a list."""
-    with open(filename) as file:
-        return [list(map(int, line.strip())) for line in file]
-
-# Эта функция исследует соседние ячейки и обновляет очередь с приоритетами.
-def explore_neighbors(grid, queue, heat_loss, row, col, delta_row, delta_col, steps=1):
-    """Explore neighboring cells and update the priority queue.
-    
-    grid (list of lists) - The grid representation.
-    queue (priority queue) - The priority queue holding the cells to be explored.
-    heat_loss (numeric) - The current heat loss at the current cell.
-    row (int) - The current row index of the cell.
-    col (int) - The current column index of the cell.
-    delta_row (int) - The change in row index (movement in the row direction).
-    delta_col (int) - The change in column index (movement in the column direction).
-    steps (int, default=1) - The number of steps taken to reach the current cell.
-    """
-    new_row, new_col = row + delta_row, col + delta_col
+    """Read the grid from a file and return it as a flat Grid of heat losses (0..9)."""
+    return Grid.from_file(filename).translate(digits_table(OUTSIDE))
 
-    if 0 <= new_row < len(grid) and 0 <= new_col < len(grid[0]):
-        heappush(queue, (heat_loss + grid[new_row][new_col], new_row, new_col, delta_row, delta_col, steps))
+# Эта функция перебирает все допустимые прямые отрезки из клетки вдоль одной оси.
+def explore_neighbors(cells, index, offsets, max_move, min_move):
+    """Yield (cell, heat loss) for every straight run of min_move..max_move steps.
+
+    cells (bytearray) - The flat grid with heat losses and OUTSIDE border.
+    index (int) - The flat index of the current cell.
+    offsets (tuple) - The two opposite index offsets along the axis of movement.
+    max_move (int) - The maximum number of steps in one direction.
+    min_move (int) - The minimum number of steps before turning or stopping.
+    """
+    for offset in offsets:
+        heat_loss = 0
+        position = index
+        for steps in range(1, max_move + 1):
+            position += offset
+            cell = cells[position]
+            if cell == OUTSIDE:  # Дальше по этой оси сетка кончилась
+                break
+            heat_loss += cell
+            if steps >= min_move:
+                yield position, heat_loss
 
 # Используем модификацию алгоритма Дейкстры для нахождения кратчайшего пути от начальной точки (0,0) до конечной точки (нижний правый угол).
-# Алгоритм работает с использованием очереди с приоритетами для поиска оптимального пути.
-def find_shortest_path(grid, max_move, min_move):
-    visited = set()
-    priority_queue = [(0, 0, 0, 0, 0, 0)]
+# Прямые отрезки сворачиваются в одно ребро длиной min_move..max_move, поэтому состояние - только
+# (клетка, ось последнего движения): после отрезка обязательно поворачиваем на другую ось.
+# Веса рёбер - небольшие целые числа (не больше 9 * max_move), поэтому по умолчанию вместо heapq
+# используется кольцевая очередь из корзин (алгоритм Дейала, strategy="dial"): извлечение минимума - O(1)
+# амортизированно. strategy="heap" - Дейкстра с ленивой кучей, "astar" - A* с манхэттенской эвристикой
+# (каждый шаг стоит не меньше 1); счётчики result.stats позволяют сравнить очереди на одних данных.
+def find_shortest_path(grid, max_move, min_move, strategy="dial", stats=None):
+    cells = grid.cells
+    axis_offsets = ((1, -1), (grid.stride, -grid.stride))  # 0 - горизонталь, 1 - вертикаль
+    start, target = grid.index(0, 0), grid.index(grid.height - 1, grid.width - 1)
+    target_row, target_col = grid.height - 1, grid.width - 1
+
+    # Состояние = клетка * 2 + ось следующего движения, поэтому расстояния - плоский массив
+    def neighbours(state):
+        next_axis = 1 - (state & 1)
+        for position, loss in explore_neighbors(cells, state >> 1, axis_offsets[state & 1], max_move, min_move):
+            yield position * 2 + next_axis, loss
 
-    while priority_queue:
-        heat_loss, row, col, d_row, d_col, steps = heappop(priority_queue)
-        
-        if row == len(grid) - 1 and col == len(grid[row]) - 1:
-            return heat_loss
+    def is_goal(state):
+        return state >> 1 == target
 
-        if (row, col, d_row, d_col, steps) in visited:
-            continue
+    def heuristic(state):
+        row, col = grid.coords(state >> 1)
+        return target_row - row + target_col - col
 
-        visited.add((row, col, d_row, d_col, steps))
+    starts, size = (start * 2, start * 2 + 1), len(cells) * 2
+    if strategy == "dial":
+        result = search.dial(starts, neighbours, MAX_HEAT * max_move, is_goal, size)
+    elif strategy == "heap":
+        result = search.dijkstra(starts, neighbours, is_goal, size)
+    elif strategy == "astar":
+        result = search.astar(starts, neighbours, heuristic, is_goal, size)
+    else:
+        raise ValueError(f"Unknown strategy: {strategy}")
 
-        if steps < max_move and (d_row, d_col) != (0, 0):
-            explore_neighbors(grid, priority_queue, heat_loss, row, col, d_row, d_col, steps + 1)
+    if stats is not None:
+        stats[strategy] = result.stats
+    return result.cost
 
-        if steps >= min_move or (d_row, d_col) == (0, 0):
-            for new_d_row, new_d_col in (UP, DOWN, LEFT, RIGHT):
-                if (new_d_row, new_d_col) != (d_row, d_col) and (new_d_row, new_d_col) != (-d_row, -d_col):
-                    explore_neighbors(grid, priority_queue, heat_loss, row, col, new_d_row, new_d_col)
 
-   
 def task_1(file_path):
     return find_shortest_path(read_grid_from_file(file_path), 3, 1)
 
@@ -66,4 +92,4 @@ def main():
     print('Part two:', task_2(file_path)) # 1294
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
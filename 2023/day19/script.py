@@ -1,4 +1,15 @@
 import re
+import sys
+from pathlib import Path
+
+# Прямой запуск `python 2023/day19/script.py`: пакет aoc лежит в корне репозитория
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.intervals import IntervalSet
+
+MIN_RATING, MAX_RATING = 1, 4000
+FULL_RANGE = IntervalSet.from_inclusive([(MIN_RATING, MAX_RATING)])
 
 # Функция рекурсивно вычисляет условия на основе заданных правил
 # O(n), где n - количество шагов
@@ -29,51 +40,46 @@ def evaluate_condition(part, current_step, workflow):
             # Рекурсивно вызвать evaluate_condition для действия
             return evaluate_condition(part, action, workflow)
 
-# Функция принимает символ (character), флаг is_greater для указания больше/меньше, значение (value) 
-# и набор диапазонов (ranges). Она адаптирует диапазоны в соответствии с заданными параметрами.
-# O(m * k), где m элементов, а каждый элемент имеет длину k.
-def adjust_ranges(character, is_greater, value, ranges):
+# Функция принимает символ (character), флаг is_greater для указания больше/меньше, значение (value)
+# и набор диапазонов (ranges) одного пути. Допустимые значения каждой категории - aoc.intervals.IntervalSet;
+# условие делит диапазон категории по одной границе на две части обрезкой (clip).
+# Возвращает пару наборов (условие выполнено, не выполнено); пустой набор - None.
+# O(log k), где k - количество отрезков в диапазоне категории.
+def split_ranges(character, is_greater, value, ranges):
     character_index = 'xmas'.index(character)
-    adjusted_ranges = []
-    
-    for rng in ranges:
-        rng = list(rng)
-        lo, hi = rng[character_index]
-        
-        if is_greater:
-            lo = max(lo, value + 1)
-        else:
-            hi = min(hi, value - 1)
-        
-        if lo <= hi:
-            rng[character_index] = (lo, hi)
-            adjusted_ranges.append(tuple(rng))
-    
-    return adjusted_ranges
+    allowed = ranges[character_index]
+    bound = value + 1 if is_greater else value  # Первое значение верхней части
+    lower, upper = allowed.clip(MIN_RATING, bound), allowed.clip(bound, MAX_RATING + 1)
+    passed, failed = (upper, lower) if is_greater else (lower, upper)
+    head, tail = ranges[:character_index], ranges[character_index + 1:]
+    return (head + (passed,) + tail if passed else None,
+            head + (failed,) + tail if failed else None)
 
 # Функция определяет диапазоны принятия (acceptance ranges) на основе правил (rules) и рабочего процесса (workflow).
-# O(n), где n - количество шагов.
-def determine_acceptance_ranges(rules, workflow):
+# Обход идёт сверху вниз: текущие допустимые диапазоны передаются вниз, и условие делит их на часть,
+# уходящую в действие, и часть, которую проверяют следующие правила. Поэтому каждое правило
+# делит один набор диапазонов, а не все принятые диапазоны своего поддерева.
+# O(n), где n - количество правил на всех путях от 'in'.
+def determine_acceptance_ranges(rules, workflow, ranges=(FULL_RANGE,) * 4):
     current_rule = rules[0]
     if current_rule == "R":
         return []
     if current_rule == "A":
-        return [((1, 4000), (1, 4000), (1, 4000), (1, 4000))]
-    
+        return [ranges]
+
     current_rule_split = current_rule.split(":")
     if len(current_rule_split) == 1:
-        return determine_acceptance_ranges(workflow[current_rule].split(","), workflow)
+        return determine_acceptance_ranges(workflow[current_rule].split(","), workflow, ranges)
 
     condition = current_rule_split[0]
-    is_greater = ">" in condition
-    character = condition[0]
-    value = int(condition[2:])
-    inverted_value = value + 1 if is_greater else value - 1
-    
-    true_ranges = adjust_ranges(character, is_greater, value, determine_acceptance_ranges([current_rule_split[1]], workflow))
-    false_ranges = adjust_ranges(character, not is_greater, inverted_value, determine_acceptance_ranges(rules[1:], workflow))
-    
-    return true_ranges + false_ranges
+    true_ranges, false_ranges = split_ranges(condition[0], ">" in condition, int(condition[2:]), ranges)
+
+    accepted = []
+    if true_ranges is not None:
+        accepted += determine_acceptance_ranges([current_rule_split[1]], workflow, true_ranges)
+    if false_ranges is not None:
+        accepted += determine_acceptance_ranges(rules[1:], workflow, false_ranges)
+    return accepted
 
 # Парсинг данных
 def pars_data(file_path):
@@ -97,8 +103,8 @@ def task_2(file_path):
     part_two_total = 0
     for rng in determine_acceptance_ranges(workflow['in'].split(","), workflow):
         total = 1
-        for low, high in rng:
-            total *= high - low + 1
+        for allowed in rng:
+            total *= allowed.total
         part_two_total += total
     return part_two_total
 
@@ -1,141 +1,157 @@
-from math import gcd
-from collections import deque
-
-# Функция вычисления НОК (наименьшего общего кратного) списка чисел.
-# O(n*log(max(числа))) - где n - количество чисел в списке.
-def lcm(numbers):
-    result = 1
-    for num in numbers:
-        result = (result * num) // gcd(num, result)
-    return result
-
-# Функция подгонки сигнала с учетом типов входных сигналов.
-def adjust(signal, input_types):
-    if signal in input_types:
-        return input_types[signal] + signal
-    return signal
-
-# Инициализация сигналов и узлов на основе входных данных.
-def initialize(input_data):
-    wiring = {}
-    input_types = {}
-    for line in input_data:
-        src, dest = line.split('->')
-        src = src.strip()
-        dest = dest.strip().split(', ')
-        wiring[src] = dest
-        input_types[src[1:]] = src[0]
-    return wiring, input_types
-
-# Создание связей для входов и выходов на основе инициализированных данных.
-def create_mappings(wiring, input_types):
-    input_connections = {}
-    input_inverse = {}
-    for node, signals in wiring.items():
-        wiring[node] = [adjust(signal, input_types) for signal in signals]
-        for signal in wiring[node]:
-            if signal[0] == '&':
-                if signal not in input_connections:
-                    input_connections[signal] = {}
-                input_connections[signal][node] = 'lo'
-            if signal not in input_inverse:
-                input_inverse[signal] = []
-            input_inverse[signal].append(node)
-    return wiring, input_connections, input_inverse
-
-# Симуляция работы цепи. Используем поиск в ширину (BFS).
-def simulate_circuit(wiring, input_connections, input_inverse, watching, pushing_quantity):
-    
-    # Инициализация переменных и структур данных
-    low_signal = 0
-    high_signal = 0
-    queue = deque()
-    activated_nodes = set()
-    previous_count = {}
-    signal_count = {}
-    to_lcm = []
-
-    # Симуляция работы цепи на протяжении множества итераций
-    for time in range(1, pushing_quantity + 1):
-        queue.append(('broadcaster', 'button', 'lo'))
-
-        while queue:
-            node, from_node, signal_type = queue.popleft()
-
-            if node not in signal_count:
-                signal_count[node] = 0
-
-            if signal_type == 'lo':
-                if node in previous_count and signal_count[node] == 2 and node in watching:
-                    to_lcm.append(time - previous_count[node])
-                previous_count[node] = time
-                signal_count[node] += 1
-
-            if len(to_lcm) == len(watching): # task 2
-                return lcm(to_lcm) 
-
-            if signal_type == 'lo':
-                low_signal += 1
-            else:
-                high_signal += 1
-
-            if node not in wiring:
+from math import lcm
+
+BROADCASTER, FLIP_FLOP, CONJUNCTION, OUTPUT = range(4)
+KINDS = {'%': FLIP_FLOP, '&': CONJUNCTION}
+
+# Схема, скомпилированная в массивы: модули - целые номера, связи - кортежи номеров.
+class Circuit:
+    """
+    names[m] - имя модуля m, index[name] - его номер, kinds[m] - тип модуля.
+    targets[m] - кортеж (получатель, бит входа): бит входа - позиция m в памяти получателя-конъюнкции
+    (0 для остальных получателей). full_mask[m] - маска всех входов конъюнкции m.
+    """
+
+    __slots__ = ('names', 'index', 'kinds', 'targets', 'full_mask', 'broadcaster')
+
+    # Разбор за O(n + e), где n - количество модулей, e - количество связей
+    def __init__(self, lines):
+        wiring = []
+        for line in lines:
+            if '->' not in line:
                 continue
-
-            if node == 'broadcaster':
-                for signal in wiring[node]:
-                    queue.append((signal, node, signal_type))
-            elif node[0] == '%':
-                if signal_type == 'hi':
+            source, destinations = line.split('->')
+            source = source.strip()
+            kind = KINDS.get(source[0], BROADCASTER)
+            wiring.append((source.lstrip('%&'), kind, [d.strip() for d in destinations.split(',')]))
+
+        self.names, self.index, self.kinds = [], {}, []
+        for name, kind, _ in wiring:
+            self._add(name, kind)
+        for _, _, destinations in wiring:
+            for destination in destinations:
+                self._add(destination, OUTPUT)  # Модули без описания (rx, output) только принимают импульсы
+
+        self.full_mask = [0] * len(self.names)
+        targets = [[] for _ in self.names]
+        for name, _, destinations in wiring:
+            source = self.index[name]
+            for destination in destinations:
+                target = self.index[destination]
+                bit = 0
+                if self.kinds[target] == CONJUNCTION:
+                    bit = self.full_mask[target] + 1  # Следующий свободный бит памяти конъюнкции
+                    self.full_mask[target] |= bit
+                targets[source].append((target, bit))
+        self.targets = [tuple(t) for t in targets]
+        self.broadcaster = self.index['broadcaster']
+
+    def _add(self, name, kind):
+        if name not in self.index:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+            self.kinds.append(kind)
+
+    @classmethod
+    def from_file(cls, file_path):
+        with open(file_path) as file:
+            return cls(file.read().splitlines())
+
+    def sources(self, module):
+        """Номера модулей, посылающих импульсы в module."""
+        return [m for m, targets in enumerate(self.targets) if any(t == module for t, _ in targets)]
+
+
+# Состояние схемы: все триггеры - биты одного int, память каждой конъюнкции - отдельная битовая маска.
+class Simulator:
+    def __init__(self, circuit):
+        self.circuit = circuit
+        self.flip_flops = 0
+        self.memory = [0] * len(circuit.names)
+        self.low = self.high = 0
+        self.presses = 0
+
+    # Одно нажатие кнопки - обход импульсов в ширину. O(p), где p - количество импульсов.
+    def press(self, watch_mask=0):
+        """
+        Нажимает кнопку и возвращает маску модулей из watch_mask, пославших хотя бы один высокий импульс.
+        """
+        circuit = self.circuit
+        kinds, targets, full_mask, memory = circuit.kinds, circuit.targets, circuit.full_mask, self.memory
+        flip_flops = self.flip_flops
+        low, high, fired = 1, 0, 0  # Низкий импульс от кнопки
+
+        queue = [(circuit.broadcaster, 0, False)]
+        for module, bit, pulse in queue:  # Очередь растёт во время обхода
+            kind = kinds[module]
+            if kind == FLIP_FLOP:
+                if pulse:
                     continue
+                flip_flops ^= 1 << module
+                pulse = flip_flops >> module & 1 == 1
+            elif kind == CONJUNCTION:
+                if pulse:
+                    memory[module] |= bit
                 else:
-                    if node not in activated_nodes:
-                        activated_nodes.add(node)
-                        new_signal_type = 'hi'
-                    else:
-                        activated_nodes.discard(node)
-                        new_signal_type = 'lo'
-                    for signal in wiring[node]:
-                        queue.append((signal, node, new_signal_type))
-            elif node[0] == '&':
-                if node not in input_connections:
-                    input_connections[node] = {}
-                input_connections[node][from_node] = signal_type
-                new_signal_type = 'lo' if all(s == 'hi' for s in input_connections[node].values()) else 'hi'
-                for signal in wiring[node]:
-                    queue.append((signal, node, new_signal_type))
-
-        # if time == 1000: # task 1
-    return low_signal * high_signal
-
-def task_1(file_path):
-    with open('2023/day20/input.txt') as file:
-        input_data = file.read().strip().split('\n')
-    
-    # Инициализация
-    wiring, input_types = initialize(input_data)
-    wiring, input_connections, input_inverse = create_mappings(wiring, input_types)
-
-    # Определение переменной watching. Можно взять любое значение. Я беру первое и к нему будем идти.
-    watching = list(input_inverse.keys())[0]
-
-    # Симуляция работы цепи. По условию нажать кнопку 1000 раз
-    return simulate_circuit(wiring, input_connections, input_inverse, watching, 1000) 
+                    memory[module] &= ~bit
+                pulse = memory[module] != full_mask[module]
+            elif kind == OUTPUT:
+                continue
 
-def task_2(file_path):
-    # Чтение входных данных
-    with open('2023/day20/input.txt') as file:
-        input_data = file.read().strip().split('\n')
+            outgoing = targets[module]
+            if pulse:
+                high += len(outgoing)
+                if watch_mask >> module & 1:
+                    fired |= 1 << module
+            else:
+                low += len(outgoing)
+            for target, target_bit in outgoing:
+                queue.append((target, target_bit, pulse))
+
+        self.flip_flops = flip_flops
+        self.low += low
+        self.high += high
+        self.presses += 1
+        return fired
+
+    def run(self, presses):
+        """Нажимает кнопку presses раз (годится и для миллионов нажатий). Возвращает low * high."""
+        press = self.press
+        for _ in range(presses):
+            press()
+        return self.low * self.high
+
+
+# Автоматический поиск циклов для второй части.
+# rx получает импульсы от единственной конъюнкции, а та - от независимых подсхем-счётчиков:
+# низкий импульс в rx придёт, когда все входы конъюнкции пошлют высокий импульс в одном нажатии.
+# Для каждого входа запоминаем нажатия, в которых он послал высокий импульс; длина цикла -
+# разница между двумя первыми такими нажатиями. O(L * p), где L - самый длинный цикл.
+def find_cycle_lengths(circuit, output='rx', max_presses=10**6):
+    feeders = circuit.sources(circuit.index[output])
+    if len(feeders) != 1 or circuit.kinds[feeders[0]] != CONJUNCTION:
+        raise ValueError(f"{output} должен получать импульсы от одной конъюнкции")
+    watched = circuit.sources(feeders[0])
+    watch_mask = sum(1 << m for m in watched)
+
+    simulator = Simulator(circuit)
+    first, lengths = {}, {}
+    while len(lengths) < len(watched):
+        if simulator.presses >= max_presses:
+            raise ValueError(f"Циклы не найдены за {max_presses} нажатий")
+        fired = simulator.press(watch_mask)
+        for module in watched:
+            if fired >> module & 1 and module not in lengths:
+                if module in first:
+                    lengths[module] = simulator.presses - first[module]
+                else:
+                    first[module] = simulator.presses
+    return {circuit.names[m]: length for m, length in lengths.items()}
 
-    # Инициализация
-    wiring, input_types = initialize(input_data)
-    wiring, input_connections, input_inverse = create_mappings(wiring, input_types)
-    
-    # Определение переменной watching. По условию нужно дойти до модуля rx.
-    watching = input_inverse[input_inverse['rx'][0]]
+def task_1(file_path, presses=1000):
+    return Simulator(Circuit.from_file(file_path)).run(presses)
 
-    # Симуляция работы цепи. После 100_000 повторений ответ не меняется, значит дошли.
-    return simulate_circuit(wiring, input_connections, input_inverse, watching, 10**5)
+def task_2(file_path):
+    return lcm(*find_cycle_lengths(Circuit.from_file(file_path)).values())
 
 # Main function
 def main():
@@ -144,4 +160,4 @@ def main():
     print('Part two:', task_2(file_path)) # 243548140870057
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,29 @@
+import unittest
+import script
+from aoc.grid import Grid
+
+class TestDay23(unittest.TestCase):
+
+    example_path = '2023/day23/t_input.txt'
+    file_path = '2023/day23/input.txt'
+
+    def test_task1_with_example_data(self):
+        self.assertEqual(script.task_1(self.example_path), 94)
+
+    def test_task2_with_example_data(self):
+        self.assertEqual(script.task_2(self.example_path), 154)
+
+    def test_task2_process_pool_matches_single_process(self):
+        self.assertEqual(script.task_2(self.example_path, workers=2), script.task_2(self.example_path, workers=1))
+
+    def test_longest_parallel_matches_sequential_search(self):
+        grid = Grid.from_file(self.example_path)
+        for slopes in (True, False):
+            graph = script.build_junction_graph(grid, slopes=slopes)
+            self.assertEqual(script.find_longest_path(*graph, workers=2), script.find_longest_path(*graph))
+
+    def test_part1_with_puzzle_input(self):
+        self.assertEqual(script.task_1(self.file_path), 2386)
+
+if __name__ == '__main__':
+    unittest.main()
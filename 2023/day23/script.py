@@ -1,127 +1,169 @@
-# Создает список смежности для заданного графа. Этот список смежности отображает связи между ячейками сетки.
-# O(N*M), где N - количество строк, а M - средняя длина строк.
-def create_adjacency_list(data):
-    adjacency = {}
-    for r, row in enumerate(data):
-        for c, cell_value in enumerate(row):
-            if cell_value == ".":
-                for dr, dc in [(-1, 0), (0, -1), (0, 1), (1, 0)]:
-                    adj_row, adj_col = r + dr, c + dc
-                    if not (0 <= adj_row < len(data) and 0 <= adj_col < len(row)):
-                        continue
-                    if data[adj_row][adj_col] == ".":
-                        adjacency.setdefault((r, c), set()).add((adj_row, adj_col))
-                        adjacency.setdefault((adj_row, adj_col), set()).add((r, c))
-            if cell_value == ">":
-                adjacency.setdefault((r, c), set()).add((r, c + 1))
-                adjacency.setdefault((r, c - 1), set()).add((r, c))
-            if cell_value == "v":
-                adjacency.setdefault((r, c), set()).add((r + 1, c))
-                adjacency.setdefault((r - 1, c), set()).add((r, c))
-    return adjacency
-
-# Ищет самый длинный путь в графе, представленном списком смежности, используя обход в ширину (BFS) с поддержанием очереди.
-# O(V+E), где V - количество вершин, а E - количество рёбер в графе.
-def find_longest_path(adj_list, rows, cols):
-    queue = [(0, 1, 0)]
-    visited = set()
-    best_distance = 0
-
-    while queue:
-        current_row, current_col, distance = queue.pop()
-        if distance == -1:
-            visited.remove((current_row, current_col))
-            continue
-        if (current_row, current_col) == (rows - 1, cols - 2):
-            best_distance = max(best_distance, distance)
-            continue
-        if (current_row, current_col) in visited:
-            continue
-        visited.add((current_row, current_col))
-        queue.append((current_row, current_col, -1))
-        for adj_row, adj_col in adj_list[(current_row, current_col)]:
-            queue.append((adj_row, adj_col, distance + 1))
-
-    return best_distance
-
-# Создает список смежности для графа, но делает это по условию из второй части.
-# O(N*M), где N - количество строк в data, а M - средняя длина строк.
-def create_adjacency(data):
-    edges = {}
-    directions = [(-1, 0), (0, -1), (0, 1), (1, 0)]
-    rows, cols = len(data), len(data[0])
-
-    def is_valid_cell(row, col):
-        return 0 <= row < rows and 0 <= col < cols
-
-    for r, row in enumerate(data):
-        for c, v in enumerate(row):
-            if v in ".>v":
-                edges.setdefault((r, c), set())
-                for dr, dc in directions:
-                    ar, ac = r + dr, c + dc
-                    if is_valid_cell(ar, ac) and data[ar][ac] in ".>v":
-                        edges[(r, c)].add((ar, ac, 1))
-                        edges.setdefault((ar, ac), set()).add((r, c, 1))
-    return edges
-
-# Модифицирует список смежности, удаляя узлы с ровно двумя связями и объединяя их связи для упрощения графа.
-# O(V*E), где V - количество вершин, а E - количество рёбер в графе
-def remove_degree_two_nodes(adj_list):
-    modified_adjacency = adj_list.copy()
-
-    while True:
-        for node, edges in modified_adjacency.items():
-            if len(edges) == 2:
-                edge_a, edge_b = edges
-                modified_adjacency[edge_a[:2]].remove(node + (edge_a[2],))
-                modified_adjacency[edge_b[:2]].remove(node + (edge_b[2],))
-                modified_adjacency[edge_a[:2]].add((edge_b[0], edge_b[1], edge_a[2] + edge_b[2]))
-                modified_adjacency[edge_b[:2]].add((edge_a[0], edge_a[1], edge_a[2] + edge_b[2]))
-                del modified_adjacency[node]
-                break
-        else:
-            break
-
-    return modified_adjacency
-
-# Ищет самый длинный путь в измененном графе (после удаления узлов с двумя связями) используя обход в ширину (BFS) с поддержанием очереди.
-# O(V*E), где V - количество вершин, а E - количество рёбер в графе
-def find_longest_path_modified(adj_list_modified, rows, cols):
-    queue = [(0, 1, 0)]
-    visited = set()
-    best_length = 0
-
-    while queue:
-        current_row, current_col, length = queue.pop()
-        if length == -1:
-            visited.remove((current_row, current_col))
-            continue
-        if (current_row, current_col) == (rows - 1, cols - 2):
-            best_length = max(best_length, length)
-            continue
-        if (current_row, current_col) in visited:
-            continue
-        visited.add((current_row, current_col))
-        queue.append((current_row, current_col, -1))
-        for adj_row, adj_col, l in adj_list_modified[(current_row, current_col)]:
-            queue.append((adj_row, adj_col, length + l))
+from concurrent.futures import ProcessPoolExecutor
+import sys
+from pathlib import Path
 
-    return best_length
+# Прямой запуск `python 2023/day23/script.py`: пакет aoc лежит в корне репозитория
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-def task_1(file_path):
-    with open(file_path) as file:
-        grid_data = file.read().strip().splitlines()
+from aoc.grid import Grid, OUTSIDE
 
-    rows, cols = len(grid_data), len(grid_data[0])
-    return find_longest_path(create_adjacency_list(grid_data), rows, cols)
+WALL = ord("#")
+SLOPES = {ord("^"): 0, ord(">"): 1, ord("v"): 2, ord("<"): 3}  # Склон -> единственное разрешённое направление
 
-def task_2(file_path):
-    with open(file_path) as file:
-        grid_data = file.read().strip().splitlines()
+# Находит перекрёстки: старт, финиш и все клетки, из которых можно пойти в 3+ стороны.
+# O(N*M), где N - количество строк, а M - длина строк.
+def find_junctions(grid, start, end):
+    cells = grid.cells
+    offsets = grid.offsets4
+    junctions = [start]
+    for i in grid.positions():
+        if cells[i] == WALL:
+            continue
+        exits = sum(cells[i + o] != WALL and cells[i + o] != OUTSIDE for o in offsets)
+        if exits >= 3:
+            junctions.append(i)
+    junctions.append(end)
+    return junctions
+
+# Сжимает коридоры в рёбра индексированного графа перекрёстков за один проход:
+# из каждого перекрёстка идём по каждому выходу, пока не упрёмся в следующий перекрёсток.
+# Каждая клетка коридора проходится не более двух раз (с обоих концов), поэтому O(N*M).
+# Если slopes=True, склоны можно проходить только по их направлению (первая часть) - рёбра направленные.
+def build_junction_graph(grid, slopes=True):
+    """Возвращает (adjacency, start_id, end_id), adjacency[id] - список (сосед, длина, бит соседа)."""
+    cells = grid.cells
+    offsets = grid.offsets4
+    start, end = grid.index(0, 1), grid.index(grid.height - 1, grid.width - 2)
+    junctions = find_junctions(grid, start, end)
+    node_id = {cell: n for n, cell in enumerate(junctions)}
+
+    def can_move(position, direction):
+        # Со склона и на склон можно двигаться только в направлении склона
+        if not slopes:
+            return True
+        for cell in (cells[position], cells[position + offsets[direction]]):
+            if cell in SLOPES and SLOPES[cell] != direction:
+                return False
+        return True
+
+    adjacency = [[] for _ in junctions]
+    for source, junction in enumerate(junctions):
+        for direction, offset in enumerate(offsets):
+            cell = cells[junction + offset]
+            if cell == WALL or cell == OUTSIDE or not can_move(junction, direction):
+                continue
+
+            position, length, passable = junction + offset, 1, True
+            while position not in node_id:
+                # В коридоре ровно один выход, не ведущий назад
+                for next_direction in ((direction + 3) % 4, direction, (direction + 1) % 4):
+                    next_cell = cells[position + offsets[next_direction]]
+                    if next_cell != WALL and next_cell != OUTSIDE:
+                        break
+                else:
+                    passable = False  # Тупик
+                    break
+                if not can_move(position, next_direction):
+                    passable = False
+                    break
+                direction = next_direction
+                position += offsets[direction]
+                length += 1
+
+            if passable:
+                target = node_id[position]
+                adjacency[source].append((target, length, 1 << target))
+
+    return adjacency, node_id[start], node_id[end]
+
+# Ищет самый длинный путь DFS-ом по графу перекрёстков (~36 узлов).
+# Посещённые узлы - битовая маска в int, поэтому "посетить/отменить" - одна операция без копий множеств.
+# Единственный сосед финиша - обязательный последний шаг: как только мы в нём, идём только в финиш
+# (иначе финиш станет недостижим), поэтому поиск заканчивается уже в этом узле.
+# С memo=True результаты кэшируются по (узел, маска) - полезно на направленном графе первой части.
+# С workers > 1 верхние уровни дерева DFS раскрываются заранее, а поддеревья считаются в пуле процессов.
+# O(2^V) в худшем случае, где V - количество перекрёстков.
+def find_longest_path(adjacency, start, end, memo=False, workers=1):
+    target, tail = end, 0
+    into_end = [(node, length) for node, edges in enumerate(adjacency) for nb, length, _ in edges if nb == end]
+    if len(into_end) == 1:
+        target, tail = into_end[0]
+
+    if workers > 1:
+        best = longest_parallel(adjacency, start, target, memo, workers)
+    else:
+        best = longest_from(adjacency, start, 1 << start, target, {} if memo else None)
+    return best + tail if best >= 0 else None
+
+def longest_from(adjacency, node, mask, target, cache=None):
+    """Длина самого длинного пути node -> target, не проходящего через узлы из mask (-1, если пути нет)."""
+    if node == target:
+        return 0
+    if cache is not None:
+        key = (node, mask)
+        if key in cache:
+            return cache[key]
+
+    best = -1
+    for neighbour, length, bit in adjacency[node]:
+        if not mask & bit:
+            rest = longest_from(adjacency, neighbour, mask | bit, target, cache)
+            if rest >= 0 and rest + length > best:
+                best = rest + length
+
+    if cache is not None:
+        cache[key] = best
+    return best
+
+# Раскрывает первые уровни дерева DFS из start, пока префиксов не станет не меньше min_prefixes.
+# Возвращает (префиксы (узел, маска, длина), лучшая длина путей, уже дошедших до target).
+def expand_prefixes(adjacency, start, target, min_prefixes):
+    frontier = [(start, 1 << start, 0)]
+    finished = -1
+    while frontier and len(frontier) < min_prefixes:
+        next_frontier = []
+        for node, mask, length in frontier:
+            for neighbour, edge_length, bit in adjacency[node]:
+                if mask & bit:
+                    continue
+                if neighbour == target:
+                    finished = max(finished, length + edge_length)
+                else:
+                    next_frontier.append((neighbour, mask | bit, length + edge_length))
+        frontier = next_frontier
+    return frontier, finished
+
+# Граф и параметры поиска передаются в каждый процесс один раз через initializer.
+_worker_graph = None
+
+def _init_worker(adjacency, target, memo):
+    global _worker_graph
+    _worker_graph = (adjacency, target, memo)
+
+def _longest_from_prefix(prefix):
+    adjacency, target, memo = _worker_graph
+    node, mask, length = prefix
+    rest = longest_from(adjacency, node, mask, target, {} if memo else None)
+    return length + rest if rest >= 0 else -1
+
+# Делит перебор между процессами по префиксам пути и берёт максимум результатов.
+# Префиксов берётся в несколько раз больше, чем процессов, чтобы неравные поддеревья балансировались.
+def longest_parallel(adjacency, start, target, memo=False, workers=2, prefixes_per_worker=8):
+    prefixes, best = expand_prefixes(adjacency, start, target, workers * prefixes_per_worker)
+    if not prefixes:
+        return best
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(adjacency, target, memo)) as pool:
+        return max(best, max(pool.map(_longest_from_prefix, prefixes)))
+
+def task_1(file_path):
+    grid = Grid.from_file(file_path)
+    return find_longest_path(*build_junction_graph(grid, slopes=True), memo=True)
 
-    rows, cols = len(grid_data), len(grid_data[0])
-    return find_longest_path_modified(remove_degree_two_nodes(create_adjacency(grid_data)), rows, cols)
+def task_2(file_path, workers=1):
+    grid = Grid.from_file(file_path)
+    return find_longest_path(*build_junction_graph(grid, slopes=False), workers=workers)
 
 # Main function
 def main():
@@ -130,4 +172,4 @@ def main():
     print('Part two:', task_2(file_path)) # 6246
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
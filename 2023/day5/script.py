@@ -1,3 +1,12 @@
+import sys
+from pathlib import Path
+
+# Direct run `python 2023/day5/script.py`: the aoc package lives at the repository root
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.intervals import IntervalMap
+
 def convert(seed, maps):
         num = seed
         for r in maps:
@@ -42,13 +51,11 @@ def task1(file_path):
         for k in e.split(':\n')[1].split('\n'):
             all_maps[i].append([int(i) for i in k.split()])
             
-    # Find the lowest location number corresponding to any of the initial seeds
-    min_location = float('inf')
-    for seed in seeds:
-        location = convert(seed, all_maps)
-        min_location = min(min_location, location)
+    # Compose all maps once; every seed is then a single binary search instead of a walk through 7 maps
+    seed_to_location = IntervalMap.compose(IntervalMap.from_ranges(rows) for rows in all_maps)
 
-    return min_location
+    # Find the lowest location number corresponding to any of the initial seeds
+    return min(seed_to_location(seed) for seed in seeds)
 
 def read_input(file_path):
     with open(file_path) as f:
@@ -62,71 +69,24 @@ def read_input(file_path):
     intervals = [(a, a + b) for a, b in zip(seeds[::2], seeds[1::2])]
     return sections, intervals
 
-def calculate_intervals(rows, intervals):
-
-    # Initialize variables to store start points and offsets
-    i_start = [-1]
-    offsets = [0]
-    latest_end = -1
-
-    # Iterate through each row and calculate the end point of the interval
-    for row in rows:
-        latest_end = max(latest_end, row[1] + row[2])
-        offset = row[0] - row[1]
-        
-        # Update start point and offset if they match the previous ones
-        if i_start and i_start[-1] == row[1]:
-            i_start[-1] = row[1]
-            offsets[-1] = offset
-        else:
-            i_start.append(row[1])
-            offsets.append(offset)
-        
-        i_start.append(row[1] + row[2])
-        offsets.append(0)
-    
-    out = []
-    
-    # Calculate intervals based on given intervals and offsets
-    for interval in intervals:
-        splits = [interval[0]]
-        start_index = None
-        
-        # Find suitable points to split the interval
-        for idx, post in enumerate(i_start):
-            if post <= splits[-1]:
-                continue
-            if start_index is None:
-                start_index = idx - 1
-            if post < interval[1]:
-                if post != interval[1]:
-                    splits.append(post)
-            else:
-                break
-        
-        splits.append(interval[1])
-        start_index = start_index or len(offsets)
-        
-        # Apply offset to intervals
-        for a, b in zip(splits, splits[1:]):
-            dx = offsets[min(start_index or float('inf'), len(offsets) - 1)]
-            start_index += 1
-            out.append((a + dx, b + dx))
-    
-    return out
+def build_maps(sections):
+    """Parse every map section into an IntervalMap, in the order they are applied."""
+    maps = []
+    for table in sections:
+        rows = [tuple(map(int, row.split())) for row in table.split('\n')[1:] if row.strip()]
+        maps.append(IntervalMap.from_ranges(rows))
+    return maps
 
 def task2(file_path):
     # Read input data and get sections and intervals
     sections, intervals = read_input(file_path)
-    
-    # For each table in sections, calculate intervals
-    for table in sections:
-        rows = [tuple(map(int, row.split())) for row in table.split('\n')[1:]]
-        rows.sort(key=lambda row: row[1]) # Sort table rows based on the second element (intervals)
-        intervals = calculate_intervals(rows, intervals) # Calculate intervals
-    
+
+    # Compose the seven maps into one sorted piecewise-linear map: O(n log n) for n breakpoints
+    seed_to_location = IntervalMap.compose(build_maps(sections))
+
+    # Split every seed interval at the breakpoints and shift the pieces: O(r log n + k)
     # Return the minimum start point of an interval
-    return min(c[0] for c in intervals)
+    return min(start for start, _ in seed_to_location.map_ranges(intervals))
 
 def main():
     file_path = '2023/day5/input.txt'
@@ -1,93 +1,85 @@
-from collections import deque
-
-# Зміщення для сусідніх клітин (вверх, вниз, ліворуч, праворуч)
-NEIGHBOR_OFFSETS = [-1, 1, -1j, 1j]
-
-grid = {
-        complex(x, y): cell_value
-        for x, row in enumerate(open('2024/day12/input.txt'))
-        for y, cell_value in enumerate(row)
-        if cell_value != '\n'
-    }
-
-def calculate_area_and_perimeter(start_cell, visited_cells=set()):
-    # Знаходимо усі з'єднані клітини, починаючи з початкової клітини
-    connected_cells = find_connected_cells(start_cell, visited_cells)
-    visited_cells.update(connected_cells)
-    perimeter = calculate_perimeter(connected_cells) # Обчислюємо периметр з'єднаних клітин
-    edges = find_edges(connected_cells) # Знаходимо краї з'єднаних клітин
-    
-    area = len(connected_cells)
-    perimeter_length = perimeter * area
-    edge_count = len(edges) * area
-    return perimeter_length, edge_count
-
-# Використовується BFS. 
-# Складність: O(V + E), де V — кількість клітин (вершин), E — кількість зв'язків між сусідніми клітинами (ребер).
-def find_connected_cells(start_cell, visited_cells):
-    connected_cells = set()
-    
-    if start_cell not in visited_cells:
-        target_value = grid[start_cell]
-        
-        queue = deque([start_cell]) # Черга для обходу клітин
-
-        while queue:
-            current_cell = queue.popleft()
-            
-            # Якщо клітина має таке ж значення, додаємо її до з'єднаних клітин
-            if grid.get(current_cell) == target_value:
-                connected_cells.add(current_cell)
-                
-                # Додаємо сусідів до черги для обробки
-                for offset in NEIGHBOR_OFFSETS:
-                    neighbor = current_cell + offset
-                    if neighbor not in visited_cells and grid.get(neighbor) == target_value:
-                        visited_cells.add(neighbor)
-                        queue.append(neighbor)
-    return connected_cells
-
-# Обчислюємо периметр з'єднаних клітин
-def calculate_perimeter(connected_cells):
-    perimeter = 0
-    for cell in connected_cells:
-        for offset in NEIGHBOR_OFFSETS:
-            neighbor = cell + offset
-            if grid.get(neighbor) != grid[cell]:
-                perimeter += 1
-    return perimeter
-
-# Знаходимо краї між з'єднаними клітинами
-def find_edges(connected_cells):
-    edges = [] 
-    
-    for direction in NEIGHBOR_OFFSETS:
-        for edge_cell in sorted(
-            {cell + direction for cell in connected_cells} - connected_cells,
-            key=lambda point: (point.real, point.imag)
-        ):
-            matching_edge_group = next(
-                (
-                    edge_group
-                    for edge_group in edges
-                    for point, dir_offset in edge_group
-                    if abs(point - edge_cell) == abs(direction) and dir_offset == direction
-                ),
-                None
-            )
-
-            if matching_edge_group:
-                matching_edge_group.add((edge_cell, direction))
-            else:
-                edges.append({(edge_cell, direction)})
-    return edges
-
-
-def main():
-    area_perimeters, area_edge_counts = zip(*map(calculate_area_and_perimeter, grid))
-
-    print('Part 1:', sum(area_perimeters))  # 1375476
-    print('Part 2:', sum(area_edge_counts)) # 821372
+import sys
+from pathlib import Path
+
+# Прямий запуск `python 2024/day12/script.py`: пакет aoc лежить у корені репозиторію
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid
+from aoc.unionfind import DisjointSet
+
+
+def read_garden(file_path):
+    """Зчитує карту саду як сітку aoc.grid (рамка-сторож не збігається з жодною рослиною)."""
+    return Grid.from_file(file_path)
+
+# Кути клітинки: пари сусідніх сторін (вгору-вправо, вправо-вниз, вниз-вліво, вліво-вгору)
+def corner_offsets(grid):
+    up, right, down, left = grid.offsets4
+    return [(a, b, a + b) for a, b in ((up, right), (right, down), (down, left), (left, up))]
+
+# Один прохід по сітці в порядку рядків. Складність: O(N*M * α(N*M)), де N, M — розміри саду.
+def measure_regions(grid):
+    """
+    Повертає список (площа, периметр, кількість сторін) для кожного регіону.
+
+    Регіони позначаються union-find'ом: кожна клітинка з'єднується з лівим і верхнім сусідом
+    з тією ж рослиною. Площа, периметр і кути рахуються для клітинки локально в тому ж проході
+    і додаються до кореня її множини; при з'єднанні двох множин їхні лічильники складаються.
+
+    Кількість сторін регіону дорівнює кількості його кутів. Кут клітинки - зовнішній, якщо обидві
+    сусідні сторони ведуть в інший регіон, і внутрішній, якщо обидві сторони свої, а діагональ - чужа.
+    """
+    cells = grid.cells
+    offsets = grid.offsets4
+    corners = corner_offsets(grid)
+    up, _, _, left = offsets
+
+    sets = DisjointSet(len(cells))
+    area = [0] * len(cells)
+    perimeter = [0] * len(cells)
+    sides = [0] * len(cells)
+
+    def merge(a, b):
+        a, b = sets.find(a), sets.find(b)
+        if a == b:
+            return
+        sets.union(a, b)
+        root = sets.find(a)
+        other = b if root == a else a
+        area[root] += area[other]
+        perimeter[root] += perimeter[other]
+        sides[root] += sides[other]
+
+    for i in grid.positions():
+        plant = cells[i]
+        area[i] = 1
+        perimeter[i] = sum(cells[i + offset] != plant for offset in offsets)
+        for a, b, diagonal in corners:
+            same_a, same_b = cells[i + a] == plant, cells[i + b] == plant
+            if not same_a and not same_b or same_a and same_b and cells[i + diagonal] != plant:
+                sides[i] += 1
+
+        # Лівий і верхній сусіди вже пройдені, тому їхні множини вже містять свої лічильники
+        for offset in (left, up):
+            if cells[i + offset] == plant:
+                merge(i, i + offset)
+
+    parent = sets.parent
+    return [(area[i], perimeter[i], sides[i]) for i in grid.positions() if parent[i] == i]
+
+def task_1(regions):
+    return sum(area * perimeter for area, perimeter, _ in regions)
+
+def task_2(regions):
+    return sum(area * sides for area, _, sides in regions)
+
+
+def main(file_path='2024/day12/input.txt'):
+    regions = measure_regions(read_garden(file_path))
+
+    print('Part 1:', task_1(regions))  # 1375476
+    print('Part 2:', task_2(regions))  # 821372
 
 
 if __name__ == '__main__':
@@ -0,0 +1,40 @@
+import unittest
+import script
+
+class TestDay17(unittest.TestCase):
+
+    file_path = '2024/day17/input.txt'
+
+    example = [0, 1, 5, 4, 3, 0]
+    quine = [0, 3, 5, 4, 3, 0]
+    literal_seven = [2, 4, 1, 7, 7, 5, 1, 7, 4, 4, 5, 5, 0, 3, 3, 0]
+
+    def test_run_program_with_example_data(self):
+        self.assertEqual(script.run_program(self.example, 729), [4, 6, 3, 5, 6, 3, 5, 2, 1, 0])
+
+    def test_run_program_with_literal_seven(self):
+        """Операнд 7 у bxl - звичайний літерал, а не зарезервований комбо-операнд."""
+        self.assertEqual(script.run_program(self.literal_seven, 2024), [7, 2, 0, 3])
+
+    def test_compiled_program_matches_interpreter(self):
+        for prog in (self.example, self.quine, self.literal_seven):
+            run = script.compile_program(prog)
+            for a in range(0, 5000, 37):
+                self.assertEqual(run(a), script.run_program(prog, a))
+
+    def test_first_digit_modes_agree(self):
+        for prog in (self.quine, self.literal_seven):
+            functions = [script.first_digit_function(prog, mode) for mode in ("first", "table", "compiled", "interpret")]
+            for a in range(1, 5000, 13):
+                self.assertEqual(len({first_digit(a) for first_digit in functions}), 1)
+
+    def test_find_initial_a_with_example_data(self):
+        self.assertEqual(script.find_initial_a(self.quine, self.quine[::-1]), 117440)
+
+    def test_find_initial_a_with_puzzle_input(self):
+        a, b, c, prog = script.parse_input(self.file_path)
+        result = script.find_initial_a(prog, prog[::-1])
+        self.assertEqual(script.run_program(prog, result), prog)
+
+if __name__ == '__main__':
+    unittest.main()
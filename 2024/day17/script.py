@@ -1,5 +1,9 @@
 from re import findall
 
+ADV, BXL, BST, JNZ, BXC, OUT, BDV, CDV = range(8)
+COMBO = ("0", "1", "2", "3", "a", "b", "c")  # Комбо-операнд 7 зарезервований і не зустрічається
+MAX_WINDOW = 16  # Найширше вікно бітів `a` для таблиці першої цифри (2**16 запусків)
+
 def parse_input(file_path):
     """
     Розбирає вхідний файл і повертає початкові змінні та інструкції програми.
@@ -13,38 +17,194 @@ def run_program(prog, a, b=0, c=0):
     """
     Виконує програму з заданими інструкціями та початковим значенням `a`.
     Алгоритм обробляє послідовність команд і змінює стан змінних `a`, `b`, `c`.
-    Це схоже на роботу віртуальної машини.
+    Це схоже на роботу віртуальної машини. Працює для будь-якої програми,
+    тому лишається запасним варіантом для compile_program.
     """
     ip, out = 0, []
     while 0 <= ip < len(prog):
         lit = prog[ip + 1]
-        combo = [0, 1, 2, 3, a, b, c, 99999][prog[ip + 1]]
         match prog[ip]:
-            case 0: a = a // 2 ** combo             # adv: операція поділу `a` на ступінь двійки
             case 1: b = b ^ lit                     # bxl: XOR змінної `b` із літеральним значенням
-            case 2: b = combo % 8                   # bst: залишок від ділення `combo` на 8
             case 3: ip = ip if a == 0 else lit - 2  # jnz: перехід, якщо `a` дорівнює нулю
             case 4: b = b ^ c                       # bxc: XOR між `b` і `c`
-            case 5: out.append(combo % 8)           # out: додати до виходу залишок від ділення
-            case 6: b = a // 2 ** combo             # bdv: поділ `a` на ступінь двійки, запис у `b`
-            case 7: c = a // 2 ** combo             # cdv: поділ `a` на ступінь двійки, запис у `c`
-        
+            case op:
+                # Комбо-операнд потрібен лише цим командам; 7 допустимий лише як літерал (bxl, jnz)
+                combo = lit if lit < 4 else a if lit == 4 else b if lit == 5 else c if lit == 6 else None
+                match op:
+                    case 0: a = a >> combo          # adv: операція поділу `a` на ступінь двійки
+                    case 2: b = combo % 8           # bst: залишок від ділення `combo` на 8
+                    case 5: out.append(combo % 8)   # out: додати до виходу залишок від ділення
+                    case 6: b = a >> combo          # bdv: поділ `a` на ступінь двійки, запис у `b`
+                    case 7: c = a >> combo          # cdv: поділ `a` на ступінь двійки, запис у `c`
+
         ip += 2  # Перехід до наступної команди
     return out
 
+def loop_body(prog):
+    """
+    Якщо програма - один цикл "тіло; jnz 0" (єдиний перехід стоїть в кінці і веде на початок),
+    повертає тіло як список пар (опкод, операнд), інакше None.
+    """
+    ops = list(zip(prog[::2], prog[1::2]))
+    if not ops or ops[-1] != (JNZ, 0):
+        return None
+    body = ops[:-1]
+    if any(op == JNZ for op, _ in body):
+        return None
+    if any(operand == 7 for op, operand in body if op not in (BXL, JNZ)):
+        return None
+    return body
+
+def statement(op, operand):
+    """Рядок Python для однієї інструкції (ділення на 2**combo - це зсув)."""
+    combo = COMBO[operand] if operand < 7 else None
+    return {
+        ADV: f"a >>= {combo}",
+        BXL: f"b ^= {operand}",
+        BST: f"b = {combo} & 7",
+        BXC: "b ^= c",
+        OUT: f"append({combo} & 7)",
+        BDV: f"b = a >> {combo}",
+        CDV: f"c = a >> {combo}",
+    }[op]
+
+def compile_source(source, name):
+    namespace = {}
+    exec(compile(source, f"<day17 {name}>", "exec"), namespace)
+    return namespace[name]
+
+def compile_program(prog):
+    """
+    Компілює програму в функцію run(a, b=0, c=0) -> список виходів.
+    Для програм-циклів генерується текст Python без диспетчеризації команд:
+    тіло циклу - прямі присвоєння регістрам-локальним змінним. Компіляція виконується один раз,
+    після чого функцію можна запускати для будь-якої кількості кандидатів.
+    Інші програми виконуються інтерпретатором run_program.
+    """
+    body = loop_body(prog)
+    if body is None:
+        return lambda a, b=0, c=0: run_program(prog, a, b, c)
+
+    lines = ["def run(a, b=0, c=0):", "    out = []", "    append = out.append", "    while True:"]
+    lines += ["        " + statement(op, operand) for op, operand in body]
+    lines += ["        if a == 0:", "            return out"]
+    return compile_source("\n".join(lines), "run")
+
+def compile_first_output(prog):
+    """
+    Швидкий шлях: функція first_output(a, b=0, c=0), що виконує лише першу ітерацію циклу
+    до першої команди out і повертає першу цифру виходу (None, якщо виходу немає).
+    """
+    body = loop_body(prog)
+    out_index = next((i for i, (op, _) in enumerate(body or ()) if op == OUT), None)
+    if out_index is None:
+        run = compile_program(prog)
+        return lambda a, b=0, c=0: next(iter(run(a, b, c)), None)
+
+    lines = ["def first_output(a, b=0, c=0):"]
+    lines += ["    " + statement(op, operand) for op, operand in body[:out_index]]
+    lines.append(f"    return {COMBO[body[out_index][1]]} & 7")
+    return compile_source("\n".join(lines), "first_output")
+
+# Cкладність: O(k), де k — кількість команд тіла циклу
+def first_output_window(prog):
+    """
+    Символьний аналіз першої ітерації: від скількох молодших бітів початкового `a` залежить перша цифра.
+
+    Для кожного регістра відстежується пара (малий, вікно): чи значення гарантовано менше 8
+    і від бітів `a` нижче якої позиції залежать його молодші 3 біти (для малих - усе значення).
+    Зсув `a` вправо на s дає вікно зсув + s + 3; зсув на регістр допустимий лише для малого регістра (s <= 7).
+    XOR об'єднує вікна, `% 8` робить значення малим.
+    Повертає ширину вікна або None, якщо аналіз не вдається (тоді цифра може залежати від усіх бітів).
+    """
+    body = loop_body(prog)
+    if body is None:
+        return None
+
+    offset = 0  # На скільки вже зсунуто `a` в цій ітерації
+    registers = {"b": (True, 0), "c": (True, 0)}  # Початкові b = c = 0
+
+    def value(operand):
+        if operand < 4:
+            return True, 0
+        if operand == 4:
+            return False, offset + 3
+        return registers[COMBO[operand]]
+
+    def shift_window(operand):
+        if operand < 4:
+            return offset + operand + 3
+        small, window = value(operand)
+        if not small:
+            return None
+        return max(offset + 7 + 3, window)
+
+    for op, operand in body:
+        if op == ADV:
+            if operand >= 4:
+                return None
+            offset += operand
+        elif op == BXL:
+            pass
+        elif op == BST:
+            registers["b"] = (True, value(operand)[1])
+        elif op == BXC:
+            (b_small, b_window), (c_small, c_window) = registers["b"], registers["c"]
+            registers["b"] = (b_small and c_small, max(b_window, c_window))
+        elif op in (BDV, CDV):
+            window = shift_window(operand)
+            if window is None:
+                return None
+            registers["b" if op == BDV else "c"] = (False, window)
+        elif op == OUT:
+            return value(operand)[1]
+    return None
+
+def first_digit_table(prog):
+    """
+    Обмеження на кожну цифру виходу у вигляді таблиці: молодші window бітів `a` -> перша цифра.
+    Таблицю будує швидкий шлях один раз на 2**window значень, а пошук далі лише читає її.
+    Повертає (таблиця, маска) або None, якщо вікно невідоме або завелике.
+    """
+    window = first_output_window(prog)
+    if window is None or window > MAX_WINDOW:
+        return None
+    first_output = compile_first_output(prog)
+    return [first_output(a) for a in range(1 << window)], (1 << window) - 1
+
+def first_digit_function(prog, mode="first"):
+    """
+    Функція a -> перша цифра виходу для пошуку в find_initial_a.
+    mode: "first" - одна ітерація циклу (за замовчуванням), "table" - символьна таблиця (з відкатом на "first"),
+    "compiled" - повний запуск скомпільованої програми, "interpret" - повний запуск run_program.
+    """
+    if mode == "table":
+        table = first_digit_table(prog)
+        if table is None:
+            return first_digit_function(prog, "first")
+        digits, mask = table
+        return lambda a: digits[a & mask]
+    if mode == "first":
+        return compile_first_output(prog)
+    run = compile_program(prog) if mode == "compiled" else (lambda a: run_program(prog, a))
+    return lambda a: next(iter(run(a)), None)
+
 # Cкладність у найгіршому випадку: O(8**d), де d — глибина рекурсії.
-def find_initial_a(prog, target, a=0, depth=0):
+def find_initial_a(prog, target, a=0, depth=0, first_digit=None):
     """
     Знаходить початкове значення `a`, яке дає бажаний вихідний результат.
-    Використовує деревоподібний рекурсивний пошук для перевірки можливих значень `a`.
+    Використовує деревоподібний рекурсивний пошук для перевірки можливих значень `a`:
+    кожна ітерація циклу зсуває `a` на 3 біти, тому цифри виходу підбираються з кінця,
+    і для кандидата достатньо знати лише першу цифру його виходу.
     """
+    if first_digit is None:
+        first_digit = first_digit_function(prog)
     if depth == len(target):  # Якщо всі елементи цілі досягнуті, повертаємо `a`
         return a
 
     for i in range(8):
-        output = run_program(prog, a * 8 + i)
-        if output and output[0] == target[depth]:
-            result = find_initial_a(prog, target, a * 8 + i, depth + 1)
+        if first_digit(a * 8 + i) == target[depth]:
+            result = find_initial_a(prog, target, a * 8 + i, depth + 1, first_digit)
             if result:
                 return result
     return 0
@@ -53,7 +213,7 @@ def main(file_path='2024/day17/input.txt'):
     a, b, c, prog = parse_input(file_path)
 
     # Частина 1
-    part1_output = run_program(prog, a, b, c)
+    part1_output = compile_program(prog)(a, b, c)
     print("Part 1:", ",".join(map(str, part1_output)))
 
     # Частина 2
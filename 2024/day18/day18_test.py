@@ -0,0 +1,30 @@
+import unittest
+import script
+
+class TestDay18(unittest.TestCase):
+
+    file_path = '2024/day18/input.txt'
+
+    example = [(5, 4), (4, 2), (4, 5), (3, 0), (2, 1), (6, 3), (2, 4), (1, 5), (0, 6), (3, 3), (2, 6), (5, 1), (1, 2),
+               (5, 5), (2, 5), (6, 5), (1, 4), (0, 4), (6, 4), (1, 1), (6, 1), (1, 0), (0, 5), (1, 6), (2, 0)]
+
+    def test_part1_with_example_data(self):
+        self.assertEqual(script.find_shortest_path(self.example, (6, 6), 12), 22)
+
+    def test_part2_with_example_data(self):
+        self.assertEqual(self.example[script.find_blocking_byte(self.example, 6)], (6, 1))
+
+    def test_no_blocking_byte(self):
+        """Поки шлях не перекрито, find_blocking_byte повертає None, а main це показує."""
+        self.assertIsNone(script.find_blocking_byte(self.example[:12], 6))
+
+    def test_part1_with_puzzle_input(self):
+        data = script.load_data(self.file_path)
+        self.assertEqual(script.find_shortest_path(data, (70, 70), 1024), 260)
+
+    def test_part2_with_puzzle_input(self):
+        data = script.load_data(self.file_path)
+        self.assertEqual(data[script.find_blocking_byte(data, 70)], (24, 48))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,78 +1,113 @@
+import sys
+from pathlib import Path
+
+# Прямий запуск `python 2024/day18/script.py`: пакет aoc лежить у корені репозиторію
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc import search
+from aoc.grid import Grid
+from aoc.inputs import cached
+from aoc.unionfind import GridConnectivity
+
+FREE, CORRUPTED = ord("."), ord("#")
+BYTE_COUNTS = {6: 12, 70: 1024}  # Розмір поля -> кількість байтів для першої частини (приклад і основний вхід)
+
+
+def read_points(source):
+    return source.int_tuples(2)
+
 def load_data(file_path):
-    with open(file_path, 'r') as file:
-        return [*map(eval, file)]
+    """Зчитує координати байтів як список пар (x, y); розбір кешується за вмістом файлу (aoc.inputs.cached)."""
+    return cached(file_path, read_points)
+
+def grid_size(data):
+    """Найбільша координата поля: 6 у прикладі, 70 в основному вході."""
+    return max(max(x, y) for x, y in data)
+
+def build_grid(size, data=(), count=0):
+    """Поле (size + 1) x (size + 1) з першими count байтами, що вже впали."""
+    grid = Grid.from_lines([b"." * (size + 1)] * (size + 1))
+    for x, y in data[:count]:
+        grid[grid.index(y, x)] = CORRUPTED
+    return grid
 
 # Складість: O(V + E), де: V — кількість вершин, E — кількість ребер
 def find_shortest_path(data, target_coordinates, start_index):
     """
     Знайти найкоротший шлях від початку (0,0) до заданих координат
-    за допомогою алгоритму пошуку в ширину (BFS).
+    за допомогою алгоритму пошуку в ширину (BFS) з aoc.search.
+    Поле (0,0)..target_coordinates зберігається сіткою aoc.grid, а стани пошуку - плоскі індекси клітинок.
 
     Параметри:
     - data: Список точок.
     - target_coordinates: Кортеж, що представляє цільові координати (x, y).
-    - start_index: Індекс, з якого почати обробку даних.
+    - start_index: Скільки перших байтів з data вже впало.
 
     Повертає:
-    - Найкоротшу відстань до target_coordinates.
+    - Найкоротшу відстань до target_coordinates або None, якщо шляху немає.
     """
-    seen_points = set(data[:start_index])  # Сет вже оброблених точок
-    queue = [(0, (0, 0))]  # Черга з кортежів (відстань, координати)
-
-    while queue:
-        current_distance, (current_x, current_y) = queue.pop(0)
-
-        if (current_x, current_y) == target_coordinates:
-            return current_distance
-
-        # Досліджуємо сусідні точки
-        for neighbor_x, neighbor_y in [
-            (current_x, current_y + 1),
-            (current_x, current_y - 1),
-            (current_x + 1, current_y),
-            (current_x - 1, current_y),
-        ]:
-            if (
-                (neighbor_x, neighbor_y) not in seen_points
-                and 0 <= neighbor_x <= 70
-                and 0 <= neighbor_y <= 70
-            ):
-                queue.append((current_distance + 1, (neighbor_x, neighbor_y)))
-                seen_points.add((neighbor_x, neighbor_y))  # Маркуємо точку як відвідану
-
-    return None  # Якщо шлях не знайдено
-
-# Складість: O(log n), де n — кількість елементів в списку
-def binary_search_for_target(data, target_coordinates):
-    """
-    Виконати бінарний пошук для знаходження індексу.
+    grid = build_grid(max(target_coordinates), data, start_index)
+    cells = grid.cells
+    offsets = grid.offsets4
+    target = grid.index(target_coordinates[1], target_coordinates[0])
 
-    Параметри:
-    - data: Список точок.
-    - target_coordinates: Кортеж, що представляє цільові координати (x, y).
+    def neighbours(i):
+        return [i + offset for offset in offsets if cells[i + offset] == FREE]
 
-    Повертає:
-    - Iндекс у списку даних.
-    """
-    left, right = 1024, len(data)  # Початкові межі пошуку
+    return search.bfs([grid.index(0, 0)], neighbours, is_goal=lambda i: i == target, size=len(cells)).cost
 
-    while left < right - 1:
-        mid = (left + right) // 2  # Знаходимо середину
-        if find_shortest_path(data, target_coordinates, mid):  # Перевіряємо наявність шляху
-            left = mid  # Якщо шлях є, рухаємо ліву межу вправо
-        else:
-            right = mid  # Якщо шляху немає, рухаємо праву межу вліво
+# Складість: O((V + n) * α(V)), де V — кількість клітинок поля, n — кількість байтів
+def find_blocking_byte(data, size):
+    """
+    Знайти перший байт, після падіння якого шляху з (0,0) до (size,size) більше немає.
 
-    return left
+    Офлайн-підхід: спочатку падають усі байти, а потім байти "прибираються" у зворотному порядку.
+    Вільні клітинки з'єднуються в union-find, тому прибирання байта - це лише об'єднання
+    клітинки з вільними сусідами. Перший прибраний байт, після якого старт і фініш
+    опинились в одній компоненті, і є шуканим.
 
-def main(file_path='2024/day18/input.txt'):
+    Повертає:
+    - Iндекс байта в data або None, якщо шлях не перекривається зовсім.
+    """
+    grid = build_grid(size)
+    # Клітинка вільна до падіння першого байта на неї, тому повтори координат не заважають
+    first_fall = {}
+    for index, (x, y) in enumerate(data):
+        first_fall.setdefault(grid.index(y, x), index)
+
+    connectivity = GridConnectivity(grid)
+    for i in grid.positions():
+        if i not in first_fall:
+            connectivity.activate(i)
+
+    start, end = grid.index(0, 0), grid.index(size, size)
+    if connectivity.connected(start, end):
+        return None
+
+    for index in range(len(data) - 1, -1, -1):
+        x, y = data[index]
+        cell = grid.index(y, x)
+        if first_fall[cell] != index:
+            continue
+        connectivity.activate(cell)
+        if connectivity.connected(start, end):
+            return index
+
+    return None
+
+def main(file_path='2024/day18/input.txt', size=None, byte_count=None):
     data = load_data(file_path)
-    target_coordinates = (70, 70)
+    size = grid_size(data) if size is None else size
+    byte_count = BYTE_COUNTS.get(size, 1024) if byte_count is None else byte_count
 
-    print("Part 1:", find_shortest_path(data, target_coordinates, 1024)) # 260
+    print("Part 1:", find_shortest_path(data, (size, size), byte_count)) # 260
 
-    optimal_index = binary_search_for_target(data, target_coordinates)
-    print("Part 2:", *data[optimal_index], sep=',')                      # 24,48
+    blocking_index = find_blocking_byte(data, size)
+    if blocking_index is None:
+        print("Part 2: жоден байт не перекриває шлях")
+    else:
+        print("Part 2: {},{}".format(*data[blocking_index]))             # 24,48
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,43 @@
+import multiprocessing
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import script
+from aoc.runner import Day, load_module
+
+class TestDay19(unittest.TestCase):
+
+    file_path = '2024/day19/input.txt'
+
+    patterns = ['r', 'wr', 'b', 'g', 'bwu', 'rb', 'gb', 'br']
+    designs = ['brwrr', 'bggr', 'gbbr', 'rrbgbr', 'ubwu', 'bwurrg', 'brgr', 'bbrwb']
+
+    def test_count_designs_with_example_data(self):
+        self.assertEqual(script.count_designs(self.patterns, self.designs), [2, 1, 4, 6, 0, 1, 2, 0])
+
+    def test_calculate_results_with_example_data(self):
+        self.assertEqual(script.calculate_results(self.patterns, self.designs), (6, 16))
+
+    def test_process_pool_matches_single_process(self):
+        self.assertEqual(script.count_designs(self.patterns, self.designs, workers=2, chunksize=2),
+                         script.count_designs(self.patterns, self.designs, workers=1))
+
+    def test_process_pool_when_loaded_by_runner(self):
+        """Під aoc.runner модуль імпортується як aoc.days.y2024_day19, а не script."""
+        module = load_module(Day(2024, 19, Path('2024/day19/script.py')))
+        self.assertEqual(module.count_designs(self.patterns, self.designs, workers=2, chunksize=2),
+                         [2, 1, 4, 6, 0, 1, 2, 0])
+
+    def test_spawned_workers_find_day_functions(self):
+        """З методом запуску spawn воркер імпортує модуль дня за іменем, а не успадковує його."""
+        module = load_module(Day(2024, 19, Path('2024/day19/script.py')))
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context,
+                                 initializer=module._init_worker, initargs=(self.patterns,)) as pool:
+            self.assertEqual(list(pool.map(module._count_design, self.designs)), [2, 1, 4, 6, 0, 1, 2, 0])
+
+    def test_results_with_puzzle_input(self):
+        self.assertEqual(script.calculate_results(*script.read_input(self.file_path)), (330, 950763269786650))
+
+if __name__ == '__main__':
+    unittest.main()
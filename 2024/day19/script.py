@@ -1,4 +1,4 @@
-from functools import cache
+from concurrent.futures import ProcessPoolExecutor
 
 def read_input(file_path):
     """Читання та обробка вхідних даних з файлу."""
@@ -7,22 +7,71 @@ def read_input(file_path):
     patterns, designs = lines[0].split(", "), lines[2:]
     return patterns, designs
 
-@cache
-def count_combos(d, patterns):
-    """Рекурсивно обчислюємо кількість комбінацій для заданого дизайну."""
-    if not d:
-        return 1
-    return sum(count_combos(d[len(p):], patterns) for p in patterns if d.startswith(p))
+# Складність: O(P), де P — сумарна довжина візерунків
+def build_trie(patterns):
+    """
+    Префіксне дерево візерунків рушників, зібране один раз.
+    children[k] - словник символ -> номер дочірнього вузла, terminal[k] - чи закінчується тут візерунок.
+    """
+    children, terminal = [{}], [False]
+    for pattern in patterns:
+        node = 0
+        for char in pattern:
+            if char not in children[node]:
+                children[node][char] = len(children)
+                children.append({})
+                terminal.append(False)
+            node = children[node][char]
+        terminal[node] = True
+    return children, terminal
 
-def calculate_results(patterns, designs):
+# Складність: O(n * L), де n — довжина дизайну, L — довжина найдовшого візерунка
+def count_combos(design, trie):
+    """
+    Кількість способів скласти дизайн з візерунків - динаміка знизу вгору:
+    ways[i] - кількість способів скласти суфікс design[i:]. З кожної позиції i йдемо
+    деревом по символах дизайну; кожен кінцевий вузол на глибині j - i додає ways[j].
+    """
+    children, terminal = trie
+    n = len(design)
+    ways = [0] * (n + 1)
+    ways[n] = 1
+    for i in range(n - 1, -1, -1):
+        node, total = 0, 0
+        for j in range(i, n):
+            node = children[node].get(design[j])
+            if node is None:
+                break
+            if terminal[node]:
+                total += ways[j + 1]
+        ways[i] = total
+    return ways[0]
+
+# Дерево передається в кожен процес один раз через initializer.
+_worker_trie = None
+
+def _init_worker(patterns):
+    global _worker_trie
+    _worker_trie = build_trie(patterns)
+
+def _count_design(design):
+    return count_combos(design, _worker_trie)
+
+def count_designs(patterns, designs, workers=1, chunksize=16):
+    """
+    Кількість комбінацій для кожного дизайну. Дизайни незалежні, тому при workers > 1
+    вони розподіляються між процесами пачками по chunksize.
+    """
+    if workers <= 1:
+        trie = build_trie(patterns)
+        return [count_combos(design, trie) for design in designs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(patterns,)) as pool:
+        return list(pool.map(_count_design, designs, chunksize=chunksize))
+
+def calculate_results(patterns, designs, workers=1):
     """Обчислюємо результати для кожного дизайну."""
-    result1, result2 = 0, 0
-    for d in designs:
-        count = count_combos(d, tuple(patterns))
-        if count:
-            result1 += 1
-            result2 += count
-    return result1, result2
+    counts = count_designs(patterns, designs, workers)
+    return sum(count > 0 for count in counts), sum(counts)
 
 def main(file_path="2024/day19/input.txt"):
     result1, result2 = calculate_results(*read_input(file_path))
@@ -30,4 +79,4 @@ def main(file_path="2024/day19/input.txt"):
     print("Part 2:", result2) # 950763269786650
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
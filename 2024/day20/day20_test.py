@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import script
+
+class TestDay20(unittest.TestCase):
+
+    file_path = '2024/day20/input.txt'
+
+    example = ['###############',
+               '#...#...#.....#',
+               '#.#.#.#.#.###.#',
+               '#S#...#.#.#...#',
+               '#######.#.#.###',
+               '#######.#.#...#',
+               '#######.#.###.#',
+               '###..E#...#...#',
+               '###.#######.###',
+               '#...###...#...#',
+               '#.#####.#.###.#',
+               '#.#...#.#.#...#',
+               '#.#.#.#.#.#.###',
+               '#...#...#...###',
+               '###############']
+
+    def setUp(self):
+        fd, self.example_path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as file:
+            file.write('\n'.join(self.example))
+
+    def tearDown(self):
+        os.remove(self.example_path)
+
+    def test_task1_with_example_data(self):
+        self.assertEqual(script.task_1(self.example_path, min_saving=2), 44)
+        self.assertEqual(script.task_1(self.example_path, min_saving=64), 1)
+
+    def test_task2_with_example_data(self):
+        self.assertEqual(script.task_2(self.example_path, min_saving=50), 285)
+        self.assertEqual(script.task_2(self.example_path, min_saving=76), 3)
+
+    def test_python_path_matches_numpy_path(self):
+        """Гілка без NumPy (np is None) рахує те саме, що й векторна."""
+        grid, start, end = script.read_input(self.example_path)
+        path = script.trace_path(grid, start, end)
+        cases = [(2, 2), (2, 20), (20, 50), (20, 72)]
+        expected = [script.count_cheats(grid, path, radius, min_saving) for radius, min_saving in cases]
+        with patch.object(script, 'np', None):
+            actual = [script.count_cheats(grid, path, radius, min_saving) for radius, min_saving in cases]
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual, [44, 5, 285, 29])
+
+    def test_part1_with_puzzle_input(self):
+        self.assertEqual(script.task_1(self.file_path), 1389)
+
+    def test_part2_with_puzzle_input(self):
+        self.assertEqual(script.task_2(self.file_path), 1005068)
+
+if __name__ == '__main__':
+    unittest.main()
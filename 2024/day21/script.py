@@ -1,5 +1,4 @@
 from functools import cache
-from itertools import permutations
 
 def read_input(file_path):
     """Читає вхідні дані з файлу та повертає список рядків."""
@@ -22,57 +21,69 @@ dir_keypad = create_keypad(DIR_KEYPAD_LAYOUT)
 # Визначення напрямків руху
 directions = {'^': (0, -1), '>': (1, 0), 'v': (0, 1), '<': (-1, 0)}
 
-# У найгіршому випадку складність цього алгоритму може бути O(n!), де n — кількість елементів у послідовності кнопок
-@cache
-def calculate_presses(sequence, depth=2, use_dir_keypad=False, current_position=None):
+def move_sequences(keypad, start, end):
     """
-    Обчислює мінімальну кількість натискань кнопок для послідовності з урахуванням руху по клавіатурі.
-    Використовує кешування для покращення ефективності.
-
-    sequence - послідовність кнопок для натискання
-    depth - глибина рекурсії (кількість роботів)
-    use_dir_keypad - чи використовувати напрямкову клавіатуру
-    current_position - поточна позиція на клавіатурі
+    Кандидати на найкоротший рух руки від кнопки start до кнопки end: спочатку всі кроки
+    по горизонталі, потім по вертикалі, або навпаки. Зигзаги ніколи не кращі - кожна зміна
+    напрямку коштує роботу вище за рівнем зайвих натискань. Шляхи через дірку відкидаються.
     """
-    keypad = dir_keypad if use_dir_keypad else num_keypad
-    if not sequence:
-        return 0  # Якщо послідовність порожня, натискати нічого не потрібно
-    if not current_position:
-        current_position = keypad['A']  # Початкова позиція - 'A'
+    (x, y), (target_x, target_y) = keypad[start], keypad[end]
+    horizontal = ('>' if target_x > x else '<') * abs(target_x - x)
+    vertical = ('v' if target_y > y else '^') * abs(target_y - y)
+    cells = set(keypad.values())
+
+    sequences = []
+    for moves in {horizontal + vertical, vertical + horizontal}:
+        position_x, position_y = x, y
+        for button in moves:
+            move_x, move_y = directions[button]
+            position_x, position_y = position_x + move_x, position_y + move_y
+            if (position_x, position_y) not in cells:
+                break  # Рука зависла б над діркою
+        else:
+            sequences.append(moves)
+    return sequences
 
-    current_x, current_y = current_position
-    target_x, target_y = keypad[sequence[0]]  # Цільова позиція для першої кнопки
-    delta_x, delta_y = target_x - current_x, target_y - current_y  # Різниця в координатах
+def sequence_cost(costs, sequence):
+    """Кількість натискань людини, щоб робот набрав sequence, починаючи з кнопки 'A'."""
+    return sum(costs[previous, button] for previous, button in zip('A' + sequence, sequence))
+
+def keypad_costs(keypad, lower_costs):
+    """
+    Таблиця вартостей для клавіатури: для кожної пари кнопок (a, b) - найменша кількість натискань
+    людини, щоб рука робота перейшла з a на b і натиснула b. Роботом керують через напрямкову
+    клавіатуру з таблицею lower_costs, тому вартість руху - вартість набору "рухи + 'A'" рівнем нижче.
+    Складність: O(k**2), де k - кількість кнопок (5 для напрямкової, 11 для цифрової).
+    """
+    return {(a, b): min(sequence_cost(lower_costs, moves + 'A') for moves in move_sequences(keypad, a, b))
+            for a in keypad for b in keypad}
 
-    button_sequence = ''
-    if delta_x > 0:
-        button_sequence += '>' * delta_x  # Додати переміщення вправо
-    elif delta_x < 0:
-        button_sequence += '<' * -delta_x  # Додати переміщення вліво
-    if delta_y > 0:
-        button_sequence += 'v' * delta_y  # Додати переміщення вниз
-    elif delta_y < 0:
-        button_sequence += '^' * -delta_y  # Додати переміщення вгору
+# Складність: O(depth) побудов таблиць 5x5
+@cache
+def directional_costs(depth):
+    """
+    Таблиця для напрямкової клавіатури, над якою depth рівнів.
+    Рівень 0 - кнопки натискає людина: будь-яке натискання коштує 1.
+    Таблиці будуються знизу вгору циклом, тому глибина може бути будь-якою (2, 25, 1000).
+    """
+    costs = {(a, b): 1 for a in dir_keypad for b in dir_keypad}
+    for _ in range(depth):
+        costs = keypad_costs(dir_keypad, costs)
+    return costs
 
-    # Якщо є глибина, рекурсивно обчислюємо для всіх роботів послідовності натискань
-    if depth:
-        perm_lengths = []
-        for perm in set(permutations(button_sequence)):  # Генерація всіх унікальних перестановок кнопок
-            temp_x, temp_y = current_position
-            for button in perm:
-                move_x, move_y = directions[button]  # Отримуємо зміщення для кнопки
-                temp_x += move_x
-                temp_y += move_y
-                if (temp_x, temp_y) not in keypad.values():
-                    break  # Якщо нова позиція не на клавіатурі, виходимо з циклу
-            else:
-                perm_lengths.append(calculate_presses(perm + ('A',), depth - 1, True))  # Рекурсивний виклик для наступного етапу
-        min_length = min(perm_lengths)  # Мінімальна кількість натискань для пермутації
-    else:
-        min_length = len(button_sequence) + 1  # Якщо глибина 0, просто додаємо 1 натискання для кнопки 'A'
+@cache
+def numeric_costs(depth):
+    """Таблиця 11x11 для цифрової клавіатури, якою керують через depth роботів на напрямкових клавіатурах."""
+    return keypad_costs(num_keypad, directional_costs(depth))
 
-    # Повертаємо загальну кількість натискань для поточної та наступної послідовності
-    return min_length + calculate_presses(sequence[1:], depth, use_dir_keypad, (target_x, target_y))
+# Складність: O(depth) побудов таблиць (один раз на глибину) + O(len(sequence)) на кожен код
+def calculate_presses(sequence, depth=2):
+    """
+    Обчислює мінімальну кількість натискань кнопок людиною, щоб набрати код sequence
+    на цифровій клавіатурі через depth роботів на напрямкових клавіатурах.
+    Рахуються лише довжини: кожен перехід між кнопками - одне читання з таблиці вартостей.
+    """
+    return sequence_cost(numeric_costs(depth), sequence)
 
 def main(file_path = '2024/day21/input.txt'):
     part1 = 0
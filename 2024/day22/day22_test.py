@@ -0,0 +1,23 @@
+import unittest
+import script
+
+class TestDay22(unittest.TestCase):
+
+    file_path = '2024/day22/input.txt'
+
+    example = [1, 2, 3, 2024]
+
+    def test_python_path_with_example_data(self):
+        self.assertEqual(script.process_buyers_python(self.example), (37990510, 23))
+
+    @unittest.skipIf(script.np is None, "NumPy не встановлений")
+    def test_numpy_path_matches_python_path(self):
+        self.assertEqual(script.process_buyers_numpy(self.example), (37990510, 23))
+        buyers = script.read_buyers(self.file_path)[:50]
+        self.assertEqual(script.process_buyers_numpy(buyers), script.process_buyers_python(buyers))
+
+    def test_process_file_with_puzzle_input(self):
+        self.assertEqual(script.process_file(self.file_path), (17612566393, 1968))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,59 +1,108 @@
-def transform_number(number):
-    """Преобразує число за допомогою заданих математичних операцій."""
-    number = ((number * 64) ^ number) % 16777216
-    number = ((number // 32) ^ number) % 16777216
-    number = ((number * 2048) ^ number) % 16777216
-    return number
-
-def initialize(current_number):
-    """Ініціалізує перших 4 ітерацій."""
-    sliding = 0
-    for _ in range(4):
-        next_number = transform_number(current_number)
-        sliding = sliding * 20 + (next_number % 10) - (current_number % 10)
-        current_number = next_number
-    return current_number, sliding
-
-def process(sliding, current_number, sums, current_seen):
-    """Оновлююмо суми в словнику та перевіряючи унікальність."""
-    if sliding not in current_seen:
-        if sliding not in sums:
-            sums[sliding] = 0
-        sums[sliding] += current_number % 10
-        current_seen.add(sliding)
-    return sums, current_seen
-
-def update_window(sliding, current_number):
-    """Оновлює значення для наступної ітерації."""
-    next_number = transform_number(current_number)
-    sliding = (sliding * 20 + (next_number % 10) - (current_number % 10)) % (20 ** 4)
-    return sliding, next_number
-
-def process_file(file_path):
-    """Основний процес обробки даних з файлу."""
-    total_sum = 0  # Загальна сума
-    sums = {}  # Словник для зберігання сум
-    
+try:
+    import numpy as np
+except ImportError:  # Без NumPy працює чисто пайтонівський шлях
+    np = None
+
+MASK = 16777216 - 1  # Усі операції - за модулем 2**24
+STEPS = 2000         # Кількість нових таємних чисел на покупця
+WINDOW = 19 ** 4     # Зміни ціни -9..9 -> 19 значень, вікно з 4 змін
+
+
+def read_buyers(file_path):
+    """Зчитує початкові таємні числа покупців."""
     with open(file_path, 'r') as file:
-        for line in file:
-            current_number = int(line)
-            current_number, sliding = initialize(current_number)
-            current_seen = set()  # Множина для відстеження вже побачених чисел
-            
-            for i in range(1997):  # Проходимо по 1997 ітераціям, бо перші 4 вже порахували
-                if i == 1996:
-                    total_sum += current_number
-                
-                # Оновлюємо суми і перевіряємо унікальність
-                sums, current_seen = process(sliding, current_number, sums, current_seen)
-                
-                # Оновлюємося для наступної ітерації
-                sliding, current_number = update_window(sliding, current_number)
-
-    return total_sum, max(sums.values(), default=0)
+        return [int(line) for line in file if line.strip()]
+
+
+def process_buyers_python(buyers):
+    """
+    Чистий Python: покупці обробляються по одному.
+    Вікно з 4 змін кодується числом у 19-ковій системі, суми цін лежать у плоскому
+    списку на 19**4 елементів, а замість множини на кожного покупця масив last_seen
+    зберігає номер останнього покупця, для якого вікно вже враховано.
+    Складність: O(n * STEPS + 19**4)
+    """
+    counts = [0] * WINDOW
+    last_seen = [-1] * WINDOW
+    total_sum = 0
+
+    for buyer, number in enumerate(buyers):
+        window = 0
+        price = number % 10
+        for step in range(STEPS):
+            # Множення на 64 і 2048 та ділення на 32 - це зсуви, модуль 2**24 - маска
+            number ^= (number << 6) & MASK
+            number ^= number >> 5
+            number ^= (number << 11) & MASK
+            next_price = number % 10
+            window = (window * 19 + next_price - price + 9) % WINDOW
+            price = next_price
+            if step >= 3 and last_seen[window] != buyer:  # Перше входження вікна для покупця
+                last_seen[window] = buyer
+                counts[window] += price
+        total_sum += number
+
+    return total_sum, max(counts)
+
+
+def generate_prices_numpy(buyers):
+    """
+    Рахує всі таємні числа одночасно для всіх покупців як вектор uint32.
+    Зсуви вліво можуть вийти за 32 біти, але молодші 24 біти при цьому не змінюються,
+    тому маска після зсуву дає правильний результат.
+    Повертає (останні таємні числа, ціни форми (STEPS + 1, n)).
+    """
+    numbers = np.array(buyers, dtype=np.uint32)
+    prices = np.empty((STEPS + 1, len(buyers)), dtype=np.int8)
+    prices[0] = numbers % 10
+    for step in range(1, STEPS + 1):
+        numbers ^= (numbers << 6) & MASK
+        numbers ^= numbers >> 5
+        numbers ^= (numbers << 11) & MASK
+        prices[step] = numbers % 10
+    return numbers, prices
+
+
+def process_buyers_numpy(buyers):
+    """
+    NumPy: таємні числа всіх покупців рахуються разом (2000 векторних кроків замість n * 2000).
+    Індекс вікна з 4 змін будується як цілочисельний масив. Перше входження вікна для покупця
+    знаходиться, як і в чистому Python, через масив позначок на 19**4 елементів: first_seen[вікно] -
+    найраніший час вікна в рядку покупця (np.minimum.at), після рядка торкнуті позначки скидаються.
+    Ціни перших входжень накопичуються в плоский масив на 19**4 елементів через np.bincount.
+    Складність: O(n * STEPS + 19**4)
+    """
+    numbers, prices = generate_prices_numpy(buyers)
+
+    deltas = (prices[1:] - prices[:-1] + 9).astype(np.int32)  # Зміни цін у діапазоні 0..18
+    windows = ((deltas[:-3] * 19 + deltas[1:-2]) * 19 + deltas[2:-1]) * 19 + deltas[3:]
+    windows = np.ascontiguousarray(windows.T)  # Рядок - вікна одного покупця за часом
+
+    times = np.arange(windows.shape[1], dtype=np.int16)
+    never = np.iinfo(np.int16).max
+    first_seen = np.full(WINDOW, never, dtype=np.int16)
+    first = np.empty(windows.shape, dtype=bool)
+    for buyer, row in enumerate(windows):
+        np.minimum.at(first_seen, row, times)
+        first[buyer] = first_seen[row] == times
+        first_seen[row] = never
+
+    window_prices = prices[4:].T  # Ціна в момент завершення вікна
+    counts = np.bincount(windows[first], weights=window_prices[first], minlength=WINDOW)
+    return int(numbers.astype(np.int64).sum()), int(counts.max())
+
+
+def process_file(file_path, use_numpy=None):
+    """Основний процес обробки даних з файлу. За замовчуванням NumPy, якщо він встановлений."""
+    buyers = read_buyers(file_path)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return process_buyers_numpy(buyers)
+    return process_buyers_python(buyers)
 
 def main(file_path = '2024/day22/input.txt'):
-    total_sum, max_window_sum = process_file(file_path)  
+    total_sum, max_window_sum = process_file(file_path)
 
     print(f"Part 1: {total_sum}")       # 17612566393
     print(f"Part 2: {max_window_sum}")  # 1968
@@ -1,80 +1,133 @@
-import timeit
-
 def read_graph(file_path):
     """
     Читає граф з вхідного файлу.
     :param file_path: Шлях до файлу з описом графа.
-    :return: Граф у вигляді словника, де ключі — це вузли, а значення — множини сусідів.
+    :return: Граф у вигляді BitGraph.
     """
     with open(file_path) as file:
-        edges = [line.strip().split("-") for line in file.readlines()]
+        edges = [line.strip().split("-") for line in file if line.strip()]
+    return BitGraph(edges)
+
+def bits(mask):
+    """Номери встановлених бітів маски від молодшого до старшого."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitGraph:
+    """
+    Неорієнтований граф з вузлами-числами 0..n-1: names[v] - ім'я вузла, index[name] - його номер.
+    Сусіди вузла v - біти числа adjacency[v], тому перетин множин сусідів - одна операція `&`,
+    а розмір множини - int.bit_count().
+    """
+
+    def __init__(self, edges):
+        self.names = sorted({name for edge in edges for name in edge})
+        self.index = {name: v for v, name in enumerate(self.names)}
+        self.adjacency = [0] * len(self.names)
+        for a, b in edges:
+            a, b = self.index[a], self.index[b]
+            self.adjacency[a] |= 1 << b
+            self.adjacency[b] |= 1 << a
+
+    def mask(self, predicate):
+        """Маска вузлів, ім'я яких задовольняє predicate."""
+        return sum(1 << v for v, name in enumerate(self.names) if predicate(name))
+
+    # Складність: O(m * n / w), де m — кількість ребер, w — розмір машинного слова
+    def count_triangles(self, within=-1):
+        """
+        Кількість трикутників u < v < w, усі вершини яких лежать у масці within.
+        Кожен трикутник рахується один раз: для ребра (u, v) беремо лише спільних сусідів з номером > v.
+        """
+        adjacency = self.adjacency
+        total = 0
+        for u in bits(within & ((1 << len(adjacency)) - 1)):
+            neighbours = adjacency[u] & within
+            for v in bits(neighbours >> (u + 1) << (u + 1)):
+                total += (neighbours & adjacency[v] >> (v + 1) << (v + 1)).bit_count()
+        return total
+
+    # Складність: O(n + m) - черга з корзин за степенями
+    def degeneracy_order(self):
+        """Порядок виродженості: щоразу вилучаємо вершину з найменшим степенем серед решти."""
+        adjacency = self.adjacency
+        degree = [neighbours.bit_count() for neighbours in adjacency]
+        buckets = [set() for _ in range(max(degree, default=0) + 1)]
+        for v, d in enumerate(degree):
+            buckets[d].add(v)
+
+        removed = 0
+        order = []
+        lowest = 0
+        for _ in range(len(adjacency)):
+            lowest = max(lowest - 1, 0)  # Після вилучення степінь сусідів падає щонайбільше на 1
+            while not buckets[lowest]:
+                lowest += 1
+            v = buckets[lowest].pop()
+            order.append(v)
+            removed |= 1 << v
+            for u in bits(adjacency[v] & ~removed):
+                buckets[degree[u]].remove(u)
+                degree[u] -= 1
+                buckets[degree[u]].add(u)
+        return order
+
+    # Складність у гіршому випадку O(d * n * 3**(d/3)), де d — виродженість графа
+    def max_clique(self):
+        """
+        Найбільша кліка алгоритмом Брона-Кербоша на бітових масках:
+        - зовнішній цикл іде в порядку виродженості, тому P на верхньому рівні не більше d вершин;
+        - півот - вершина з P ∪ X з найбільшою кількістю сусідів у P;
+        - гілка відсікається, якщо навіть |R| + |P| не перевищує вже знайдену кліку.
+        Повертає список номерів вершин.
+        """
+        adjacency = self.adjacency
+        best = []
+
+        def expand(clique, candidates, excluded):
+            nonlocal best
+            if not candidates:
+                if not excluded and len(clique) > len(best):
+                    best = clique
+                return
+            if len(clique) + candidates.bit_count() <= len(best):
+                return
+            pivot = max(bits(candidates | excluded), key=lambda u: (candidates & adjacency[u]).bit_count())
+            for v in bits(candidates & ~adjacency[pivot]):
+                bit = 1 << v
+                expand(clique + [v], candidates & adjacency[v], excluded & adjacency[v])
+                candidates &= ~bit
+                excluded |= bit
+                if len(clique) + candidates.bit_count() <= len(best):
+                    return
 
-    graph = {}
-    for edge in edges:
-        # Додаємо ребра до графа, забезпечуючи двосторонній зв'язок.
-        graph.setdefault(edge[0], set()).add(edge[1])
-        graph.setdefault(edge[1], set()).add(edge[0])
+        earlier = 0
+        for v in self.degeneracy_order():
+            expand([v], adjacency[v] & ~earlier, adjacency[v] & earlier)
+            earlier |= 1 << v
+        return best
 
-    return graph
 
-# Складність у гіршому випадку: O(n**3), де n — кількість вузлів.
-# Більш ефективний алгоритм, алгоритм Еджері, має складність O(m**3/2) для розріджених графів,
-# але у мене час на виконання стає більшим, тому залишився на цьому.
 def count_triangle_subgraphs_with_t(graph):
     """
     Рахує кількість трикутних підграфів, що містять хоча б один вузол, ім'я якого починається з 't'.
-    :param graph: Вхідний граф у вигляді словника.
+    Це всі трикутники мінус трикутники, що цілком лежать серед вузлів без 't'.
+    :param graph: Вхідний граф у вигляді BitGraph.
     :return: Кількість трикутних підграфів.
     """
-    triangle_count = 0
-    visited = set()
-
-    for node in graph:
-        neighbors = list(graph[node])
-        for i in range(len(neighbors)):
-            for j in range(i + 1, len(neighbors)):
-                # Перевіряємо, чи є ребро між сусідами.
-                if neighbors[j] in graph[neighbors[i]]:
-                    triangle = frozenset([node, neighbors[i], neighbors[j]])
-                    if triangle not in visited:
-                        visited.add(triangle)
-                        # Перевіряємо, чи є вузол, ім'я якого починається з 't'.
-                        if any(v.startswith("t") for v in triangle):
-                            triangle_count += 1
-    return triangle_count
-
-# Складність у гіршому випадку O(3**n/3), де n — кількість вузлів.
+    without_t = graph.mask(lambda name: not name.startswith("t"))
+    return graph.count_triangles() - graph.count_triangles(without_t)
+
 def find_largest_fully_connected_subgraph(graph):
     """
     Знаходить найбільший повністю зв'язний підграф (кліку) у графі.
-    Використовує оптимізований алгоритм Брона-Кербоша з півотуванням.
-    Алгоритм Брона-Кербоша є одним із найефективніших для пошуку клік у розріджених графах. 
-    :param graph: Вхідний граф у вигляді словника.
+    :param graph: Вхідний граф у вигляді BitGraph.
     :return: Найбільша кліка у вигляді відсортованого рядка вузлів.
     """
-    def bron_kerbosch_with_pivot(r, p, x):
-        """
-        Рекурсивний метод для пошуку за алгоритмом Брона-Кербоша.
-        :param r: Поточний вузол.
-        :param p: Кандидати для розширення.
-        :param x: Вузли, що вже виключені.
-        """
-        nonlocal max_clique
-        if not p and not x:
-            if len(r) > len(max_clique):
-                max_clique = r
-            return
-        # Вибираємо півот-вузол з найбільшою кількістю сусідів.
-        u = next(iter(p.union(x)))
-        for v in list(p - graph[u]):
-            bron_kerbosch_with_pivot(r.union([v]), p.intersection(graph[v]), x.intersection(graph[v]))
-            p.remove(v)
-            x.add(v)
-
-    max_clique = set()
-    nodes = set(graph.keys())
-    bron_kerbosch_with_pivot(set(), nodes, set())
-    return ",".join(sorted(max_clique))
+    return ",".join(sorted(graph.names[v] for v in graph.max_clique()))
 
 def main(file_path="2024/day23/input.txt"):
     graph = read_graph(file_path)
@@ -82,8 +135,6 @@ def main(file_path="2024/day23/input.txt"):
     part1_result = count_triangle_subgraphs_with_t(graph)
     part2_result = find_largest_fully_connected_subgraph(graph)
 
-    # print(f"Part 1 (ms): {timeit.timeit(lambda: count_triangle_subgraphs_with_t(graph), number=1) * 1000:.2f}")
-    # print(f"Part 2 (ms): {timeit.timeit(lambda: find_largest_fully_connected_subgraph(graph), number=1) * 1000:.2f}")
     print(f"Part 1 result: {part1_result}") # 1200
     print(f"Part 2 result: {part2_result}") # ag,gh,hh,iv,jx,nq,oc,qm,rb,sm,vm,wu,zr
 
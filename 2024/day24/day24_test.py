@@ -0,0 +1,46 @@
+import unittest
+import script
+
+class TestDay24(unittest.TestCase):
+
+    file_path = '2024/day24/input.txt'
+
+    example_inputs = [('x00', 1), ('x01', 1), ('x02', 1), ('y00', 0), ('y01', 1), ('y02', 0)]
+    example_gates = [('x00', 'AND', 'y00', 'z00'),
+                     ('x01', 'XOR', 'y01', 'z01'),
+                     ('x02', 'OR', 'y02', 'z02')]
+
+    def test_evaluate_with_example_data(self):
+        netlist = script.Netlist(self.example_inputs, self.example_gates)
+        self.assertEqual(netlist.read_bus(netlist.evaluate(), 'z'), 4)
+
+    def test_evaluate_batch_matches_evaluate(self):
+        netlist = script.Netlist(self.example_inputs, self.example_gates)
+        x_bus, y_bus = netlist.bus('x'), netlist.bus('y')
+        xs, ys = list(range(8)), [7 - x for x in range(8)]
+        expected = []
+        for x, y in zip(xs, ys):
+            inputs = {wire: x >> bit & 1 for bit, wire in enumerate(x_bus)}
+            inputs.update({wire: y >> bit & 1 for bit, wire in enumerate(y_bus)})
+            expected.append(netlist.read_bus(netlist.evaluate(inputs), 'z'))
+        self.assertEqual(netlist.evaluate_batch(xs, ys), expected)
+
+    def test_faulty_output_bits_with_puzzle_input(self):
+        netlist = script.Netlist.from_file(self.file_path)
+        self.assertNotEqual(netlist.faulty_output_bits(), [])
+        wire = netlist.wire
+        pairs = script.find_swaps(netlist, [wire[name] for name in ('gwh', 'jct', 'rcb', 'wbw', 'wgb', 'z09', 'z21', 'z39')])
+        self.assertIsNotNone(pairs)
+        self.assertEqual(netlist.with_swaps(pairs).faulty_output_bits(), [])
+
+    def test_part1_with_puzzle_input(self):
+        self.assertEqual(script.task_1(self.file_path), 57270694330992)
+
+    def test_part2_with_puzzle_input(self):
+        self.assertEqual(script.task_2(self.file_path), 'gwh,jct,rcb,wbw,wgb,z09,z21,z39')
+
+    def test_part2_verified_by_simulation(self):
+        self.assertEqual(script.task_2(self.file_path, verify=True), 'gwh,jct,rcb,wbw,wgb,z09,z21,z39')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,55 +1,215 @@
-# Складність: O(n*k), де n - кількість строчок у файлі, k - довжина рядка
-def task_1(file_path):
-    # Словник для зберігання динамічно створених лямбда-функцій (Мемоїзація)
-    fun = {}
-
-    # Відображення операторів до їх еквівалентів
-    operator_map = {'XOR': '^', 'OR': '|', 'AND': '&'}
-
-    # Зчитуємо та обробляємо кожен рядок файлу
-    with open(file_path, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if not line: # Пропускаємо порожні рядки
-                continue  
-            
-            # Парсимо рядок як бінарну операцію
-            parts = line.split()
-            if len(parts) == 5:
-                var_a, operator, var_b, _, result_var = parts
-
-                # Динамічно створюємо лямбда-функцію для результатної змінної
-                fun[result_var] = ( lambda a=var_a, b=var_b, op=operator_map[operator]:
-                                    lambda: eval(f"{fun[a]()} {op} {fun[b]()}"))()
+import copy
+import random
+
+AND, OR, XOR = 0, 1, 2
+OPERATORS = {'AND': AND, 'OR': OR, 'XOR': XOR}
+
+
+class Netlist:
+    """
+    Схема з логічних вентилів з дротами, пронумерованими числами.
+
+    names[i] - ім'я дроту i, wire[name] - його номер.
+    inputs - початкові значення вхідних дротів (номер -> 0/1).
+    gates - вентилі (операція, вхід a, вхід b, вихід) у топологічному порядку:
+    кожен вентиль іде після вентилів, що рахують його входи, тому вся схема рахується одним проходом.
+    fanout[i] - множина операцій вентилів, що читають дріт i (для перевірки будови суматора).
+    buses[prefix] - номери дротів шин x, y, z від молодшого біта до старшого (рахуються один раз).
+    """
+
+    def __init__(self, inputs, gates):
+        names = []
+        wire = {}
+
+        def wire_id(name):
+            if name not in wire:
+                wire[name] = len(names)
+                names.append(name)
+            return wire[name]
+
+        self.inputs = {wire_id(name): value for name, value in inputs}
+        indexed = [(OPERATORS[op], wire_id(a), wire_id(b), wire_id(out)) for a, op, b, out in gates]
+        self.names, self.wire = names, wire
+        self.gates = self.topological_order(indexed)
+
+        self.fanout = [set() for _ in names]
+        for op, a, b, _ in self.gates:
+            self.fanout[a].add(op)
+            self.fanout[b].add(op)
+
+        self.buses = {prefix: [wire[name] for name in sorted(names) if name[0] == prefix and name[1:].isdigit()]
+                      for prefix in 'xyz'}
+
+    # Складність: O(g), де g - кількість вентилів (алгоритм Кана)
+    def topological_order(self, gates):
+        consumers = [[] for _ in self.names]
+        missing = [0] * len(gates)  # Скільки входів вентиля ще не пораховано
+        driven = {out for *_, out in gates}
+        for index, (_, a, b, _) in enumerate(gates):
+            for source in (a, b):
+                if source in driven:
+                    consumers[source].append(index)
+                    missing[index] += 1
+
+        ready = [index for index, count in enumerate(missing) if count == 0]
+        ordered = []
+        while ready:
+            index = ready.pop()
+            ordered.append(gates[index])
+            for consumer in consumers[gates[index][3]]:
+                missing[consumer] -= 1
+                if missing[consumer] == 0:
+                    ready.append(consumer)
+
+        if len(ordered) != len(gates):
+            raise ValueError("Схема містить цикл")
+        return ordered
+
+    @classmethod
+    def from_file(cls, file_path):
+        inputs, gates = [], []
+        with open(file_path, 'r') as file:
+            for line in file:
+                parts = line.split()
+                if len(parts) == 5:  # a OP b -> out
+                    gates.append((parts[0], parts[1], parts[2], parts[4]))
+                elif len(parts) == 2:  # name: value
+                    inputs.append((parts[0].rstrip(':'), int(parts[1])))
+        return cls(inputs, gates)
+
+    def bus(self, prefix):
+        """Номери дротів шини (x, y або z) від молодшого біта до старшого."""
+        return self.buses[prefix]
+
+    def with_swaps(self, pairs):
+        """
+        Нова схема, в якій виходи вентилів кожної пари дротів поміняні місцями.
+        Обмін виходів не змінює дроти, входи вентилів і шини, тому перебудовується лише
+        топологічний порядок індексованих вентилів.
+        """
+        swap = {}
+        for a, b in pairs:
+            swap[a], swap[b] = b, a
+        netlist = copy.copy(self)
+        netlist.gates = self.topological_order([(op, a, b, swap.get(out, out)) for op, a, b, out in self.gates])
+        return netlist
+
+    # Складність: O(w + g), де w - кількість дротів, g - кількість вентилів
+    def evaluate(self, inputs=None):
+        """
+        Рахує всі дроти одним проходом по вентилях у топологічному порядку.
+        Значення дротів - довільні цілі: кожен біт числа - окремий набір входів,
+        тому в одному проході можна порахувати багато наборів одночасно (bit-sliced).
+        Вентилі без NOT, тож зайві старші біти не з'являються.
+        """
+        values = [0] * len(self.names)
+        for wire, value in (self.inputs if inputs is None else inputs).items():
+            values[wire] = value
+        for op, a, b, out in self.gates:
+            if op == AND:
+                values[out] = values[a] & values[b]
+            elif op == OR:
+                values[out] = values[a] | values[b]
             else:
-                var_name, expression = line.split(':', 1)
-                fun[var_name.strip()] = eval(f"lambda: {expression.strip()}", {}, fun)
+                values[out] = values[a] ^ values[b]
+        return values
+
+    def read_bus(self, values, prefix, lane=0):
+        """Число на шині для набору входів номер lane."""
+        return sum(((values[wire] >> lane) & 1) << bit for bit, wire in enumerate(self.bus(prefix)))
+
+    def evaluate_batch(self, xs, ys):
+        """
+        Рахує схему для багатьох пар (x, y) за один прохід: біт k кожного вхідного дроту
+        відповідає k-й парі. Повертає список чисел на шині z.
+        """
+        inputs = {}
+        for prefix, numbers in (('x', xs), ('y', ys)):
+            for bit, wire in enumerate(self.bus(prefix)):
+                inputs[wire] = sum(((number >> bit) & 1) << lane for lane, number in enumerate(numbers))
+        values = self.evaluate(inputs)
+        return [self.read_bus(values, 'z', lane) for lane in range(len(xs))]
+
+    def faulty_output_bits(self, samples=256, seed=0):
+        """Біти z, що хоч раз не збіглися з x + y на випадкових входах (порожньо для справного суматора)."""
+        rng = random.Random(seed)
+        width = len(self.bus('x'))
+        xs = [rng.getrandbits(width) for _ in range(samples)]
+        ys = [rng.getrandbits(width) for _ in range(samples)]
+        wrong = 0
+        for x, y, z in zip(xs, ys, self.evaluate_batch(xs, ys)):
+            wrong |= (x + y) ^ z
+        return [bit for bit in range(len(self.bus('z'))) if wrong >> bit & 1]
+
+
+# Складність: O(w + g), де w - кількість дротів, g - кількість вентилів
+def task_1(file_path):
+    netlist = Netlist.from_file(file_path)
+    return netlist.read_bus(netlist.evaluate(), 'z')
+
+def pairings(items):
+    """Усі розбиття списку парної довжини на пари."""
+    if not items:
+        yield []
+        return
+    first, rest = items[0], items[1:]
+    for index, second in enumerate(rest):
+        for pairs in pairings(rest[:index] + rest[index + 1:]):
+            yield [(first, second)] + pairs
 
-    return sum(fun[f'z{i:02}']() << i for i in range(46))
+# Складність: O(p * s * g / w), де p - кількість розбиттів підозрілих дротів на пари (105 для 8 дротів),
+# s - кількість випадкових пар входів, g - кількість вентилів
+def find_swaps(netlist, wires):
+    """
+    Розбиття дротів на пари, обмін виходів яких робить схему справним суматором
+    (перевіряється faulty_output_bits на випадкових входах), або None.
+    """
+    for pairs in pairings(sorted(wires)):
+        try:
+            fixed = netlist.with_swaps(pairs)
+        except ValueError:  # Обмін утворив цикл
+            continue
+        if not fixed.faulty_output_bits():
+            return pairs
+    return None
 
-# По суті cкладність: O(n**2), де n — число операцій із файлу
-def task_2(file_path):
-    # Зчитування логічних операцій із файлу
-    logic_operations = [line.split() for line in open(file_path) if '->' in line]
+# Складність: O(g) - сусіди кожного дроту беруться з таблиці fanout, а не пошуком по всіх вентилях;
+# з verify=True додається перевірка відповіді в find_swaps
+def task_2(file_path, verify=False):
+    """
+    Схема - суматор зі зсувом переносу; неправильні виходи порушують його будову:
+    - XOR, що не зв'язаний ні з входами x/y, ні з виходом z;
+    - AND (крім першого біта), вихід якого читає XOR;
+    - XOR від входів (крім першого біта), вихід якого читає OR;
+    - вихід z (крім старшого) не з XOR.
+    З verify=True відповідь приймається лише тоді, коли якийсь обмін знайдених дротів парами
+    виправляє суматор (симуляція на випадкових входах - на порядки довша за сам пошук).
+    """
+    netlist = Netlist.from_file(file_path)
+    names, fanout = netlist.names, netlist.fanout
+    first_bit = netlist.wire.get('x00')
+    last_z = netlist.bus('z')[-1]
 
-    # O(k*m), де k — кількість перевірок, m — число операцій
-    is_related_to = lambda candidate_var, target_var: any(
-        target_var == operator and candidate_var in (input_a, input_b)
-        for input_a, operator, input_b, _, _ in logic_operations
-    )
+    wrong = set()
+    for op, a, b, out in netlist.gates:
+        first = first_bit in (a, b)
+        if op == XOR and all(names[wire][0] not in 'xyz' for wire in (a, b, out)):
+            wrong.add(out)
+        elif op == AND and not first and XOR in fanout[out]:
+            wrong.add(out)
+        elif op == XOR and not first and OR in fanout[out]:
+            wrong.add(out)
+        if op != XOR and names[out][0] == 'z' and out != last_z:
+            wrong.add(out)
 
-    print(*sorted(
-        output_var for input_a, operator, input_b, _, output_var in logic_operations if
-        operator == "XOR" and all(d[0] not in 'xyz' for d in (input_a, input_b, output_var)) or
-        operator == "AND" and "x00" not in (input_a, input_b) and is_related_to(output_var, 'XOR') or
-        operator == "XOR" and "x00" not in (input_a, input_b) and is_related_to(output_var, 'OR') or
-        operator != "XOR" and output_var[0] == 'z' and output_var != "z45"
-    ), sep=',')
+    if verify and find_swaps(netlist, wrong) is None:
+        raise ValueError("Знайдені дроти не виправляють суматор жодним обміном парами")
+    return ','.join(sorted(names[wire] for wire in wrong))
 
 
 def main(file_path='2024/day24/input.txt'):
     print("Part 1:", task_1(file_path))             # 57270694330992
-    print("Part 2:", end=' '), task_2(file_path)    # gwh,jct,rcb,wbw,wgb,z09,z21,z39
+    print("Part 2:", task_2(file_path))             # gwh,jct,rcb,wbw,wgb,z09,z21,z39
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+import unittest
+import script
+
+class TestDay25(unittest.TestCase):
+
+    file_path = '2024/day25/input.txt'
+
+    example = """#####
+.####
+.####
+.####
+.#.#.
+.#...
+.....
+
+#####
+##.##
+.#.##
+...##
+...#.
+...#.
+.....
+
+.....
+#....
+#....
+#...#
+#.#.#
+#.###
+#####
+
+.....
+.....
+#.#..
+###..
+###.#
+###.#
+#####
+
+.....
+.....
+.....
+#....
+#.#..
+#.#.#
+#####""".split("\n\n")
+
+    def test_count_valid_pairs_with_example_data(self):
+        self.assertEqual(script.count_valid_pairs(self.example), 3)
+
+    def test_heights_index_matches_masks(self):
+        """Обидва способи підрахунку дають однаковий результат на прикладі та на вхідних даних."""
+        for input_data in (self.example, script.read_input(self.file_path)):
+            locks, keys = script.split_schematics(input_data)
+            self.assertEqual(script.count_pairs_by_heights(locks, keys), script.count_pairs_by_masks(locks, keys))
+            self.assertEqual(script.count_valid_pairs(input_data, by_heights=True),
+                             script.count_valid_pairs(input_data, by_heights=False))
+
+    def test_heights_index_without_locks_or_keys(self):
+        locks, keys = script.split_schematics(self.example)
+        self.assertEqual(script.count_pairs_by_heights([], keys), 0)
+        self.assertEqual(script.count_pairs_by_heights(locks, []), 0)
+
+    def test_part1_with_puzzle_input(self):
+        self.assertEqual(script.count_valid_pairs(script.read_input(self.file_path)), 3133)
+
+if __name__ == '__main__':
+    unittest.main()
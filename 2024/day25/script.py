@@ -1,3 +1,6 @@
+from collections import Counter
+from itertools import product
+
 def read_input(file_path):
     """
     Функція для читання даних з файлу.
@@ -5,32 +8,79 @@ def read_input(file_path):
     with open(file_path) as file:
         return file.read().split("\n\n")
 
-def no_common_hashes(str1, str2):
+def schematic_mask(block):
     """
-    Функція перевіряє, чи два рядки не мають символу '#' на однакових позиціях.
-    Параметри:
-    str1 (str): Перший рядок.
-    str2 (str): Другий рядок.
-    Повертає:
-    bool: True, якщо немає спільних символів '#', інакше False.
+    Перетворює схему на одне число: біт k встановлений, якщо k-та клітинка схеми - '#'.
+    Дві схеми не перетинаються тоді й лише тоді, коли mask_a & mask_b == 0.
     """
-    return all(x != '#' or y != '#' for x, y in zip(str1, str2))
+    mask = 0
+    for bit, char in enumerate(block.replace("\n", "")):
+        if char == '#':
+            mask |= 1 << bit
+    return mask
+
+def column_heights(block):
+    """Висоти стовпців схеми без рядка-основи (верхнього для замка, нижнього для ключа)."""
+    rows = block.split()
+    return tuple(column.count('#') - 1 for column in zip(*rows))
+
+def split_schematics(input_data):
+    """Розділяє схеми на замки (заповнений верхній рядок) і ключі."""
+    locks, keys = [], []
+    for block in input_data:
+        block = block.strip()
+        if block:
+            (locks if block.startswith('#') else keys).append(block)
+    return locks, keys
+
+# Складність: O(L * K) операцій над числами, де L — кількість замків, K — кількість ключів
+def count_pairs_by_masks(locks, keys):
+    """Перебір пар замок-ключ, але кожна перевірка - одне `&` над числами замість порівняння рядків."""
+    key_masks = [schematic_mask(key) for key in keys]
+    return sum(1 for lock in map(schematic_mask, locks) for key in key_masks if not lock & key)
+
+# Складність: O(L + K + W * (H + 1)**W), де W — кількість стовпців, H — висота простору між основами
+def count_pairs_by_heights(locks, keys):
+    """
+    Ключі групуються за кортежем висот. Префіксні суми по всіх W вимірах дають для кожного
+    кортежу h кількість ключів, усі висоти яких не більші за h. Замок з висотами l підходить
+    ключам з висотами не більшими за H - l, тому відповідь для замка - одне читання таблиці.
+    """
+    if not locks or not keys:
+        return 0
+    rows = locks[0].split()
+    width, space = len(rows[0]), len(rows) - 2
+
+    at_most = Counter(column_heights(key) for key in keys)
+    cells = list(product(range(space + 1), repeat=width))
+    for axis in range(width):
+        for heights in cells:  # Лексикографічний порядок: менший сусід по осі вже оброблений
+            if heights[axis]:
+                lower = heights[:axis] + (heights[axis] - 1,) + heights[axis + 1:]
+                at_most[heights] += at_most[lower]
+
+    return sum(at_most[tuple(space - h for h in column_heights(lock))] for lock in locks)
 
-def count_valid_pairs(input_data):
+def count_valid_pairs(input_data, by_heights=None):
     """
-    Функція для підрахунку кількості валідних пар рядків з масиву,
+    Функція для підрахунку кількості валідних пар схем,
     де кожна пара не має символу '#' на однакових позиціях.
+    Два замки (чи два ключі) завжди перетинаються основою, тому рахуються лише пари замок-ключ.
     Параметри:
-    input_data (list): Список рядків для перевірки.
+    input_data (list): Список схем.
+    by_heights (bool): Рахувати через індекс висот або перебором бітових масок. За замовчуванням
+    індекс береться, коли пар на порядок більше, ніж клітинок у таблиці висот (великі набори схем):
+    обробка клітинки таблиці приблизно вдесятеро дорожча за перевірку пари масок.
     Повертає:
     int: Кількість валідних пар.
     """
-    valid_pairs_count = 0
-    for i in range(len(input_data)):
-        for j in range(i + 1, len(input_data)):
-            if no_common_hashes(input_data[i], input_data[j]):
-                valid_pairs_count += 1
-    return valid_pairs_count
+    locks, keys = split_schematics(input_data)
+    if by_heights is None and locks:
+        rows = locks[0].split()
+        by_heights = len(locks) * len(keys) > 10 * len(rows[0]) * (len(rows) - 1) ** len(rows[0])
+    if by_heights:
+        return count_pairs_by_heights(locks, keys)
+    return count_pairs_by_masks(locks, keys)
 
 def main(file_path = '2024/day25/input.txt'):
     input_data = read_input(file_path)
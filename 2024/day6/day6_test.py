@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # 2024/utils.py для script
+import script
+
+class TestDay6(unittest.TestCase):
+
+    file_path = '2024/day6/input.txt'
+
+    example = ['....#.....',
+               '.........#',
+               '..........',
+               '..#.......',
+               '.......#..',
+               '..........',
+               '.#..^.....',
+               '........#.',
+               '#.........',
+               '......#...']
+
+    def setUp(self):
+        fd, self.example_path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as file:
+            file.write('\n'.join(self.example))
+
+    def tearDown(self):
+        os.remove(self.example_path)
+
+    def solve(self, file_path, workers=1):
+        grid = script.read_map_from_file(file_path)
+        visited_positions = script.task_1(grid)
+        start_position = script.find_start_position(grid)
+        return len(visited_positions), script.task_2(grid, start_position, visited_positions, workers)
+
+    def test_tasks_with_example_data(self):
+        self.assertEqual(self.solve(self.example_path), (41, 6))
+
+    def test_task2_process_pool_matches_single_process(self):
+        self.assertEqual(self.solve(self.example_path, workers=2), self.solve(self.example_path, workers=1))
+
+    def test_tasks_with_puzzle_input(self):
+        self.assertEqual(self.solve(self.file_path), (5199, 1915))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,133 +1,240 @@
+from concurrent.futures import ProcessPoolExecutor
+import sys
+from pathlib import Path
+
+# Прямий запуск `python 2024/day6/script.py`: пакет aoc лежить у корені репозиторію, utils.py - в каталозі року
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid, OUTSIDE
 from utils import timer
 
+WALL = ord("#")
+
 def read_map_from_file(file_path):
-    """Зчитує карту з текстового файлу."""
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return [list(line.strip()) for line in file.readlines()]
-    
+    """Зчитує карту з текстового файлу у плоску сітку з рамкою-сторожем."""
+    return Grid.from_file(file_path)
+
 def find_start_position(grid):
-    """Знаходит стартову позицію охоронця."""
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == "^":
-                return (row, col)
-    return None
+    """Знаходит стартову позицію охоронця (плоский індекс)."""
+    position = grid.find("^")
+    return position if position != -1 else None
 
 # Складність: O(n*m), де n и m — розміри карти
-# Думаю, що алгоритм можна вважати модифікацією обходу в ширину чи глибину, але 
+# Думаю, що алгоритм можна вважати модифікацією обходу в ширину чи глибину, але
 # з фіксованим порядком руху та поверненням праворуч при зустрічі з перешкодою
 def task_1(grid):
     """
     Прогнозує маршрут охоронця та повертає унікальні відвідані позиції.
-    
+
     Алгоритм:
     1. Початкове положення охоронця визначається за маркером '^'.
     2. Охоронець рухається в заданому напрямку, якщо шлях відкритий.
     3. Якщо шлях заблоковано (стіна '#'), охоронець повертає направо.
     4. Алгоритм завершується, коли охоронець виходить за межі карти.
+
+    Повертає словник {позиція: (попередня позиція, напрямок)} для першого відвідування
+    кожної клітинки (для старту - None). З цього стану task_2 починає симуляцію,
+    якщо на клітинку поставити перешкоду: шлях до неї від цього не змінюється.
     """
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # Напрямки: вгору, вправо, вниз, вліво
+    offsets = grid.offsets4  # Напрямки: вгору, вправо, вниз, вліво
+    cells = grid.cells
     direction_index = 0  # Початковий напрямок (вгору)
 
     # Знаходимо стартову позицію охоронця
-    start_position = find_start_position(grid)
-
-    visited = set()  # Унікальні відвідані позиції
-    position = start_position  # Поточна позиція
-    visited.add(position)
-
-    rows, cols = len(grid), len(grid[0])  # Розміри карти
+    position = find_start_position(grid)
+    visited = {position: None}  # Унікальні відвідані позиції
 
     while True:
-        dr, dc = directions[direction_index]
-        next_position = (position[0] + dr, position[1] + dc)
+        next_position = position + offsets[direction_index]
+        cell = cells[next_position]
 
-        if not (0 <= next_position[0] < rows and 0 <= next_position[1] < cols):  # Вихід за межі карти
+        if cell == OUTSIDE:  # Вихід за межі карти
             break
 
-        if grid[next_position[0]][next_position[1]] == "#":  # Стіна
+        if cell == WALL:  # Стіна
             direction_index = (direction_index + 1) % 4  # Повертаємо направо
         else:  # Вільний шлях
+            if next_position not in visited:
+                visited[next_position] = (position, direction_index)
             position = next_position
-            visited.add(position)
-
-        if not (0 <= position[0] < rows and 0 <= position[1] < cols):  # Якщо вийшли за межі
-            break
 
     return visited
 
-# Складність: O(k*(n*m)), де k - кількість унікальних позицій які були пройдені в 1 завданні, n и m — розміри карти
-# Використовую щось схоже на пошук у глибину (DFS) з можливістю відстеження відвіданих станів
-def task_2(grid, start_position, visited_positions):
+
+def build_jump_table(grid):
     """
-    Розраховує кількість потенційних пасток (циклічних маршрутів).
+    Таблиці стрибків для кожного напрямку d:
+    - reach[d][i] - остання вільна клітинка, до якої дійде охоронець з i у напрямку d;
+    - jump[d][i] - та сама клітинка, якщо далі стіна (там буде поворот), або -1,
+      якщо далі межа карти (охоронець виходить).
 
-    Алгоритм:
-    1. Для кожної відвіданої позиції (крім стартової) модифікуємо карту, додаючи перешкоду.
-    2. Запускаємо симуляцію руху охоронця на модифікованій карті.
-    3. Якщо охоронець потрапляє у нескінченний цикл, позиція вважається пасткою.
+    Клітинки обходяться так, щоб сусід i + offset був обчислений раніше за i.
+    Складність: O(n*m).
+    """
+    cells = grid.cells
+    size = len(cells)
+    jump, reach = [], []
+
+    for offset in grid.offsets4:
+        last = [-1] * size
+        order = range(size - 1, -1, -1) if offset > 0 else range(size)
+        for i in order:
+            cell = cells[i]
+            if cell == OUTSIDE or cell == WALL:
+                continue
+            neighbour = cells[i + offset]
+            last[i] = i if neighbour == WALL or neighbour == OUTSIDE else last[i + offset]
+        reach.append(last)
+        jump.append([i if i != -1 and cells[i + offset] == WALL else -1 for i in last])
+
+    return jump, reach
+
+
+def patch_jump_table(grid, jump, reach, obstacle):
+    """
+    Оновлює таблицю стрибків для нової перешкоди obstacle за O(n + m):
+    змінюються лише клітинки того ж рядка/стовпця між obstacle і попередньою стіною.
+    Такі клітинки утворюють зріз списку з кроком offset, тож латка - одне присвоєння зрізу.
+
+    Повертає список (таблиця, зріз, старі значення) для відновлення.
     """
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  # Напрямки руху
-    infinite_loops_count = 0
-    rows, cols = len(grid), len(grid[0])
+    cells = grid.cells
+    saved = []
 
-    def simulate(grid, start_position):
-        """
-        Симуляція руху охоронця на модифікованій карті.
+    for d, offset in enumerate(grid.offsets4):
+        stop = obstacle - offset  # Клітинка перед перешкодою в напрямку руху
+        if cells[stop] == WALL or cells[stop] == OUTSIDE:
+            continue
+        far = reach[(d + 2) % 4][stop]  # Найдальша клітинка позаду, з якої охоронець дійде до stop
+        if offset > 0:
+            segment = slice(far, stop + 1, offset)
+        else:
+            segment = slice(stop, far + 1, -offset)
 
-        Повертає True, якщо охоронець потрапляє у нескінченний цикл, інакше False.
-        """
-        position = start_position
-        direction_index = 0
-        history = set()
+        table = jump[d]
+        old = table[segment]
+        table[segment] = [stop] * len(old)
+        saved.append((table, segment, old))
 
-        while True:
-            dr, dc = directions[direction_index]
-            next_position = (position[0] + dr, position[1] + dc)
+    return saved
 
-            if not (0 <= next_position[0] < rows and 0 <= next_position[1] < cols):
-                return False  # Вихід за межі карти
 
-            if grid[next_position[0]][next_position[1]] == "#":
-                direction_index = (direction_index + 1) % 4  # Поворот направо
-            else:
-                position = next_position
+def restore_jump_table(saved):
+    for table, segment, old in saved:
+        table[segment] = old
 
-            if (position, direction_index) in history:
-                return True  # Нескінченний цикл
-            history.add((position, direction_index))
 
-    # Перевіряємо кожну відвідану позицію (крім стартової)
-    for r, c in visited_positions - {start_position}:
-        modified_grid = [row[:] for row in grid]  # Копіюємо карту
-        modified_grid[r][c] = "#"  # Додаємо перешкоду
+def creates_loop(jump, position, direction_index, seen, stamp):
+    """
+    Симуляція стрибками між точками повороту.
+    seen - плоский масив станів (позиція * 4 + напрямок); замість очищення між
+    кандидатами стан вважається відвіданим, якщо в ньому записано поточний stamp.
 
-        if simulate(modified_grid, start_position):  # Перевірка на зациклення
-            infinite_loops_count += 1
+    Повертає True, якщо охоронець потрапляє у нескінченний цикл, інакше False.
+    """
+    while True:
+        position = jump[direction_index][position]
+        if position == -1:
+            return False  # Вихід за межі карти
 
-    return infinite_loops_count
+        direction_index = (direction_index + 1) & 3  # Поворот направо
+        state = position * 4 + direction_index
+        if seen[state] == stamp:
+            return True  # Нескінченний цикл
+        seen[state] = stamp
+
+
+class LoopCounter:
+    """
+    Рахує кандидатів (перешкода, позиція перед нею, напрямок), що створюють цикл.
+    Таблиця стрибків будується один раз, латається для кожного кандидата і відновлюється
+    після симуляції. Лічильник stamp живе між викликами count, тож масив seen
+    ніколи не потрібно очищати.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.jump, self.reach = build_jump_table(grid)
+        self.seen = [0] * (len(grid.cells) * 4)
+        self.stamp = 0
+
+    def count(self, candidates):
+        infinite_loops_count = 0
+        for obstacle, position, direction_index in candidates:
+            self.stamp += 1
+            saved = patch_jump_table(self.grid, self.jump, self.reach, obstacle)
+            if creates_loop(self.jump, position, direction_index, self.seen, self.stamp):  # Перевірка на зациклення
+                infinite_loops_count += 1
+            restore_jump_table(saved)
+        return infinite_loops_count
+
+
+# Лічильник процесу-воркера: карта передається і таблиці будуються один раз
+# в ініціалізаторі, а не серіалізуються разом з кожною задачею.
+_worker_counter = None
+
+def _init_worker(grid):
+    global _worker_counter
+    _worker_counter = LoopCounter(grid)
+
+def _count_loops_chunk(candidates):
+    return _worker_counter.count(candidates)
+
+
+# Складність: O(k*(t + n + m)), де k - кількість унікальних позицій які були пройдені в 1 завданні,
+# t - кількість поворотів у симуляції, n и m — розміри карти
+def task_2(grid, start_position, visited_positions, workers=1):
+    """
+    Розраховує кількість потенційних пасток (циклічних маршрутів).
+
+    Алгоритм:
+    1. Один раз будуємо таблицю стрибків до наступної перешкоди для кожної клітинки та напрямку.
+    2. Для кожної відвіданої позиції (крім стартової) ставимо туди перешкоду, латаючи
+       таблицю лише в її рядку та стовпці (замість копіювання всієї карти).
+    3. Симуляцію починаємо зі стану на початковому маршруті безпосередньо перед перешкодою
+       і рухаємося стрибками між поворотами.
+    4. Якщо охоронець потрапляє у нескінченний цикл, позиція вважається пасткою.
+
+    Кандидати незалежні, тому з workers > 1 вони діляться на чанки між процесами.
+    Кожен воркер отримує карту один раз через initializer і будує власні таблиці.
+    Для карт розміру вхідних даних (~5 тис. кандидатів, ~0.1 с) запуск пулу
+    дорожчий за саму роботу, тому за замовчуванням workers=1.
+    """
+    candidates = [(obstacle, *state) for obstacle, state in visited_positions.items()
+                  if obstacle != start_position]
+
+    if workers <= 1:
+        return LoopCounter(grid).count(candidates)
+
+    chunk_size = max(1, len(candidates) // (workers * 4))  # Кілька чанків на воркер для балансування
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(grid,)) as pool:
+        return sum(pool.map(_count_loops_chunk, chunks))
 
 
 def draw_map(grid, visited_positions):
     """Малює карту з позначеними позиціями, які відвідав охоронець."""
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if (row, col) in visited_positions:
+    for row in range(grid.height):
+        for col in range(grid.width):
+            position = grid.index(row, col)
+            if position in visited_positions:
                 print("X", end="")
             else:
-                print(grid[row][col], end="")
+                print(chr(grid[position]), end="")
         print()
 
 
-def main(file_path='2024/day6/input.txt'):
+def main(file_path='2024/day6/input.txt', workers=1):
     lab_map = read_map_from_file(file_path)
 
     visited_positions = task_1(lab_map)
     # draw_map(lab_map, visited_positions)
-    
+
     with timer():
         start_position = find_start_position(lab_map)
-        infinite_loops_count = task_2(lab_map, start_position, visited_positions)
+        infinite_loops_count = task_2(lab_map, start_position, visited_positions, workers)
 
 
     print('Part one:', len(visited_positions)) # 5199
@@ -0,0 +1,32 @@
+import unittest
+import script
+
+class TestDay9(unittest.TestCase):
+
+    file_path = '2024/day9/input.txt'
+    example = '2333133121414131402'
+
+    def test_task1_with_example_data(self):
+        files, _ = script.parse_runs(self.example)
+        self.assertEqual(script.compact_blocks(files), 1928)
+
+    def test_task2_with_example_data(self):
+        self.assertEqual(script.move_files(*script.parse_runs(self.example)), 2858)
+
+    def test_parse_runs_merges_gaps_around_empty_file(self):
+        files, gaps = script.parse_runs('6457069')
+        self.assertEqual(files, [(0, 0, 6), (1, 10, 5), (2, 22, 0), (3, 28, 9)])
+        self.assertEqual(gaps, [(6, 4), (15, 13)])
+
+    def test_task2_with_empty_file(self):
+        self.assertEqual(script.move_files(*script.parse_runs('6457069')), 573)
+
+    def test_part1_with_puzzle_input(self):
+        files, _ = script.parse_runs(script.read_input(self.file_path))
+        self.assertEqual(script.compact_blocks(files), 6200294120911)
+
+    def test_part2_with_puzzle_input(self):
+        self.assertEqual(script.move_files(*script.parse_runs(script.read_input(self.file_path))), 6227018762750)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import heapq
 import time
 
 # Читаємо вхідний файл
@@ -5,30 +6,61 @@ def read_input(filepath):
     with open(filepath, "r") as f:
         return f.read().strip()
 
-# В таблиці Unicode символи: .=46 �=65533 Тому можна використовувати будьякий смайл АЛЕ не знак .
-CONST_CHAR = '�' # символ для порожніх місць
-# CONST_CHAR = '😊' # символ для порожніх місць
-
-# Створюємо диск за описом
-def create_disk(line):
-    disk = ""
-    empty = False
-    i = 0
-    for char in line:
-        if empty:
-            disk += CONST_CHAR * int(char)  # Додаємо порожні блоки
-        else:
-            disk += chr(i) * int(char)  # Додаємо блоки з символами
-            i += 1
-        empty = not empty  # Змінюємо стан
-    return disk
-
-# Обчислюємо загальну суму згідно умов задачі
-def calculate_total(disk):
+# Описуємо диск відрізками замість посимвольного рядка:
+# files - список (id, початок, довжина), gaps - список (початок, довжина) вільних місць.
+# Файл довжини 0 не займає місця, тому проміжки по обидва боки від нього зливаються в один.
+# Складність: O(n), де n - довжина опису диску
+def parse_runs(line):
+    files, gaps = [], []
+    position = 0
+    for i, char in enumerate(line):
+        length = int(char)
+        if i % 2 == 0:
+            files.append((i // 2, position, length))
+        elif length:
+            if gaps and sum(gaps[-1]) == position:
+                gaps[-1] = (gaps[-1][0], gaps[-1][1] + length)
+            else:
+                gaps.append((position, length))
+        position += length
+    return files, gaps
+
+# Контрольна сума відрізка: file_id * (start + (start + 1) + ... + (start + length - 1))
+def run_checksum(file_id, start, length):
+    return file_id * (length * start + length * (length - 1) // 2)
+
+
+# Частина 1: блоки з кінця диску по одному переносяться в найлівіші вільні місця.
+# Два вказівники по відрізках: зліва йдемо по файлах і проміжках, справа беремо блоки
+# останнього ще не обробленого файлу. Складність: O(n)
+def compact_blocks(files):
     total = 0
-    for i, c in enumerate(disk):
-        if c != CONST_CHAR:  # Ігноруємо порожні блоки
-            total += i * ord(c)  # Додаємо вагу символа до суми
+    position = 0
+    right = len(files) - 1
+    right_remaining = files[right][2]  # Скільки блоків правого файлу ще не перенесено
+
+    for left in range(len(files)):
+        if left > right:
+            break
+        file_id, start, length = files[left]
+        if left == right:
+            total += run_checksum(file_id, position, right_remaining)
+            break
+        total += run_checksum(file_id, position, length)
+        position += length
+
+        # Вільне місце між поточним і наступним файлом заповнюємо з правого кінця
+        gap = files[left + 1][1] - (start + length)
+        while gap and right > left:
+            take = min(gap, right_remaining)
+            total += run_checksum(files[right][0], position, take)
+            position += take
+            gap -= take
+            right_remaining -= take
+            if right_remaining == 0:
+                right -= 1
+                right_remaining = files[right][2]
+
     return total
 
 
@@ -36,82 +68,61 @@ def task_one(filepath):
     line = read_input(filepath)
     start = time.time()
 
-    disk = create_disk(line)
-    disk = list(disk)
-    first_dot = 0
-
-    # Основний алгоритм переміщення файлів. Загальна складність: O(n**2)
-    while True:
-        while disk[-1] == CONST_CHAR:  # Видаляємо порожні блоки з кінця
-            disk.pop()
-        try:
-            first_dot = disk.index(CONST_CHAR, first_dot)  # Знаходимо перший порожній блок
-        except ValueError:
-            break
-        disk[first_dot] = disk[-1]  # Переміщуємо файл
-        disk.pop()
-
-    total = calculate_total(disk)
+    files, _ = parse_runs(line)
+    total = compact_blocks(files)
 
     end = time.time()
     print(f"Task 1 Result: {total}")
     print(f"Task 1 Time: {end - start:.2f}s")
+    return total
+
+
+# Частина 2: файли цілком переносяться (від більшого id до меншого) у найлівіше вільне місце,
+# що вміщує файл і знаходиться лівіше за нього.
+# Довжин проміжків небагато (1..9, довші лише після злиття навколо порожніх файлів), тому для кожної
+# довжини тримаємо min-купу початків проміжків:
+# найлівіший підхожий проміжок - мінімум з вершин куп довжин >= довжини файлу.
+# Залишок проміжку після переносу повертається в купу своєї (меншої) довжини.
+# Місце, яке звільняє файл, нікому не потрібне: усі наступні файли лівіші за нього.
+# Складність: O(n log n)
+def move_files(files, gaps):
+    heaps = [[] for _ in range(max((length for _, length in gaps), default=0) + 1)]
+    for start, length in gaps:
+        heaps[length].append(start)
+    for heap in heaps:
+        heapq.heapify(heap)
+
+    total = 0
+    for file_id, start, length in reversed(files):
+        if not length:
+            continue
+        best_length, best_start = 0, start
+        for gap_length in range(length, len(heaps)):
+            heap = heaps[gap_length]
+            if heap and heap[0] < best_start:
+                best_length, best_start = gap_length, heap[0]
+
+        if best_length:
+            heapq.heappop(heaps[best_length])
+            if best_length > length:
+                heapq.heappush(heaps[best_length - length], best_start + length)
+
+        total += run_checksum(file_id, best_start, length)
+
+    return total
 
 
 def task_two(filepath):
     line = read_input(filepath)
     start = time.time()
 
-    disk = create_disk(line)
-    disk = remove_trailing_empty_blocks(disk)
-    files = split_files(disk)
-    disk = move_files(disk, files)
-    total = calculate_total(disk)
-    
+    files, gaps = parse_runs(line)
+    total = move_files(files, gaps)
+
     end = time.time()
     print(f"Task 2 Result: {total}")
     print(f"Task 2 Time: {end - start:.2f}s")
-
-# Видаляє порожні блоки з кінця
-def remove_trailing_empty_blocks(disk):
-    while disk[-1] == CONST_CHAR:
-        disk.pop()
-    return disk
-
-# Розділення диску на окремі файли
-def split_files(disk):
-    files = []
-    last = disk[0]
-    file_length = 0
-    for i, char in enumerate(disk):
-        if char != last:
-            files.append((last * file_length, i - file_length)) if last != CONST_CHAR else 0
-            file_length = 1
-        else:
-            file_length += 1
-        last = char
-    files.append((last * file_length, len(disk) - file_length))
-    return files
-
-# Переміщення файлів у відповідні місця
-def move_files(disk, files):
-    while len(files) > 0:
-        length_last = len(files[-1][0])
-        try:
-            first_dot = disk.index(CONST_CHAR * length_last, 0, files[-1][1])
-        except ValueError:
-            files.pop()
-            continue
-        # Переміщуємо файл
-        disk = (
-            disk[:first_dot] 
-            + files[-1][0] 
-            + disk[first_dot + length_last:files[-1][1]] 
-            + CONST_CHAR * length_last 
-            + disk[files[-1][1] + length_last:]
-        )
-        files.pop()
-    return disk
+    return total
 
 
 def main(file_path='2024/day9/input.txt'):
@@ -3,7 +3,13 @@ import time
 from pathlib import Path
 from typing import List, Dict
 import pulp
-from collections import deque
+import sys
+
+# Прямий запуск `python 2025/day10/script.py`: пакет aoc лежить у корені репозиторію
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc import search
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
@@ -74,23 +80,15 @@ def part_one(machines: List[Dict]) -> int:
         # Маски кнопок
         button_masks = [sum(1 << idx for idx in btn) for btn in buttons]
 
-        # BFS по масках для мінімального числа натискань
-        visited = {0: 0}  # словник: маска -> мінімальна кількість натискань
-        queue = deque([0])
-
-        while queue:
-            current_mask = queue.popleft()
-            current_steps = visited[current_mask]
-
-            if current_mask == target_mask:
-                total_min_presses += current_steps
-                break
-
-            for mask in button_masks:
-                next_mask = current_mask ^ mask  # застосування кнопки через XOR
-                if next_mask not in visited or visited[next_mask] > current_steps + 1:
-                    visited[next_mask] = current_steps + 1
-                    queue.append(next_mask)
+        # BFS по масках для мінімального числа натискань (застосування кнопки - XOR з її маскою)
+        result = search.bfs(
+            [0],
+            lambda current_mask: [current_mask ^ mask for mask in button_masks],
+            is_goal=lambda current_mask: current_mask == target_mask,
+            size=1 << len(lights),  # Маски - щільні числа, тому відстані - плоский список
+        )
+        if result.goals:
+            total_min_presses += result.cost
 
     return total_min_presses
 
@@ -1,6 +1,7 @@
 
 import unittest
 
+from aoc.intervals import IntervalSet
 from script import (
     parse_ranges_and_ingredients,
     merge_ranges,
@@ -67,6 +68,15 @@ class TestIngredientFreshness(unittest.TestCase):
         merged = [(1, 5), (10, 20)] # (1–5) = 5 чисел і (10–20) = 11 чисел
         self.assertEqual(count_total_fresh_ids(merged), 5 + 11)
 
+    def test_interval_set_passed_through(self):
+        """IntervalSet з розбору приймається без перетворення у список і назад."""
+        ranges = [(3, 5), (10, 14), (16, 20), (12, 18)]
+        fresh = IntervalSet.from_inclusive(ranges)
+        ingredients = [1, 5, 8, 11, 17, 32]
+        self.assertEqual(count_fresh_ingredients(ingredients, fresh),
+                         count_fresh_ingredients(ingredients, merge_ranges(ranges)))
+        self.assertEqual(count_total_fresh_ids(fresh), count_total_fresh_ids(merge_ranges(ranges)))
+
     def test_large_ranges(self):
         """Перевірка, що великі діапазони не викликають проблем із пам'яттю."""
         merged = [(1, 1_000_000_000)]
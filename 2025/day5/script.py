@@ -1,6 +1,13 @@
 import logging
 import time
 from pathlib import Path
+import sys
+
+# Прямий запуск `python 2025/day5/script.py`: пакет aoc лежить у корені репозиторію
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.intervals import IntervalSet
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,21 +47,12 @@ def parse_ranges_and_ingredients(lines):
 
 def merge_ranges(ranges_list):
     """
-    Алгоритм "Merge Intervals" (злиття перетинаючихся інтервалів)
-    Повертає список неперетинаючихся діапазонів (кортежів)
+    Алгоритм "Merge Intervals" (злиття перетинаючихся інтервалів) через спільний aoc.intervals.IntervalSet.
+    Діапазони, що стикуються (1-5 і 6-10), теж зливаються - кількість ID від цього не змінюється.
+    Повертає список неперетинаючихся діапазонів (кортежів) із включним кінцем
     Складність: O(N log N) через сортування + O(N) проходження
     """
-    merged = []
-    for start, stop in sorted(ranges_list, key=lambda x: x[0]):
-        if not merged:
-            merged.append((start, stop))
-            continue
-        last_start, last_stop = merged[-1]
-        if start <= last_stop:  # перетин
-            merged[-1] = (last_start, max(last_stop, stop))  # об'єднуємо
-        else:
-            merged.append((start, stop))
-    return merged
+    return IntervalSet.from_inclusive(ranges_list).to_inclusive()
 
 def is_fresh(ingredient, merged_ranges):
     """
@@ -75,22 +73,29 @@ def is_fresh(ingredient, merged_ranges):
             left = mid + 1
     return False
 
+def as_interval_set(merged_ranges):
+    """IntervalSet без змін або з об'єднаних діапазонів із включним кінцем (результату merge_ranges)."""
+    if isinstance(merged_ranges, IntervalSet):
+        return merged_ranges
+    return IntervalSet.from_inclusive(merged_ranges)
+
 def count_fresh_ingredients(available_ingredients, merged_ranges):
     """
-    Підраховує кількість свіжих інгредієнтів серед наявних
-    Складність: O(M log N), де M — кількість інгредієнтів, N — кількість об'єднаних діапазонів
+    Підраховує кількість свіжих інгредієнтів серед наявних.
+    merged_ranges - IntervalSet або список діапазонів із включним кінцем.
+    Інгредієнти сортуються, а діапазони проходяться одним вказівником (IntervalSet.contains_many).
+    Складність: O((M + N) log M), де M — кількість інгредієнтів, N — кількість об'єднаних діапазонів
     """
-    fresh_count = 0
-    for ingredient in available_ingredients:
-        if is_fresh(ingredient, merged_ranges):
-            fresh_count += 1
-    return fresh_count
+    return sum(as_interval_set(merged_ranges).contains_many(available_ingredients))
 
 def count_total_fresh_ids(merged_ranges):
     """
     Підраховує загальну кількість унікальних свіжих інгредієнтів
+    merged_ranges - IntervalSet або список діапазонів із включним кінцем.
     Складність: O(N), де N — кількість об'єднаних діапазонів
     """
+    if isinstance(merged_ranges, IntervalSet):
+        return merged_ranges.total
     return sum(stop - start + 1 for start, stop in merged_ranges)  # +1 для включності
 
 if __name__ == "__main__":
@@ -100,14 +105,14 @@ if __name__ == "__main__":
         logging.info("No data to process.")
     else:
         fresh_ranges, available_ingredients = parse_ranges_and_ingredients(lines)
-        merged_ranges = merge_ranges(fresh_ranges)
+        fresh = IntervalSet.from_inclusive(fresh_ranges)  # Злиття один раз для обох задач
 
         # Task 1: Підрахунок свіжих інгредієнтів серед наявних
         start_time = time.perf_counter()
-        result_task_1 = count_fresh_ingredients(available_ingredients, merged_ranges)
+        result_task_1 = count_fresh_ingredients(available_ingredients, fresh)
         logging.info(f"Task 1: {result_task_1} (time: {time.perf_counter() - start_time:.6f}s)")
 
         # Task 2: Підрахунок загальної кількості унікальних свіжих інгредієнтів
         start_time = time.perf_counter()
-        result_task_2 = count_total_fresh_ids(merged_ranges)
+        result_task_2 = count_total_fresh_ids(fresh)
         logging.info(f"Task 2: {result_task_2} (time: {time.perf_counter() - start_time:.6f}s)")
@@ -0,0 +1,8 @@
+"""
+Спільні інструменти для розв'язків Advent of Code (усі роки).
+
+Скрипти, що імпортують `aoc`, запускаються з кореня репозиторію:
+    python -m aoc.runner -y 2024 -d 18
+    python 2024/day18/script.py
+Під раннером скрипти днів імпортуються як aoc.days.y2024_day18 (див. aoc.days).
+"""
@@ -0,0 +1,245 @@
+"""
+Бенчмарки розв'язків з історією вимірювань і контролем регресій.
+
+Кожна вибрана частина запускається `warmup` разів без вимірювання та `repeat` разів з
+вимірюванням; зберігаються min/median/p95 та пікова пам'ять (tracemalloc, окремий запуск).
+Результати дописуються в JSON-історію (і, за бажанням, у CSV), а медіана порівнюється з
+базовою лінією: якщо частина сповільнилась більше ніж на `threshold`, код виходу 1.
+Історія за замовчуванням - bench_history.json у корені репозиторію; вона залежить від машини,
+тому не комітиться (.gitignore), а базова лінія створюється першим запуском на кожній машині.
+
+Запуск (з кореня репозиторію):
+    python -m aoc.bench -y 2024 -d 9                 # перший запуск створює базову лінію
+    python -m aoc.bench -y 2024 -n 10 --threshold 0.1
+    python -m aoc.bench -y 2024 -d 9 --update-baseline
+"""
+
+import argparse
+import csv
+import json
+import math
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aoc.runner import (
+    ROOT,
+    Day,
+    capture_output,
+    discover,
+    load_module,
+    plan_jobs,
+    run_jobs,
+    run_part,
+)
+
+DEFAULT_HISTORY = ROOT / "bench_history.json"
+CSV_FIELDS = ["timestamp", "key", "runs", "min", "median", "p95", "peak_kb", "answer"]
+
+
+@dataclass
+class BenchResult:
+    """Статистика вимірювань однієї частини (час у секундах, пам'ять у KiB)."""
+    year: int
+    day: int
+    part: Optional[int]
+    runs: int = 0
+    min: float = 0.0
+    median: float = 0.0
+    p95: float = 0.0
+    peak_kb: Optional[float] = None
+    answer: str = ""
+    error: Optional[str] = None
+    times: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/day{self.day}/part{'*' if self.part is None else self.part}"
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Перцентиль за методом найближчого рангу. Складність: O(n log n)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+def clear_caches(module) -> None:
+    """
+    Скидає functools.cache/lru_cache функцій модуля, щоб повторні запуски
+    не вимірювали вже закешовані відповіді.
+    """
+    for obj in vars(module).values():
+        cache_clear = getattr(obj, "cache_clear", None)
+        if callable(cache_clear):
+            cache_clear()
+
+
+def bench_part(day: Day, part: Optional[int], repeat: int = 5, warmup: int = 1,
+               memory: bool = True) -> BenchResult:
+    """
+    Вимірює одну частину: warmup + repeat запусків, потім (опційно) один запуск під tracemalloc.
+    Складність: O((warmup + repeat + 1) * T), де T - час розв'язку.
+    """
+    result = BenchResult(day.year, day.day, part)
+    try:
+        with capture_output():
+            module = load_module(day)
+    except BaseException as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+        return result
+
+    for i in range(warmup + repeat):
+        clear_caches(module)
+        run = run_part(day, part)
+        if run.error:
+            result.error = run.error
+            return result
+        if i >= warmup:
+            result.times.append(run.wall)
+        result.answer = run.answer
+
+    result.runs = len(result.times)
+    result.min = min(result.times)
+    result.median = statistics.median(result.times)
+    result.p95 = percentile(result.times, 0.95)
+
+    if memory:
+        clear_caches(module)
+        tracemalloc.start()
+        try:
+            run_part(day, part)
+            result.peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def _bench_job(job: tuple) -> BenchResult:
+    return bench_part(*job)
+
+
+def load_history(path: Path) -> Dict:
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {"baseline": {}, "runs": []}
+
+
+def save_history(path: Path, history: Dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2, ensure_ascii=False)
+
+
+def _summary(r: BenchResult, timestamp: str) -> Dict:
+    data = asdict(r)
+    data.pop("times")
+    data.update(timestamp=timestamp, key=r.key)
+    return data
+
+
+def record(history: Dict, results: List[BenchResult], update_baseline: bool = False) -> None:
+    """
+    Додає вимірювання в історію. Базова лінія створюється для нових частин
+    і перезаписується для всіх лише з update_baseline=True.
+    """
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    for r in results:
+        if r.error:
+            continue
+        summary = _summary(r, timestamp)
+        history["runs"].append(summary)
+        if update_baseline or r.key not in history["baseline"]:
+            history["baseline"][r.key] = summary
+
+
+def append_csv(path: Path, results: List[BenchResult]) -> None:
+    """Дописує рядки вимірювань у CSV (заголовок пишеться лише для нового файлу)."""
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    new_file = not path.exists()
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        if new_file:
+            writer.writeheader()
+        for r in results:
+            if not r.error:
+                writer.writerow(_summary(r, timestamp))
+
+
+def find_regressions(results: List[BenchResult], baseline: Dict, threshold: float,
+                     min_delta: float) -> List[tuple]:
+    """
+    Повертає [(key, базова медіана, поточна медіана)] для частин, чия медіана
+    перевищила базову більше ніж у (1 + threshold) разів і більше ніж на min_delta секунд
+    (абсолютний поріг відсікає шум на мікросекундних днях).
+    """
+    regressions = []
+    for r in results:
+        base = baseline.get(r.key)
+        if r.error or not base:
+            continue
+        if r.median > base["median"] * (1 + threshold) and r.median - base["median"] > min_delta:
+            regressions.append((r.key, base["median"], r.median))
+    return regressions
+
+
+def format_result(r: BenchResult, baseline: Dict) -> str:
+    if r.error:
+        return f"{r.key:<20} ERROR {r.error}"
+    base = baseline.get(r.key)
+    change = f"{(r.median / base['median'] - 1) * 100:+7.1f}%" if base and base["median"] else "    new"
+    peak = f"{r.peak_kb:10.1f} KiB" if r.peak_kb is not None else " " * 14
+    return (f"{r.key:<20} n={r.runs:<3} min {r.min:9.4f}s  median {r.median:9.4f}s  "
+            f"p95 {r.p95:9.4f}s  peak {peak}  {change}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки розв'язків Advent of Code")
+    parser.add_argument("-y", "--year", type=int, action="append", help="рік (можна кілька)")
+    parser.add_argument("-d", "--day", type=int, action="append", help="день (можна кілька)")
+    parser.add_argument("-p", "--part", type=int, action="append", choices=(1, 2), help="частина")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="кількість процесів (за замовчуванням 1, щоб вимірювання не заважали одне одному)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="кількість вимірюваних запусків")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="кількість запусків для розігріву")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON-файл історії")
+    parser.add_argument("--csv", type=Path, default=None, help="додатково дописувати результати в CSV")
+    parser.add_argument("--threshold", type=float, default=0.25, help="допустиме сповільнення медіани (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="мінімальна абсолютна різниця в секундах")
+    parser.add_argument("--update-baseline", action="store_true", help="записати поточні вимірювання як базову лінію")
+    parser.add_argument("--no-memory", action="store_true", help="не вимірювати пікову пам'ять")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    days = discover(args.year, args.day)
+    if not days:
+        print("No solutions found.", file=sys.stderr)
+        return 1
+
+    jobs = [(day, part, args.repeat, args.warmup, not args.no_memory)
+            for day, part in plan_jobs(days, args.part or (1, 2))]
+    results = run_jobs(jobs, args.jobs, job_func=_bench_job)
+
+    history = load_history(args.history)
+    regressions = find_regressions(results, history["baseline"], args.threshold, args.min_delta)
+    for r in results:
+        print(format_result(r, history["baseline"]))
+
+    record(history, results, args.update_baseline)
+    save_history(args.history, history)
+    if args.csv:
+        append_csv(args.csv, results)
+
+    for key, base, now in regressions:
+        print(f"REGRESSION {key}: median {base:.4f}s -> {now:.4f}s", file=sys.stderr)
+    return 1 if regressions or any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+import unittest
+
+from aoc.bench import BenchResult, find_regressions, percentile, record
+
+
+class TestBench(unittest.TestCase):
+
+    def test_percentile_nearest_rank(self):
+        self.assertEqual(percentile([3.0, 1.0, 2.0], 0.5), 2.0)
+        self.assertEqual(percentile([float(i) for i in range(1, 21)], 0.95), 19.0)
+        self.assertEqual(percentile([5.0], 0.95), 5.0)
+
+    def test_record_sets_baseline_only_for_new_keys(self):
+        history = {"baseline": {}, "runs": []}
+        record(history, [BenchResult(2024, 9, 2, runs=3, median=1.0)])
+        record(history, [BenchResult(2024, 9, 2, runs=3, median=2.0)])
+        self.assertEqual(history["baseline"]["2024/day9/part2"]["median"], 1.0)
+        self.assertEqual(len(history["runs"]), 2)
+
+        record(history, [BenchResult(2024, 9, 2, runs=3, median=2.0)], update_baseline=True)
+        self.assertEqual(history["baseline"]["2024/day9/part2"]["median"], 2.0)
+
+    def test_find_regressions_uses_relative_and_absolute_thresholds(self):
+        baseline = {"2024/day9/part2": {"median": 0.4}, "2024/day1/part1": {"median": 0.001}}
+        results = [
+            BenchResult(2024, 9, 2, median=1.0),   # x2.5 - регресія
+            BenchResult(2024, 1, 1, median=0.002),  # x2, але лише на 1 мс - шум
+            BenchResult(2024, 5, None, median=9.0),  # немає базової лінії
+        ]
+        self.assertEqual(find_regressions(results, baseline, 0.25, 0.005), [("2024/day9/part2", 0.4, 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
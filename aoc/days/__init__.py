@@ -0,0 +1,66 @@
+"""
+Скрипти днів як модулі з іменами, які можна імпортувати: aoc.days.y2024_day19 -> 2024/day19/script.py.
+
+Каталоги `20xx/dayN` не є пакетами Python (ім'я починається з цифри), тому скрипт
+завантажується через пошуковик модулів, який ставиться в sys.meta_path при імпорті цього пакета.
+Дочірній процес пулу (і з методом запуску spawn/forkserver) розпаковує функцію дня
+за іменем модуля: імпорт aoc.days.y2024_day19 знову ставить пошуковик і знаходить той самий файл.
+
+Приклад:
+    module = importlib.import_module("aoc.days.y2024_day19")
+"""
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+NAME_RE = re.compile(r"y(\d{4})_day(\d+)")
+
+
+def module_name(year: int, day: int) -> str:
+    return f"{__name__}.y{year}_day{day}"
+
+
+def script_path(year: int, day: int) -> Path:
+    return ROOT / str(year) / f"day{day}" / "script.py"
+
+
+class ScriptLoader(importlib.machinery.SourceFileLoader):
+    """
+    Виконує script.py дня, тимчасово додаючи каталоги дня та року в sys.path,
+    бо скрипти імпортують сусідні модулі (наприклад, `from utils import timer`).
+    """
+
+    def exec_module(self, module):
+        path = Path(self.path)
+        extra_paths = [str(path.parent), str(path.parent.parent)]
+        sys.path[:0] = extra_paths
+        try:
+            super().exec_module(module)
+        finally:
+            for p in extra_paths:
+                sys.path.remove(p)
+
+
+def spec_for(name: str, path: Path):
+    return importlib.util.spec_from_file_location(name, path, loader=ScriptLoader(name, str(path)))
+
+
+class ScriptFinder(importlib.abc.MetaPathFinder):
+    """Знаходить aoc.days.yYYYY_dayN у `YYYY/dayN/script.py` кореня репозиторію."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        package, _, leaf = fullname.rpartition(".")
+        match = NAME_RE.fullmatch(leaf)
+        if package != __name__ or not match:
+            return None
+        script = script_path(int(match[1]), int(match[2]))
+        return spec_for(fullname, script) if script.is_file() else None
+
+
+if not any(isinstance(finder, ScriptFinder) for finder in sys.meta_path):
+    sys.meta_path.append(ScriptFinder())
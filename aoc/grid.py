@@ -0,0 +1,170 @@
+"""
+Компактна сітка для задач на двовимірних картах.
+
+Клітинки зберігаються в одному bytearray з рамкою-сторожем (padding) навколо карти,
+тому сусіда клітинки i можна отримати як i + offset без перевірки меж: вихід за карту
+завжди потрапляє на клітинку зі значенням OUTSIDE.
+
+Індекс клітинки (r, c) дорівнює (r + pad) * stride + (c + pad), де stride = width + 2 * pad.
+Напрямки 0..3 - вгору, вправо, вниз, вліво (поворот праворуч = (d + 1) % 4).
+
+Приклад:
+    grid = Grid.from_file("2023/day16/input.txt")
+    i = grid.index(0, 0)
+    up, right, down, left = grid.offsets4
+    if grid[i + right] != OUTSIDE: ...
+"""
+
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from aoc.inputs import InputFile
+
+OUTSIDE = 0  # Значення клітинок рамки-сторожа
+
+
+class Grid:
+    """
+    Сітка width x height поверх плоского bytearray з рамкою-сторожем шириною pad.
+    Значення клітинок - байти (коди символів або малі числа після translate()).
+    """
+
+    __slots__ = ("cells", "width", "height", "pad", "stride")
+
+    def __init__(self, cells: bytearray, width: int, height: int, pad: int = 1):
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Union[str, bytes]], pad: int = 1, fill: int = OUTSIDE) -> "Grid":
+        """
+        Будує сітку з рядків однакової довжини.
+        Складність: O(H * W).
+        """
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        rows = [row.rstrip(b"\r\n") for row in rows if row.strip()]
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+        stride = width + 2 * pad
+
+        border = bytes([fill]) * pad
+        cells = bytearray(bytes([fill]) * (stride * pad))
+        for row in rows:
+            cells += border + row + border
+        cells += bytes([fill]) * (stride * pad)
+        return cls(cells, width, height, pad)
+
+    @classmethod
+    def from_file(cls, file_path, pad: int = 1, fill: int = OUTSIDE) -> "Grid":
+        with InputFile(file_path) as source:
+            return cls.from_lines(source.line_views(), pad, fill)
+
+    # --- Координати ---
+
+    def index(self, r: int, c: int) -> int:
+        return (r + self.pad) * self.stride + c + self.pad
+
+    def coords(self, i: int) -> Tuple[int, int]:
+        r, c = divmod(i, self.stride)
+        return r - self.pad, c - self.pad
+
+    def inside(self, i: int) -> bool:
+        """Чи належить плоский індекс самій карті (а не рамці)."""
+        r, c = self.coords(i)
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    @property
+    def offsets4(self) -> Tuple[int, int, int, int]:
+        """Зміщення індексу для напрямків вгору, вправо, вниз, вліво."""
+        return (-self.stride, 1, self.stride, -1)
+
+    @property
+    def offsets8(self) -> Tuple[int, ...]:
+        """Зміщення індексу для 8 сусідів (за годинниковою стрілкою, починаючи з верхнього)."""
+        s = self.stride
+        return (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    # --- Доступ до клітинок ---
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int) -> None:
+        self.cells[i] = value
+
+    def get(self, r: int, c: int) -> int:
+        return self.cells[self.index(r, c)]
+
+    def find(self, value: Union[int, str]) -> int:
+        """Плоский індекс першої клітинки з даним значенням або -1."""
+        if isinstance(value, str):
+            value = ord(value)
+        return self.cells.find(value)
+
+    def find_all(self, value: Union[int, str]) -> List[int]:
+        if isinstance(value, str):
+            value = ord(value)
+        cells, result = self.cells, []
+        i = cells.find(value)
+        while i != -1:
+            result.append(i)
+            i = cells.find(value, i + 1)
+        return result
+
+    def positions(self) -> Iterator[int]:
+        """Плоскі індекси всіх клітинок карти (без рамки) у порядку рядків."""
+        for r in range(self.height):
+            start = self.index(r, 0)
+            yield from range(start, start + self.width)
+
+    # --- Копіювання та зміна ---
+
+    def copy(self) -> "Grid":
+        """Копія за O(H * W) одним memcpy."""
+        return Grid(self.cells[:], self.width, self.height, self.pad)
+
+    def translate(self, table: bytes) -> "Grid":
+        """Нова сітка з перетвореними значеннями (bytes.maketrans / 256-байтна таблиця)."""
+        return Grid(self.cells.translate(table), self.width, self.height, self.pad)
+
+    @contextmanager
+    def patched(self, i: int, value: Union[int, str]):
+        """
+        Тимчасово змінює одну клітинку і відновлює її після блоку with.
+        Дешевша альтернатива копіюванню всієї сітки заради однієї зміни.
+        """
+        if isinstance(value, str):
+            value = ord(value)
+        old = self.cells[i]
+        self.cells[i] = value
+        try:
+            yield self
+        finally:
+            self.cells[i] = old
+
+    # --- Вивід ---
+
+    def rows(self) -> List[str]:
+        return [self.cells[self.index(r, 0):self.index(r, self.width)].decode("latin-1")
+                for r in range(self.height)]
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows())
+
+    def __repr__(self) -> str:
+        return f"Grid({self.width}x{self.height}, pad={self.pad})"
+
+
+def digits_table(outside: Optional[int] = None) -> bytes:
+    """
+    Таблиця для translate(): '0'..'9' -> 0..9.
+    Рамка (OUTSIDE) за замовчуванням стає 255, щоб не збігатися з цифрою 0.
+    """
+    table = bytearray(range(256))
+    for d in range(10):
+        table[ord("0") + d] = d
+    table[OUTSIDE] = 255 if outside is None else outside
+    return bytes(table)
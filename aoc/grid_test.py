@@ -0,0 +1,48 @@
+import unittest
+
+from aoc.grid import OUTSIDE, Grid, digits_table
+
+EXAMPLE = ["#..", ".^.", "..#"]
+
+
+class TestGrid(unittest.TestCase):
+
+    def test_from_lines_with_sentinel_border(self):
+        grid = Grid.from_lines(EXAMPLE)
+        self.assertEqual((grid.width, grid.height, grid.stride), (3, 3, 5))
+        self.assertEqual(grid.rows(), EXAMPLE)
+        self.assertEqual(grid.get(0, 0), ord("#"))
+        self.assertEqual(grid.get(-1, 0), OUTSIDE)
+        self.assertEqual(grid.get(1, 3), OUTSIDE)
+
+    def test_offsets_and_coords(self):
+        grid = Grid.from_lines(EXAMPLE)
+        start = grid.find("^")
+        self.assertEqual(grid.coords(start), (1, 1))
+        up, right, down, left = grid.offsets4
+        self.assertEqual(grid.coords(start + up), (0, 1))
+        self.assertEqual(grid[start + down + right], ord("#"))
+        self.assertEqual(sorted(grid.coords(i) for i in grid.find_all("#")), [(0, 0), (2, 2)])
+        self.assertEqual(sum(grid[start + o] == ord(".") for o in grid.offsets8), 6)
+        self.assertTrue(grid.inside(start))
+        self.assertFalse(grid.inside(grid.index(0, -1)))
+
+    def test_copy_and_patched_do_not_leak(self):
+        grid = Grid.from_lines(EXAMPLE)
+        i = grid.index(0, 1)
+        with grid.patched(i, "#"):
+            self.assertEqual(grid[i], ord("#"))
+        self.assertEqual(grid[i], ord("."))
+
+        copy = grid.copy()
+        copy[i] = ord("O")
+        self.assertEqual(grid[i], ord("."))
+
+    def test_digits_translation(self):
+        grid = Grid.from_lines(["19", "05"]).translate(digits_table())
+        self.assertEqual([grid.get(r, c) for r in range(2) for c in range(2)], [1, 9, 0, 5])
+        self.assertEqual(grid.get(-1, -1), 255)
+
+
+if __name__ == "__main__":
+    unittest.main()
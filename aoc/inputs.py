@@ -0,0 +1,192 @@
+"""
+Спільний шар читання вхідних даних.
+
+- Файл відкривається через mmap, тому рядки й сітки доступні як memoryview без копіювання.
+- Розібрані форми (рядки, числа, довільний парсер дня) кешуються на диску в pickle,
+  ключ - SHA-256 вмісту файлу та ідентичність парсера (ім'я і байт-код), тож повторні запуски не парсять знову.
+- Числа виділяються регулярним виразом по байтах замість `eval` на кожен рядок.
+
+Приклад:
+    from aoc.inputs import InputFile, cached
+
+    data = InputFile("2024/day18/input.txt")
+    points = data.int_tuples(2)              # [(40, 39), (45, 57), ...]
+    parsed = cached("2024/day5/input.txt", read_input_file)
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import re
+from array import array
+from pathlib import Path
+from typing import Callable, Iterator, List, NamedTuple, Tuple, TypeVar, Union
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "inputs"
+CACHE_VERSION = 1  # Збільшити, якщо змінюється формат кешу
+
+INT_RE = re.compile(rb"-?\d+")
+
+T = TypeVar("T")
+PathLike = Union[str, os.PathLike]
+
+
+class GridView(NamedTuple):
+    """
+    Сітка символів поверх буфера файлу без копіювання.
+    Клітинка (r, c) - це data[r * stride + c]; stride = width + 1 через символ нового рядка.
+    """
+    data: memoryview
+    width: int
+    height: int
+    stride: int
+
+    def cell(self, r: int, c: int) -> int:
+        return self.data[r * self.stride + c]
+
+    def row(self, r: int) -> memoryview:
+        start = r * self.stride
+        return self.data[start:start + self.width]
+
+
+class InputFile:
+    """
+    Вхідний файл, відображений у пам'ять (mmap).
+    Похідні форми обчислюються на вимогу; між запусками їх зберігає cached().
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # mmap не працює з порожніми файлами
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.data = memoryview(self._buffer)
+        self._digest = None
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 вмісту файлу (ключ кешу)."""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.data).hexdigest()
+        return self._digest
+
+    def text(self) -> str:
+        return bytes(self.data).decode("utf-8")
+
+    def line_views(self) -> Iterator[memoryview]:
+        """
+        Рядки як memoryview без копіювання (без '\\n' та '\\r').
+        Складність: O(N), де N - розмір файлу.
+        """
+        buf, data, n = self._buffer, self.data, len(self.data)
+        start = 0
+        while start < n:
+            end = buf.find(b"\n", start)
+            if end == -1:
+                end = n
+            stop = end - 1 if end > start and data[end - 1] == 13 else end
+            yield data[start:stop]
+            start = end + 1
+
+    def lines(self) -> List[str]:
+        """Рядки файлу як str (без символів нового рядка)."""
+        return self.text().splitlines()
+
+    def blocks(self) -> List[str]:
+        """Блоки, розділені порожнім рядком (формат більшості задач з двома секціями)."""
+        return self.text().replace("\r\n", "\n").strip("\n").split("\n\n")
+
+    def ints(self, typecode: str = "q") -> array:
+        """
+        Усі цілі числа файлу (зі знаком) у компактному масиві array.
+        Складність: O(N).
+        """
+        return array(typecode, map(int, INT_RE.findall(self.data)))
+
+    def int_tuples(self, width: int) -> List[Tuple[int, ...]]:
+        """Числа файлу, згруповані по width (наприклад, пари координат)."""
+        values = self.ints()
+        return [tuple(values[i:i + width]) for i in range(0, len(values) - width + 1, width)]
+
+    def grid(self) -> GridView:
+        """
+        Прямокутна сітка символів без копіювання.
+        Передбачає однакову довжину рядків і '\\n' як роздільник.
+        """
+        width = self._buffer.find(b"\n")
+        if width == -1:
+            width = len(self.data)
+        stride = width + 1
+        height = (len(self.data) + 1) // stride if width else 0
+        return GridView(self.data, width, height, stride)
+
+    def close(self) -> None:
+        """
+        Закриває mmap. Якщо назовні ще живуть memoryview (line_views, grid),
+        відображення залишається відкритим до збирання сміття.
+        """
+        try:
+            self.data.release()
+            if isinstance(self._buffer, mmap.mmap):
+                self._buffer.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parser_identity(parser: Callable) -> str:
+    """
+    Ідентичність парсера для ключа кешу: модуль, ім'я та, для функцій Python, хеш байт-коду,
+    констант і рядка визначення. Дві лямбди в одній функції мають однакове ім'я, але різний код.
+    """
+    name = f"{getattr(parser, '__module__', '')}.{getattr(parser, '__qualname__', repr(parser))}"
+    code = getattr(parser, "__code__", None)
+    if code is None:
+        return name
+    body = hashlib.sha256(code.co_code + repr((code.co_consts, code.co_names, code.co_firstlineno)).encode())
+    return f"{name}:{body.hexdigest()}"
+
+
+def cached(path: PathLike, parser: Callable[[InputFile], T], cache_dir: Path = CACHE_DIR) -> T:
+    """
+    Повертає parser(InputFile(path)), кешуючи результат у pickle.
+    Ключ кешу - хеш вмісту файлу та ідентичність парсера (parser_identity), тому зміна вхідних
+    даних або коду парсера автоматично інвалідує кеш. Зміни у функціях, які парсер викликає,
+    не відстежуються: для цього є CACHE_VERSION.
+    """
+    with InputFile(path) as source:
+        key = hashlib.sha256(f"{CACHE_VERSION}:{source.digest}:{parser_identity(parser)}".encode()).hexdigest()
+        cache_file = cache_dir / f"{key}.pickle"
+
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    return pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass  # Пошкоджений кеш - просто парсимо ще раз
+
+        result = parser(source)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_file)  # Атомарно: паралельні процеси раннера не бачать неповний файл
+    return result
+
+
+def read_lines(path: PathLike) -> List[str]:
+    """Рядки файлу, закешовані за хешем вмісту."""
+    return cached(path, InputFile.lines)
+
+
+def read_ints(path: PathLike) -> array:
+    """Усі цілі числа файлу, закешовані за хешем вмісту."""
+    return cached(path, InputFile.ints)
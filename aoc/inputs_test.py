@@ -0,0 +1,69 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc.inputs import InputFile, cached
+
+
+class TestInputs(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_lines_ints_and_tuples(self):
+        path = self.tmp_path / "input.txt"
+        path.write_bytes(b"40,39\r\n-5,7\n13,25\n")
+        with InputFile(path) as source:
+            self.assertEqual([bytes(v) for v in source.line_views()], [b"40,39", b"-5,7", b"13,25"])
+            self.assertEqual(source.lines(), ["40,39", "-5,7", "13,25"])
+            self.assertEqual(list(source.ints()), [40, 39, -5, 7, 13, 25])
+            self.assertEqual(source.int_tuples(2), [(40, 39), (-5, 7), (13, 25)])
+
+    def test_grid_view_without_copy(self):
+        path = self.tmp_path / "grid.txt"
+        path.write_text("#..\n.^.\n..#\n")
+        grid = InputFile(path).grid()
+        self.assertEqual((grid.width, grid.height), (3, 3))
+        self.assertEqual(chr(grid.cell(1, 1)), "^")
+        self.assertEqual(bytes(grid.row(2)), b"..#")
+
+    def test_empty_file(self):
+        path = self.tmp_path / "empty.txt"
+        path.write_text("")
+        with InputFile(path) as source:
+            self.assertEqual(source.lines(), [])
+            self.assertEqual(list(source.ints()), [])
+            self.assertEqual(source.grid().height, 0)
+
+    def test_cached_is_keyed_by_content(self):
+        calls = []
+
+        def parser(source):
+            calls.append(1)
+            return source.lines()
+
+        path = self.tmp_path / "input.txt"
+        cache_dir = self.tmp_path / "cache"
+        path.write_text("a\nb\n")
+        self.assertEqual(cached(path, parser, cache_dir), ["a", "b"])
+        self.assertEqual(cached(path, parser, cache_dir), ["a", "b"])
+        self.assertEqual(len(calls), 1)
+
+        path.write_text("c\n")
+        self.assertEqual(cached(path, parser, cache_dir), ["c"])
+        self.assertEqual(len(calls), 2)
+
+    def test_cached_distinguishes_lambdas_with_same_name(self):
+        path = self.tmp_path / "input.txt"
+        cache_dir = self.tmp_path / "cache"
+        path.write_text("1 2\n3\n")
+        self.assertEqual(cached(path, lambda source: source.lines(), cache_dir), ["1 2", "3"])
+        self.assertEqual(cached(path, lambda source: list(source.ints()), cache_dir), [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
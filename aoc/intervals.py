@@ -0,0 +1,271 @@
+"""
+Робота з діапазонами цілих чисел.
+
+IntervalSet - множина цілих чисел як відсортований список неперетинних напіввідкритих
+діапазонів [початок, кінець). Належність перевіряється через bisect за O(log n);
+є масове додавання, перетин, об'єднання, доповнення, сумарна довжина і пакетна перевірка
+contains_many, що сортує запити і проходить по діапазонах один раз.
+
+IntervalMap - кусково-лінійне відображення x -> x + зсув, де зсув сталий на кожному
+напіввідкритому відрізку [початок, наступний початок). Поза всіма відрізками відображення тотожне.
+Відображення можна складати між собою (результат - знову IntervalMap), тому ланцюжок
+перетворень зводиться до одного відсортованого списку точок розриву з пошуком через bisect.
+
+Приклад:
+    fresh = IntervalSet.from_inclusive([(3, 5), (10, 14), (12, 18)])
+    17 in fresh, fresh.total, fresh.contains_many([1, 5, 8])
+
+    soil = IntervalMap.from_ranges([(50, 98, 2), (52, 50, 48)])  # (куди, звідки, довжина)
+    soil(79) == 81
+    chain = soil.then(fertilizer)
+    chain.map_ranges([(79, 93)])
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Sequence, Tuple
+
+Range = Tuple[int, int]  # Напіввідкритий діапазон [початок, кінець)
+
+
+class IntervalMap:
+    """Кусково-лінійне відображення: starts - відсортовані точки розриву, offsets[k] діє на [starts[k], starts[k+1])."""
+
+    __slots__ = ("starts", "offsets")
+
+    def __init__(self, starts: Sequence[int] = (), offsets: Sequence[int] = ()):
+        # Сусідні відрізки з однаковим зсувом зливаються, а початковий нульовий зсув не потрібен
+        self.starts: List[int] = []
+        self.offsets: List[int] = []
+        previous = 0
+        for start, offset in zip(starts, offsets):
+            if offset != previous:
+                self.starts.append(start)
+                self.offsets.append(offset)
+                previous = offset
+
+    @classmethod
+    def from_ranges(cls, rows: Iterable[Sequence[int]]) -> "IntervalMap":
+        """
+        Будує відображення з рядків (куди, звідки, довжина) у форматі карт Advent of Code.
+        Складність: O(r log r), де r - кількість рядків.
+        """
+        starts, offsets = [], []
+        end = None
+        for destination, source, length in sorted(rows, key=lambda row: row[1]):
+            if end is not None and end < source:
+                starts.append(end)  # Проміжок між відрізками - тотожний
+                offsets.append(0)
+            starts.append(source)
+            offsets.append(destination - source)
+            end = source + length
+        if end is not None:
+            starts.append(end)
+            offsets.append(0)
+        return cls(starts, offsets)
+
+    def offset_at(self, x: int) -> int:
+        k = bisect_right(self.starts, x) - 1
+        return self.offsets[k] if k >= 0 else 0
+
+    # Складність: O(log n)
+    def __call__(self, x: int) -> int:
+        return x + self.offset_at(x)
+
+    def pieces(self) -> Iterable[Tuple[float, float, int]]:
+        """Усі відрізки (початок, кінець, зсув), включно з нескінченними тотожними краями."""
+        bounds = [float("-inf")] + self.starts + [float("inf")]
+        offsets = [0] + self.offsets
+        return zip(bounds, bounds[1:], offsets)
+
+    # Складність: O((n + m) log m), де n, m - кількість відрізків у self і other
+    def then(self, other: "IntervalMap") -> "IntervalMap":
+        """Композиція: спочатку self, потім other (x -> other(self(x)))."""
+        points = set(self.starts)
+        for start, end, offset in self.pieces():
+            # Точки розриву other, що потрапляють в образ відрізка, переносяться назад у координати self
+            low = bisect_right(other.starts, start + offset)
+            high = bisect_left(other.starts, end + offset)
+            points.update(b - offset for b in other.starts[low:high])
+        points = sorted(points)
+        return IntervalMap(points, [self.offset_at(p) + other.offset_at(self(p)) for p in points])
+
+    @classmethod
+    def compose(cls, maps: Iterable["IntervalMap"]) -> "IntervalMap":
+        """Зводить ланцюжок відображень (у порядку застосування) до одного."""
+        result = cls()
+        for interval_map in maps:
+            result = result.then(interval_map)
+        return result
+
+    # Складність: O(q log n + k), де q - кількість діапазонів, k - кількість шматків результату
+    def map_ranges(self, ranges: Iterable[Range]) -> List[Range]:
+        """Образи діапазонів: кожен розрізається в точках розриву, і кожен шматок зсувається."""
+        starts, offsets = self.starts, self.offsets
+        out = []
+        for start, end in ranges:
+            k = bisect_right(starts, start) - 1
+            position = start
+            while position < end:
+                piece_end = starts[k + 1] if k + 1 < len(starts) else end
+                piece_end = min(piece_end, end)
+                offset = offsets[k] if k >= 0 else 0
+                out.append((position + offset, piece_end + offset))
+                position = piece_end
+                k += 1
+        return out
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IntervalMap) and (self.starts, self.offsets) == (other.starts, other.offsets)
+
+    def __repr__(self) -> str:
+        return f"IntervalMap({list(zip(self.starts, self.offsets))})"
+
+
+class IntervalSet:
+    """Множина цілих чисел: starts і ends - відсортовані межі неперетинних діапазонів [starts[k], ends[k])."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, ranges: Iterable[Range] = ()):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        if ranges:  # Порожня множина (проміжні результати операцій) створюється без сортування
+            self.update(ranges)
+
+    @classmethod
+    def from_inclusive(cls, ranges: Iterable[Range]) -> "IntervalSet":
+        """Множина з діапазонів із включним кінцем (start, stop), як їх зазвичай задають у задачах."""
+        return cls((start, stop + 1) for start, stop in ranges)
+
+    def to_inclusive(self) -> List[Range]:
+        return [(start, end - 1) for start, end in zip(self.starts, self.ends)]
+
+    # Складність: O((n + k) log(n + k)), де k - кількість нових діапазонів
+    def update(self, ranges: Iterable[Range]) -> None:
+        """Масове додавання: нові діапазони зливаються з наявними одним проходом після сортування."""
+        merged_starts, merged_ends = [], []
+        for start, end in sorted(list(zip(self.starts, self.ends)) + [r for r in ranges if r[0] < r[1]]):
+            if merged_ends and start <= merged_ends[-1]:  # Перетин або стик - зливаємо
+                if end > merged_ends[-1]:
+                    merged_ends[-1] = end
+            else:
+                merged_starts.append(start)
+                merged_ends.append(end)
+        self.starts, self.ends = merged_starts, merged_ends
+
+    # Складність: O(log n + m), де m - кількість поглинутих діапазонів
+    def add(self, start: int, end: int) -> None:
+        """Додає один діапазон [start, end)."""
+        if start >= end:
+            return
+        low = bisect_left(self.ends, start)      # Перший діапазон, що закінчується не раніше start
+        high = bisect_right(self.starts, end)    # Діапазони з початком <= end зливаються з новим
+        if low < high:
+            start = min(start, self.starts[low])
+            end = max(end, self.ends[high - 1])
+        self.starts[low:high] = [start]
+        self.ends[low:high] = [end]
+
+    # Складність: O(log n)
+    def __contains__(self, x: int) -> bool:
+        k = bisect_right(self.starts, x) - 1
+        return k >= 0 and x < self.ends[k]
+
+    # Складність: O(q log q + n)
+    def contains_many(self, values: Sequence[int]) -> List[bool]:
+        """Пакетна перевірка: запити сортуються, і діапазони проходяться одним вказівником."""
+        result = [False] * len(values)
+        starts, ends = self.starts, self.ends
+        k = 0
+        for i in sorted(range(len(values)), key=values.__getitem__):
+            x = values[i]
+            while k < len(ends) and ends[k] <= x:
+                k += 1
+            if k == len(ends):
+                break
+            result[i] = starts[k] <= x
+        return result
+
+    @property
+    def total(self) -> int:
+        """Кількість цілих чисел у множині."""
+        return sum(self.ends) - sum(self.starts)
+
+    def __len__(self) -> int:
+        """Кількість діапазонів."""
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        result = IntervalSet()
+        result.starts, result.ends = self.starts[:], self.ends[:]
+        result.update(other)
+        return result
+
+    # Складність: O(n + m)
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        result = IntervalSet()
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start < end:
+                result.starts.append(start)
+                result.ends.append(end)
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    # Складність: O(log n + k), де k - кількість діапазонів, що перетинають [low, high)
+    def clip(self, low: int, high: int) -> "IntervalSet":
+        """Перетин з одним діапазоном [low, high): межі вирізаються бінарним пошуком, без злиття."""
+        first = bisect_right(self.ends, low)    # Перший діапазон, що закінчується після low
+        last = bisect_left(self.starts, high)   # Діапазони з початком < high
+        result = IntervalSet.__new__(IntervalSet)  # Без __init__: межі вже відсортовані й не перетинаються
+        if low >= high:
+            result.starts, result.ends = [], []
+            return result
+        starts, ends = self.starts[first:last], self.ends[first:last]
+        if starts:
+            if starts[0] < low:
+                starts[0] = low
+            if ends[-1] > high:
+                ends[-1] = high
+        result.starts, result.ends = starts, ends
+        return result
+
+    # Складність: O(n)
+    def complement(self, low: int, high: int) -> "IntervalSet":
+        """Числа з [low, high), що не входять у множину."""
+        result = IntervalSet()
+        position = low
+        for start, end in zip(self.starts, self.ends):
+            if start > position:
+                result.starts.append(position)
+                result.ends.append(min(start, high))
+            position = max(position, end)
+            if position >= high:
+                break
+        if position < high:
+            result.starts.append(position)
+            result.ends.append(high)
+        return result
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.intersection(other)
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.union(other)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IntervalSet) and (self.starts, self.ends) == (other.starts, other.ends)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
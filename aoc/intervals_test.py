@@ -0,0 +1,92 @@
+import random
+import unittest
+
+from aoc.intervals import IntervalMap, IntervalSet
+
+SOIL = [(50, 98, 2), (52, 50, 48)]
+FERTILIZER = [(0, 15, 37), (37, 52, 2), (39, 0, 15)]
+
+
+def brute(rows, x):
+    for destination, source, length in rows:
+        if source <= x < source + length:
+            return x - source + destination
+    return x
+
+
+class TestIntervalMap(unittest.TestCase):
+
+    def test_lookup_matches_row_scan(self):
+        soil = IntervalMap.from_ranges(SOIL)
+        self.assertEqual([soil(x) for x in (0, 49, 50, 79, 97, 98, 99, 100)], [0, 49, 52, 81, 99, 50, 51, 100])
+
+    def test_composition_equals_sequential_application(self):
+        rng = random.Random(5)
+        layers = [[(rng.randrange(200), rng.randrange(200), rng.randrange(1, 30)) for _ in range(5)] for _ in range(4)]
+        # Відрізки джерел у межах одного шару не повинні перетинатися
+        for rows in layers:
+            rows.sort(key=lambda row: row[1])
+            for i in range(1, len(rows)):
+                destination, source, length = rows[i]
+                previous_end = rows[i - 1][1] + rows[i - 1][2]
+                rows[i] = (destination, max(source, previous_end), length)
+
+        composed = IntervalMap.compose(IntervalMap.from_ranges(rows) for rows in layers)
+        for x in range(-5, 300):
+            expected = x
+            for rows in layers:
+                expected = brute(rows, expected)
+            self.assertEqual(composed(x), expected)
+
+    def test_map_ranges_splits_at_breakpoints(self):
+        chain = IntervalMap.from_ranges(SOIL).then(IntervalMap.from_ranges(FERTILIZER))
+        pieces = chain.map_ranges([(45, 100)])
+        self.assertEqual(sum(end - start for start, end in pieces), 55)
+        expected = sorted(brute(FERTILIZER, brute(SOIL, x)) for x in range(45, 100))
+        self.assertEqual(sorted(x for start, end in pieces for x in range(start, end)), expected)
+
+    def test_identity_and_normalisation(self):
+        self.assertEqual(IntervalMap()(123), 123)
+        self.assertEqual(IntervalMap.from_ranges([(10, 10, 5)]), IntervalMap())
+        self.assertEqual(IntervalMap.from_ranges([(0, 5, 5), (5, 10, 5)]), IntervalMap([5, 15], [-5, 0]))
+
+
+class TestIntervalSet(unittest.TestCase):
+
+    def test_merge_and_membership(self):
+        fresh = IntervalSet.from_inclusive([(3, 5), (10, 14), (16, 20), (12, 18)])
+        self.assertEqual(fresh.to_inclusive(), [(3, 5), (10, 20)])
+        self.assertEqual(fresh.total, 14)
+        self.assertEqual(len(fresh), 2)
+        self.assertEqual([x in fresh for x in (1, 3, 5, 6, 20, 21)], [False, True, True, False, True, False])
+        self.assertEqual(fresh.contains_many([21, 1, 11, 5, 17, 8]), [False, False, True, True, True, False])
+
+    def test_add_matches_bulk_update(self):
+        rng = random.Random(3)
+        ranges = [(a, a + rng.randrange(1, 15)) for a in (rng.randrange(200) for _ in range(60))]
+        incremental = IntervalSet()
+        for start, end in ranges:
+            incremental.add(start, end)
+        self.assertEqual(incremental, IntervalSet(ranges))
+        self.assertEqual({x for x in range(-5, 230) if x in incremental}, {x for a, b in ranges for x in range(a, b)})
+
+    def test_algebra(self):
+        a = IntervalSet([(0, 10), (20, 30)])
+        b = IntervalSet([(5, 25)])
+        self.assertEqual(list(a & b), [(5, 10), (20, 25)])
+        self.assertEqual(list(a | b), [(0, 30)])
+        self.assertEqual(list(a.complement(-5, 35)), [(-5, 0), (10, 20), (30, 35)])
+        self.assertEqual(list(IntervalSet().complement(0, 4)), [(0, 4)])
+        self.assertFalse(IntervalSet([(3, 3)]))
+
+    def test_clip_matches_intersection(self):
+        rng = random.Random(7)
+        ranges = [(a, a + rng.randrange(1, 10)) for a in (rng.randrange(100) for _ in range(20))]
+        values = IntervalSet(ranges)
+        for low in range(-5, 110, 7):
+            for high in range(low, 115, 11):
+                self.assertEqual(values.clip(low, high), values & IntervalSet([(low, high)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,339 @@
+"""
+Єдиний запускач розв'язків для всіх років.
+
+Знаходить усі модулі `20xx/dayN/script.py`, виконує вибрані роки/дні/частини
+у ProcessPoolExecutor на всіх ядрах і виводить відповіді разом з wall/CPU часом.
+
+Запуск (з кореня репозиторію):
+    python -m aoc.runner                      # усі роки, усі дні
+    python -m aoc.runner -y 2024 -d 6 -d 9    # вибрані дні
+    python -m aoc.runner -y 2023 -p 2 -j 8    # лише друга частина, 8 процесів
+
+Як запускається день:
+1. Якщо скрипт має функції частин (task_1/task1/task_one/part_1/...), що приймають
+   шлях до файлу, кожна частина запускається окремою задачею та має власний час.
+2. Інакше виконується `main()` (з явним шляхом до input.txt, якщо `main` його приймає)
+   або весь скрипт як `__main__`; відповіді беруться з рядків "Part 1: ..." / "Task 1: ...".
+   Такий день не можна обмежити однією частиною: з `-p` він все одно запускається цілком
+   (з попередженням у stderr).
+
+CPU час включає дочірні процеси, які скрипт запустив і дочекався (пули процесів усередині днів);
+на платформах без модуля `resource` (Windows) рахується лише сам процес.
+"""
+
+import argparse
+import importlib.util
+import inspect
+import io
+import logging
+import os
+import re
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from aoc import days as day_modules
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Імена параметрів, за якими розпізнаємо функції, що приймають шлях до вхідного файлу
+PATH_PARAMS = {"file_path", "filepath", "filename", "file_name", "path"}
+
+PART_NAMES = {
+    1: ("task_1", "task1", "task_one", "part_1", "part1", "part_one"),
+    2: ("task_2", "task2", "task_two", "part_2", "part2", "part_two"),
+}
+
+ANSWER_RE = re.compile(
+    r"^(?:part|task)\s*(one|two|1|2)\b(?:\s*result)?\s*:[\s,]*(.+?)\s*(?:\((?:time:\s*)?[\d.]+s\))?$",
+    re.IGNORECASE,
+)
+
+_modules: Dict[str, object] = {}
+
+
+@dataclass(frozen=True)
+class Day:
+    """Один знайдений день: рік, номер дня та шлях до script.py."""
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def input_path(self) -> Path:
+        return self.path.parent / "input.txt"
+
+
+@dataclass
+class PartResult:
+    """
+    Результат запуску однієї частини.
+    part=None означає, що день виконувався цілком через main() і час спільний для обох частин.
+    """
+    year: int
+    day: int
+    part: Optional[int]
+    answer: str = ""
+    wall: float = 0.0
+    cpu: float = 0.0
+    error: Optional[str] = None
+
+
+def discover(years: Optional[Iterable[int]] = None, days: Optional[Iterable[int]] = None) -> List[Day]:
+    """
+    Знаходить усі `20xx/dayN/script.py` у корені репозиторію.
+    Складність: O(Y * D), де Y - кількість років, D - кількість днів.
+    """
+    years = set(years) if years else None
+    days = set(days) if days else None
+    found = []
+    for year_dir in ROOT.glob("20[0-9][0-9]"):
+        year = int(year_dir.name)
+        if years is not None and year not in years:
+            continue
+        for script in year_dir.glob("day*/script.py"):
+            day_suffix = script.parent.name[3:]
+            if not day_suffix.isdigit():
+                continue
+            day = int(day_suffix)
+            if days is None or day in days:
+                found.append(Day(year, day, script))
+    return sorted(found, key=lambda d: (d.year, d.day))
+
+
+@contextmanager
+def capture_output():
+    """
+    Перехоплює stdout, stderr та повідомлення logging у буфер.
+    Кореневий логер отримує власний обробник ще до імпорту скрипта, тому
+    `logging.basicConfig` у скриптах 2025 року нічого не змінює.
+    """
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+    try:
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            yield buffer
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+
+def load_module(day: Day):
+    """
+    Імпортує script.py дня як aoc.days.y2024_day6, щоб модулі різних днів не конфліктували,
+    а дочірні процеси пулів усередині днів могли імпортувати функції дня за тим самим іменем
+    (див. aoc.days). Скрипт поза звичним розміщенням (наприклад, у тестах) завантажується
+    під тим самим іменем напряму з файлу.
+    """
+    name = day_modules.module_name(day.year, day.day)
+    if name in _modules:
+        return _modules[name]
+
+    if day.path.resolve() == day_modules.script_path(day.year, day.day):
+        module = importlib.import_module(name)
+    else:
+        spec = day_modules.spec_for(name, day.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+
+    _modules[name] = module
+    return module
+
+
+def _accepts_path(func: Callable) -> bool:
+    try:
+        params = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    return bool(params) and params[0].name in PATH_PARAMS
+
+
+def find_part_functions(module) -> Dict[int, Callable]:
+    """
+    Повертає {номер частини: функція(file_path)} для скриптів з окремими функціями частин.
+    Якщо хоч одна з наявних функцій частин не приймає шлях, повертає {} (день запускається цілком).
+    """
+    parts = {}
+    for part, names in PART_NAMES.items():
+        funcs = [getattr(module, name) for name in names if callable(getattr(module, name, None))]
+        if not funcs:
+            continue
+        if not _accepts_path(funcs[0]):
+            return {}
+        parts[part] = funcs[0]
+    return parts
+
+
+def parse_answers(text: str) -> Dict[int, str]:
+    """Витягує відповіді з виводу скрипта ("Part one: 42", "Task 2: 7 (time: ...)")."""
+    answers = {}
+    for line in text.splitlines():
+        match = ANSWER_RE.match(line.strip())
+        if match:
+            key = match.group(1).lower()
+            answers[{"one": 1, "two": 2}.get(key, None) or int(key)] = match.group(2)
+    return answers
+
+
+def _run_main(module, day: Day):
+    """Запускає день цілком: main(file_path), main() або сам скрипт як __main__."""
+    main = getattr(module, "main", None)
+    if callable(main):
+        params = inspect.signature(main).parameters
+        if "file_path" in params:
+            return main(file_path=str(day.input_path))
+        if not params:
+            return main()
+    runpy.run_path(str(day.path), run_name="__main__")
+    return None
+
+
+def cpu_time() -> float:
+    """CPU час поточного процесу плюс завершених дочірніх процесів, якщо платформа це дозволяє."""
+    total = time.process_time()
+    if resource is not None:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        total += children.ru_utime + children.ru_stime
+    return total
+
+
+def run_part(day: Day, part: Optional[int]) -> PartResult:
+    """
+    Виконує одну частину дня (або весь день, якщо part=None) та вимірює wall/CPU час.
+    Винятки не пробиваються назовні, а записуються в PartResult.error.
+    """
+    result = PartResult(day.year, day.day, part)
+    with capture_output() as buffer:
+        try:
+            module = load_module(day)
+            func = find_part_functions(module).get(part) if part is not None else None
+
+            wall, cpu = time.perf_counter(), cpu_time()
+            value = func(str(day.input_path)) if func else _run_main(module, day)
+            result.wall = time.perf_counter() - wall
+            result.cpu = cpu_time() - cpu
+        except BaseException as exc:  # SystemExit з exit() у скриптах теж вважаємо помилкою дня
+            result.error = f"{type(exc).__name__}: {exc}"
+            return result
+
+    answers = parse_answers(buffer.getvalue())
+    if part is None:
+        if isinstance(value, tuple) and not answers:
+            answers = {i: str(v) for i, v in enumerate(value, 1)}
+        result.answer = " | ".join(f"{p}: {a}" for p, a in sorted(answers.items()))
+    elif value is not None:
+        result.answer = str(value)
+    else:
+        # Деякі функції частин лише друкують результат
+        lines = buffer.getvalue().strip().splitlines()
+        result.answer = answers.get(part) or (lines[-1] if lines else "")
+    return result
+
+
+def plan_jobs(days: List[Day], parts: Iterable[int] = (1, 2)) -> List[tuple]:
+    """
+    Розбиває дні на незалежні задачі (day, part).
+    Дні з функціями частин розбиваються по частинах, решта виконуються цілком -
+    якщо при цьому вибрано не всі частини, у stderr виводиться попередження.
+    """
+    parts = tuple(parts)
+    jobs, whole_days = [], []
+    with capture_output():
+        for day in days:
+            try:
+                module_parts = find_part_functions(load_module(day))
+            except BaseException:
+                module_parts = {}  # Помилку імпорту покаже сам запуск
+            if module_parts:
+                jobs.extend((day, p) for p in parts if p in module_parts)
+            else:
+                jobs.append((day, None))
+                whole_days.append(day)
+
+    if whole_days and set(parts) != set(PART_NAMES):
+        names = ", ".join(f"{day.year} day {day.day}" for day in whole_days)
+        print(f"Warning: no part functions, running whole day (--part ignored): {names}", file=sys.stderr)
+    return jobs
+
+
+def _init_worker():
+    """Ініціалізатор процесу: скрипти відкривають файли відносно кореня репозиторію."""
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+
+def _run_job(job: tuple) -> PartResult:
+    return run_part(*job)
+
+
+def run_jobs(jobs: List[tuple], workers: Optional[int] = None, job_func: Callable = _run_job) -> list:
+    """
+    Виконує задачі паралельно у ProcessPoolExecutor (workers=1 - послідовно в поточному процесі).
+    Загальний час обмежується найповільнішою задачею, а не сумою всіх.
+    job_func має бути функцією рівня модуля, щоб її можна було передати в інший процес.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        _init_worker()
+        results = [job_func(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(job_func, job) for job in jobs]
+            results = [f.result() for f in as_completed(futures)]
+    return sorted(results, key=lambda r: (r.year, r.day, r.part or 0))
+
+
+def format_result(r: PartResult) -> str:
+    part = "*" if r.part is None else str(r.part)
+    answer = f"ERROR {r.error}" if r.error else r.answer
+    return f"{r.year} day {r.day:>2} part {part}  wall {r.wall:9.4f}s  cpu {r.cpu:9.4f}s  {answer}"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Запуск розв'язків Advent of Code")
+    parser.add_argument("-y", "--year", type=int, action="append", help="рік (можна кілька)")
+    parser.add_argument("-d", "--day", type=int, action="append", help="день (можна кілька)")
+    parser.add_argument("-p", "--part", type=int, action="append", choices=(1, 2), help="частина")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="кількість процесів (за замовчуванням усі ядра)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    _init_worker()
+
+    days = discover(args.year, args.day)
+    if not days:
+        print("No solutions found.", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = run_jobs(plan_jobs(days, args.part or (1, 2)), args.jobs)
+    total = time.perf_counter() - start
+
+    for r in results:
+        print(format_result(r))
+    cpu_note = "incl. child processes" if resource is not None else "child processes not counted"
+    print(f"Total: {len(results)} runs, wall {total:.3f}s, cpu {sum(r.cpu for r in results):.3f}s ({cpu_note})")
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from aoc import runner
+from aoc.runner import ROOT, Day, discover, parse_answers, plan_jobs, run_jobs, run_part
+
+# Скрипт без функцій частин, що витрачає CPU час у дочірньому процесі
+CHILD_SCRIPT = """
+import subprocess
+import sys
+
+def main():
+    subprocess.run([sys.executable, "-c", "sum(range(3 * 10**7))"], check=True)
+    print("Part 1: 1")
+"""
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_parse_answers_formats(self):
+        text = "\n".join([
+            "Part one: 5199",
+            "Task 2: 7\t(time: 0.001s)",
+            "noise",
+        ])
+        self.assertEqual(parse_answers(text), {1: "5199", 2: "7"})
+        self.assertEqual(parse_answers("Part 1 result: 1200"), {1: "1200"})
+        self.assertEqual(parse_answers("Part 2:,24,48"), {2: "24,48"})
+        self.assertEqual(parse_answers("Task 1 Time: 0.2s"), {})
+
+    def test_discover_filters_years_and_days(self):
+        days = discover([2024], [1, 6])
+        self.assertEqual([(d.year, d.day) for d in days], [(2024, 1), (2024, 6)])
+        self.assertTrue(all(d.path.is_relative_to(ROOT) for d in days))
+
+    def test_run_jobs_with_part_functions(self):
+        jobs = plan_jobs(discover([2024], [1]))
+        self.assertEqual([(day.day, part) for day, part in jobs], [(1, 1), (1, 2)])
+
+        results = run_jobs(jobs, workers=1)
+        self.assertEqual([r.answer for r in results], ["1941353", "22539317"])
+        self.assertTrue(all(r.error is None for r in results))
+
+    def test_plan_jobs_warns_when_part_cannot_be_selected(self):
+        days = discover([2024], [1, 6])  # День 6 має лише main()
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            jobs = plan_jobs(days, (2,))
+        self.assertEqual([(day.day, part) for day, part in jobs], [(1, 2), (6, None)])
+        self.assertIn("2024 day 6", stderr.getvalue())
+
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            plan_jobs(days)
+        self.assertEqual(stderr.getvalue(), "")
+
+    @unittest.skipIf(runner.resource is None, "resource недоступний на цій платформі")
+    def test_cpu_time_includes_child_processes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "script.py"
+            path.write_text(CHILD_SCRIPT)
+            result = run_part(Day(1999, 1, path), None)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.answer, "1: 1")
+        self.assertGreater(result.cpu, 0.5 * result.wall)
+
+
+if __name__ == "__main__":
+    unittest.main()
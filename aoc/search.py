@@ -0,0 +1,310 @@
+"""
+Пошук найкоротших шляхів: BFS, 0-1 BFS, Дейкстра з лінивою купою, черга з корзин (Дейал) і A*.
+
+Граф задається одним із двох способів:
+    - функцією сусідів: neighbours(state) -> сусіди (bfs) або пари (сусід, вага) (решта алгоритмів);
+    - щільним списком суміжності: graph[u] - ті самі сусіди, а стани - числа 0..len(graph)-1.
+Для станів-чисел 0..size-1 (плоскі індекси aoc.grid тощо) параметр size вмикає плоский
+список відстаней замість словника.
+
+Усі функції повертають SearchResult: відстані, знайдені цілі, лічильники роботи черги (SearchStats)
+і, якщо predecessors=True, усіх попередників на найкоротших шляхах. З відстеженням попередників
+пошук не зупиняється на першій цілі, а добирає всі цілі з тією ж вартістю.
+
+Приклад:
+    result = dijkstra([start], lambda s: graph[s], is_goal=lambda s: s == end)
+    result.cost, result.stats.pops
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+INF = float("inf")
+
+
+@dataclass
+class SearchStats:
+    """Лічильники операцій з чергою - для порівняння стратегій на тих самих даних."""
+    pops: int = 0
+    pushes: int = 0
+    stale_pops: int = 0  # Записи, що застаріли до вилучення (лінива купа, 0-1 BFS, корзини)
+
+
+class Distances(dict):
+    """Словник відстаней: для ще не досягнутого стану повертає INF, не додаючи його."""
+    __slots__ = ()
+
+    def __missing__(self, state):
+        return INF
+
+
+@dataclass
+class SearchResult:
+    distance: object  # Distances або список довжини size
+    goals: List[Hashable] = field(default_factory=list)
+    stats: SearchStats = field(default_factory=SearchStats)
+    predecessors: Optional[Dict[Hashable, List[Hashable]]] = None
+
+    @property
+    def cost(self):
+        """Вартість шляху до знайденої цілі або None, якщо цілі не досягнуто."""
+        return self.distance[self.goals[0]] if self.goals else None
+
+    def path(self, goal=None) -> List[Hashable]:
+        """Один найкоротший шлях від старту до goal (за замовчуванням - до першої цілі)."""
+        if self.predecessors is None:
+            raise ValueError("Пошук запущено без predecessors=True")
+        state = self.goals[0] if goal is None else goal
+        path = [state]
+        seen = {state}
+        # Перші попередники утворюють дерево; повтор можливий лише через ребро ваги 0 назад у старт
+        while self.predecessors.get(state) and self.predecessors[state][0] not in seen:
+            state = self.predecessors[state][0]
+            seen.add(state)
+            path.append(state)
+        path.reverse()
+        return path
+
+    def states_on_paths(self, goals=None) -> Set[Hashable]:
+        """Усі стани, що лежать хоча б на одному найкоротшому шляху до goals (за замовчуванням - до всіх цілей)."""
+        if self.predecessors is None:
+            raise ValueError("Пошук запущено без predecessors=True")
+        stack = list(self.goals if goals is None else goals)
+        seen = set(stack)
+        while stack:
+            for previous in self.predecessors.get(stack.pop(), ()):
+                if previous not in seen:
+                    seen.add(previous)
+                    stack.append(previous)
+        return seen
+
+
+def _prepare(graph, size):
+    """Повертає (функція сусідів, порожня таблиця відстаней) для функції або щільного списку."""
+    if callable(graph):
+        neighbours = graph
+    else:
+        neighbours = graph.__getitem__
+        if size is None:
+            size = len(graph)
+    return neighbours, ([INF] * size if size is not None else Distances())
+
+
+# Складність: O(V + E)
+def bfs(starts: Iterable, graph, is_goal: Optional[Callable] = None, size: Optional[int] = None,
+        predecessors: bool = False) -> SearchResult:
+    """Пошук у ширину для графа без ваг: graph дає лише сусідів."""
+    neighbours, distance = _prepare(graph, size)
+    parents = {} if predecessors else None
+    queue = deque()
+    pushes = pops = 0
+    for start in starts:
+        if distance[start]:
+            distance[start] = 0
+            queue.append(start)
+            pushes += 1
+            if parents is not None:
+                parents[start] = []
+
+    goals, goal_cost = [], INF
+    while queue:
+        state = queue.popleft()
+        pops += 1
+        cost = distance[state]
+        if cost > goal_cost:
+            break
+        if is_goal is not None and is_goal(state):
+            goals.append(state)
+            if parents is None:
+                break
+            goal_cost = cost
+        if cost >= goal_cost:  # Усі ребра ваги 1: сусіди стану з вартістю цілі вже дорожчі за неї
+            continue
+
+        next_cost = cost + 1
+        for neighbour in neighbours(state):
+            known = distance[neighbour]
+            if next_cost < known:
+                distance[neighbour] = next_cost
+                queue.append(neighbour)
+                pushes += 1
+                if parents is not None:
+                    parents[neighbour] = [state]
+            elif next_cost == known and parents is not None:
+                parents[neighbour].append(state)
+
+    return SearchResult(distance, goals, SearchStats(pops, pushes, 0), parents)
+
+
+# Складність: O(V + E)
+def bfs01(starts: Iterable, graph, is_goal: Optional[Callable] = None, size: Optional[int] = None,
+          predecessors: bool = False) -> SearchResult:
+    """0-1 BFS: ребра ваги 0 додаються в початок дека, ваги 1 - у кінець."""
+    neighbours, distance = _prepare(graph, size)
+    parents = {} if predecessors else None
+    queue = deque()
+    pushes = pops = stale = 0
+    for start in starts:
+        if distance[start]:
+            distance[start] = 0
+            queue.append((0, start))
+            pushes += 1
+            if parents is not None:
+                parents[start] = []
+
+    goals, goal_cost = [], INF
+    while queue:
+        cost, state = queue.popleft()
+        pops += 1
+        if cost > distance[state]:
+            stale += 1
+            continue
+        if cost > goal_cost:
+            break
+        if is_goal is not None and is_goal(state):
+            goals.append(state)
+            if parents is None:
+                break
+            goal_cost = cost
+        for neighbour, weight in neighbours(state):
+            next_cost = cost + weight
+            if next_cost > goal_cost:  # Стани з вартістю цілі розкриваються: ребро ваги 0 може вести в ціль
+                continue
+            known = distance[neighbour]
+            if next_cost < known:
+                distance[neighbour] = next_cost
+                if weight:
+                    queue.append((next_cost, neighbour))
+                else:
+                    queue.appendleft((next_cost, neighbour))
+                pushes += 1
+                if parents is not None:
+                    parents[neighbour] = [state]
+            elif next_cost == known and parents is not None:
+                parents[neighbour].append(state)
+
+    return SearchResult(distance, goals, SearchStats(pops, pushes, stale), parents)
+
+
+def _best_first(starts, graph, is_goal, size, predecessors, heuristic):
+    """Дейкстра / A* з лінивою купою: замість decrease-key додається новий запис, а застарілі пропускаються."""
+    neighbours, distance = _prepare(graph, size)
+    parents = {} if predecessors else None
+    heap = []
+    pushes = pops = stale = 0
+    for start in starts:
+        if distance[start]:
+            distance[start] = 0
+            # При рівних пріоритетах першим іде стан, ближчий до цілі (менша евристика),
+            # далі - раніший запис, тому самі стани ніколи не порівнюються
+            estimate = heuristic(start) if heuristic else 0
+            heap.append((estimate, estimate, pushes, 0, start))
+            pushes += 1
+            if parents is not None:
+                parents[start] = []
+    heapq.heapify(heap)
+
+    goals, goal_cost = [], INF
+    while heap:
+        priority, _, _, cost, state = heapq.heappop(heap)
+        pops += 1
+        if cost > distance[state]:
+            stale += 1
+            continue
+        if priority > goal_cost:  # Для A* - оцінка повного шляху, а не пройдена вартість
+            break
+        if is_goal is not None and is_goal(state):
+            goals.append(state)
+            if parents is None:
+                break
+            goal_cost = cost
+        for neighbour, weight in neighbours(state):
+            next_cost = cost + weight
+            if next_cost > goal_cost:  # Стани з вартістю цілі розкриваються: ребро ваги 0 може вести в ціль
+                continue
+            known = distance[neighbour]
+            if next_cost < known:
+                distance[neighbour] = next_cost
+                estimate = heuristic(neighbour) if heuristic else 0
+                heapq.heappush(heap, (next_cost + estimate, estimate, pushes, next_cost, neighbour))
+                pushes += 1
+                if parents is not None:
+                    parents[neighbour] = [state]
+            elif next_cost == known and parents is not None:
+                parents[neighbour].append(state)
+
+    return SearchResult(distance, goals, SearchStats(pops, pushes, stale), parents)
+
+
+# Складність: O((V + E) log V)
+def dijkstra(starts: Iterable, graph, is_goal: Optional[Callable] = None, size: Optional[int] = None,
+             predecessors: bool = False) -> SearchResult:
+    """Дейкстра для невід'ємних ваг."""
+    return _best_first(starts, graph, is_goal, size, predecessors, None)
+
+
+# Складність: O((V + E) log V) у найгіршому випадку, на практиці менше
+def astar(starts: Iterable, graph, heuristic: Callable, is_goal: Optional[Callable] = None,
+          size: Optional[int] = None, predecessors: bool = False) -> SearchResult:
+    """A*: пріоритет = вартість + heuristic(стан). Евристика має бути монотонною (не переоцінювати ребра)."""
+    return _best_first(starts, graph, is_goal, size, predecessors, heuristic)
+
+
+# Складність: O(V + E + C * W), де C - вартість найдальшого стану, W - max_weight
+def dial(starts: Iterable, graph, max_weight: int, is_goal: Optional[Callable] = None,
+         size: Optional[int] = None, predecessors: bool = False) -> SearchResult:
+    """
+    Алгоритм Дейала: Дейкстра для цілих ваг 0..max_weight з кільцевою чергою з max_weight + 1 корзин.
+    Вилучення мінімуму - O(1) амортизовано.
+    """
+    neighbours, distance = _prepare(graph, size)
+    parents = {} if predecessors else None
+    bucket_count = max_weight + 1  # Усі записи в черзі лежать у вікні [cost, cost + max_weight]
+    buckets = [[] for _ in range(bucket_count)]
+    pushes = pops = stale = 0
+    for start in starts:
+        if distance[start]:
+            distance[start] = 0
+            buckets[0].append(start)
+            pushes += 1
+            if parents is not None:
+                parents[start] = []
+
+    goals, goal_cost = [], INF
+    cost, pending = 0, pushes
+    while pending:
+        bucket = buckets[cost % bucket_count]
+        if not bucket:
+            cost += 1
+            continue
+        state = bucket.pop()
+        pending -= 1
+        pops += 1
+        if distance[state] < cost:
+            stale += 1
+            continue
+        if cost > goal_cost:
+            break
+        if is_goal is not None and is_goal(state):
+            goals.append(state)
+            if parents is None:
+                break
+            goal_cost = cost
+        for neighbour, weight in neighbours(state):
+            next_cost = cost + weight
+            if next_cost > goal_cost:  # Стани з вартістю цілі розкриваються: ребро ваги 0 може вести в ціль
+                continue
+            known = distance[neighbour]
+            if next_cost < known:
+                distance[neighbour] = next_cost
+                buckets[next_cost % bucket_count].append(neighbour)
+                pending += 1
+                pushes += 1
+                if parents is not None:
+                    parents[neighbour] = [state]
+            elif next_cost == known and parents is not None:
+                parents[neighbour].append(state)
+
+    return SearchResult(distance, goals, SearchStats(pops, pushes, stale), parents)
@@ -0,0 +1,128 @@
+import unittest
+
+from aoc.grid import Grid
+from aoc.search import INF, astar, bfs, bfs01, dial, dijkstra
+
+# Зважений граф: 0 -> 1 -> 3 і 0 -> 2 -> 3 мають однакову вартість 4, 4 недосяжна
+WEIGHTED = [[(1, 1), (2, 3)], [(3, 3)], [(3, 1)], [], [(0, 1)]]
+# Ребро ваги 0 з 1 назад у старт 0
+ZERO_CYCLE = [[(1, 0)], [(0, 0), (2, 1)], []]
+# Два шляхи вартості 1 до цілі 2: напряму і через 1 з ребром ваги 0 в ціль
+ZERO_INTO_GOAL = [[(2, 1), (1, 1)], [(2, 0)], []]
+MAZE = ["S..#", ".#..", "...E"]
+
+
+def open_grid_neighbours(grid):
+    offsets = grid.offsets4
+
+    def neighbours(i):
+        return [(i + o, 1) for o in offsets if grid[i + o]]
+
+    return neighbours
+
+
+class TestSearch(unittest.TestCase):
+
+    weighted_searches = {
+        "dijkstra": dijkstra,
+        "dial": lambda starts, graph, **kwargs: dial(starts, graph, 3, **kwargs),
+        "astar": lambda starts, graph, **kwargs: astar(starts, graph, lambda s: 0, **kwargs),
+    }
+
+    def test_weighted_searches_agree(self):
+        for name, search in self.weighted_searches.items():
+            with self.subTest(search=name):
+                result = search([0], WEIGHTED, is_goal=lambda s: s == 3, predecessors=True)
+                self.assertEqual(result.cost, 4)
+                self.assertEqual(result.distance[4], INF)
+                self.assertEqual(result.states_on_paths(), {0, 1, 2, 3})
+                self.assertEqual(result.path()[0], 0)
+                self.assertEqual(result.path()[-1], 3)
+
+    def test_zero_weight_edge_back_to_start_with_predecessors(self):
+        searches = dict(self.weighted_searches, bfs01=bfs01)
+        for name, search in searches.items():
+            with self.subTest(search=name):
+                result = search([0], ZERO_CYCLE, is_goal=lambda s: s == 2, predecessors=True)
+                self.assertEqual(result.cost, 1)
+                self.assertEqual(result.path(), [0, 1, 2])
+                self.assertEqual(result.states_on_paths(), {0, 1, 2})
+
+    def test_zero_weight_edge_into_goal_from_state_with_goal_cost(self):
+        searches = dict(self.weighted_searches, bfs01=bfs01)
+        for name, search in searches.items():
+            with self.subTest(search=name):
+                result = search([0], ZERO_INTO_GOAL, is_goal=lambda s: s == 2, predecessors=True)
+                self.assertEqual(result.cost, 1)
+                self.assertEqual(result.states_on_paths(), {0, 1, 2})
+
+    def test_full_search_without_goal_and_stats(self):
+        result = dijkstra([0], WEIGHTED)
+        self.assertEqual(result.goals, [])
+        self.assertIsNone(result.cost)
+        self.assertEqual(result.distance[:4], [0, 1, 3, 4])
+        stats = result.stats
+        self.assertEqual(stats.pushes, 4)
+        self.assertEqual(stats.pops, stats.pushes)
+        self.assertEqual(stats.stale_pops, 0)
+
+    def test_stale_pops_are_counted(self):
+        # 0 -> 2 напряму дорожче, ніж через 1: запис (5, 2) застаріває в купі
+        result = dijkstra([0], [[(1, 1), (2, 5)], [(2, 1)], []])
+        self.assertEqual(result.distance, [0, 1, 2])
+        self.assertEqual(result.stats.stale_pops, 1)
+
+    def test_bfs_on_grid_with_callable_neighbours(self):
+        grid = Grid.from_lines(MAZE)
+        start, end = grid.find("S"), grid.find("E")
+        offsets = grid.offsets4
+
+        def neighbours(i):
+            return [i + o for o in offsets if grid[i + o] not in (ord("#"), 0)]
+
+        result = bfs([start], neighbours, is_goal=lambda s: s == end, size=len(grid.cells), predecessors=True)
+        self.assertEqual(result.cost, 5)
+        self.assertEqual(len(result.path()), 6)
+        # Усі шляхи довжини 5 (верхнім рядом з обома обходами та нижнім рядом) - це всі клітинки, крім стін
+        self.assertEqual(len(result.states_on_paths()), 10)
+
+    def test_bfs01_matches_dijkstra(self):
+        graph = [[(1, 0), (2, 1)], [(2, 0), (3, 1)], [(3, 1)], []]
+        self.assertEqual(bfs01([0], graph).distance, [0, 0, 0, 1])
+        self.assertEqual(dijkstra([0], graph).distance, [0, 0, 0, 1])
+
+    def test_astar_with_manhattan_heuristic_pops_less(self):
+        size = 30
+        grid = Grid.from_lines(["." * size] * size)
+        start, end = grid.index(0, 0), grid.index(size - 1, size - 1)
+        neighbours = open_grid_neighbours(grid)
+
+        def heuristic(i):
+            r, c = grid.coords(i)
+            return (size - 1 - r) + (size - 1 - c)
+
+        plain = dijkstra([start], neighbours, is_goal=lambda s: s == end)
+        guided = astar([start], neighbours, heuristic, is_goal=lambda s: s == end)
+        self.assertEqual(plain.cost, 2 * (size - 1))
+        self.assertEqual(guided.cost, plain.cost)
+        self.assertLess(guided.stats.pops, plain.stats.pops)
+
+    def test_astar_stops_once_goal_cost_is_settled(self):
+        # Ціль у кутку відкритої сітки: після неї в купі лишаються лише стани з оцінкою більшою за вартість
+        size = 10
+        grid = Grid.from_lines(["." * size] * size)
+        start, end = grid.index(0, 0), grid.index(0, size - 1)
+        neighbours = open_grid_neighbours(grid)
+
+        def heuristic(i):
+            r, c = grid.coords(i)
+            return r + (size - 1 - c)
+
+        result = astar([start], neighbours, heuristic, is_goal=lambda s: s == end, predecessors=True)
+        self.assertEqual(result.cost, size - 1)
+        self.assertEqual(result.goals, [end])
+        self.assertEqual(result.stats.pops, size + 1)  # Верхній рядок і одне вилучення, що зупиняє пошук
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Система неперетинних множин (union-find) і інкрементальна зв'язність клітинок сітки.
+
+DisjointSet працює з числами 0..count-1 (наприклад, плоскими індексами aoc.grid).
+GridConnectivity поверх неї "вмикає" клітинки по одній і одразу з'єднує їх з увімкненими
+сусідами - це зручно для офлайн-задач, де клітинки зникають (стіни падають, вода заливає):
+події обробляються у зворотному порядку як додавання.
+
+Приклад:
+    connectivity = GridConnectivity(grid)
+    for i in free_cells:
+        connectivity.activate(i)
+    connectivity.connected(start, end)
+"""
+
+from typing import List, Optional, Sequence
+
+
+class DisjointSet:
+    """Union-find з об'єднанням за розміром і стисненням шляху (поділом навпіл)."""
+
+    __slots__ = ("parent", "size", "components")
+
+    def __init__(self, count: int):
+        self.parent: List[int] = list(range(count))
+        self.size: List[int] = [1] * count
+        self.components = count
+
+    # Складність: O(α(n)) амортизовано
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Об'єднує множини a і b. Повертає False, якщо вони вже були спільні."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+
+class GridConnectivity:
+    """
+    Зв'язність увімкнених клітинок сітки aoc.grid. Сусідство задається зміщеннями
+    (за замовчуванням offsets4); рамка-сторож ніколи не вмикається, тому перевірки меж не потрібні.
+    """
+
+    __slots__ = ("sets", "active", "offsets")
+
+    def __init__(self, grid, offsets: Optional[Sequence[int]] = None):
+        self.sets = DisjointSet(len(grid.cells))
+        self.active = bytearray(len(grid.cells))
+        self.offsets = grid.offsets4 if offsets is None else offsets
+
+    # Складність: O(k * α(n)), де k - кількість сусідів
+    def activate(self, i: int) -> None:
+        """Вмикає клітинку i і з'єднує її з усіма увімкненими сусідами."""
+        if self.active[i]:
+            return
+        self.active[i] = 1
+        for offset in self.offsets:
+            if self.active[i + offset]:
+                self.sets.union(i, i + offset)
+
+    def connected(self, a: int, b: int) -> bool:
+        """Чи з'єднані дві увімкнені клітинки шляхом з увімкнених клітинок."""
+        return bool(self.active[a] and self.active[b]) and self.sets.connected(a, b)
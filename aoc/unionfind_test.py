@@ -0,0 +1,34 @@
+import unittest
+
+from aoc.grid import Grid
+from aoc.unionfind import DisjointSet, GridConnectivity
+
+
+class TestUnionFind(unittest.TestCase):
+
+    def test_disjoint_set_union_and_sizes(self):
+        sets = DisjointSet(5)
+        self.assertTrue(sets.union(0, 1))
+        self.assertTrue(sets.union(3, 4))
+        self.assertTrue(sets.union(1, 4))
+        self.assertFalse(sets.union(0, 3))
+        self.assertTrue(sets.connected(0, 3))
+        self.assertFalse(sets.connected(0, 2))
+        self.assertEqual(sets.component_size(4), 4)
+        self.assertEqual(sets.components, 2)
+
+    def test_grid_connectivity_activates_cells_incrementally(self):
+        grid = Grid.from_lines(["...", "...", "..."])
+        connectivity = GridConnectivity(grid)
+        corner, opposite = grid.index(0, 0), grid.index(2, 2)
+        for r, c in [(0, 0), (0, 1), (0, 2), (2, 2)]:
+            connectivity.activate(grid.index(r, c))
+        self.assertFalse(connectivity.connected(corner, opposite))
+        connectivity.activate(grid.index(1, 2))
+        self.assertTrue(connectivity.connected(corner, opposite))
+        # Не увімкнена клітинка ні з чим не з'єднана
+        self.assertFalse(connectivity.connected(corner, grid.index(1, 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()